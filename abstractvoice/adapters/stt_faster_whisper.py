@@ -71,6 +71,8 @@ class FasterWhisperAdapter(STTAdapter):
         compute_type: str = "int8",
         *,
         allow_downloads: bool = True,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
     ):
         """Initialize Faster-Whisper STT adapter.
         
@@ -79,6 +81,8 @@ class FasterWhisperAdapter(STTAdapter):
             device: Device to run on ('cpu', 'cuda', 'auto')
             compute_type: Computation type ('int8', 'float16', 'float32')
                          int8 provides 60% memory reduction with minimal accuracy loss
+            cpu_threads: CTranslate2 CPU threads (0 = backend default)
+            num_workers: CTranslate2 workers for concurrent transcriptions
         """
         self.engine_id = self.ENGINE_ID
         self.provider = self.ENGINE_ID
@@ -91,6 +95,8 @@ class FasterWhisperAdapter(STTAdapter):
         self._compute_type = compute_type
         self._current_language = None
         self._allow_downloads = bool(allow_downloads)
+        self._cpu_threads = max(0, int(cpu_threads or 0))
+        self._num_workers = max(1, int(num_workers or 1))
         
         # Try to import faster-whisper
         try:
@@ -178,6 +184,8 @@ class FasterWhisperAdapter(STTAdapter):
                         model_size,
                         device=device,
                         compute_type=compute_type,
+                        cpu_threads=self._cpu_threads,
+                        num_workers=self._num_workers,
                         download_root=None,  # Use default cache (~/.cache/huggingface)
                         local_files_only=bool(not self._allow_downloads),
                         use_auth_token=False if not self._allow_downloads else None,
@@ -395,6 +403,51 @@ class FasterWhisperAdapter(STTAdapter):
                 condition_on_previous_text=bool(condition_on_previous_text),
             )
     
+    def transcribe_candidates(
+        self,
+        audio_array: np.ndarray,
+        sample_rate: int,
+        *,
+        temperatures: tuple[float, ...] = (0.0, 0.2, 0.4),
+        language: Optional[str] = None,
+    ) -> list[str]:
+        """Transcribe one clip several times (one pass per temperature).
+
+        Used for consensus transcripts (e.g. cloned-voice reference text). The
+        clip is converted/resampled once and handed to faster-whisper as an
+        array, so no pass re-decodes a file. Decoding settings match the
+        file-based `transcribe()` (beam search + VAD).
+        """
+        if not self.is_available():
+            raise RuntimeError(
+                "Faster-Whisper is not available. Install with: pip install faster-whisper>=0.10.0"
+            )
+        x = np.asarray(audio_array, dtype=np.float32).reshape(-1)
+        if int(sample_rate) != 16000:
+            from ..audio.resample import linear_resample_mono
+
+            x = linear_resample_mono(x, int(sample_rate), 16000)
+
+        out: list[str] = []
+        try:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=RuntimeWarning, message=r".*encountered in matmul.*")
+                for temperature in temperatures:
+                    segments, _info = self._model.transcribe(
+                        x,
+                        language=language,
+                        beam_size=5,
+                        best_of=5,
+                        temperature=float(temperature),
+                        vad_filter=True,
+                        vad_parameters=dict(min_silence_duration_ms=500),
+                    )
+                    out.append(" ".join([segment.text.strip() for segment in segments]).strip())
+        except Exception as e:
+            logger.error(f"❌ Faster-Whisper transcription failed: {e}")
+            raise RuntimeError(f"Transcription failed: {e}") from e
+        return out
+
     def _array_to_wav_bytes(self, audio_array: np.ndarray, sample_rate: int) -> bytes:
         """Convert numpy array to WAV bytes.
         
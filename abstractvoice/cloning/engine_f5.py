@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import contextlib
 import gc
+import importlib.util
+import io
 import os
 import sys
 import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
@@ -14,16 +18,51 @@ import soundfile as sf
 
 from ..audio.resample import linear_resample_mono
 from ..compute import looks_like_torch_device_error, resolve_torch_runtime
+from ..tts.text_chunking import split_text_batches
 
+# Resolved once on first inference (f5_tts is an optional, heavy import).
+_INFER_BATCH_PROCESS = None
 
-def _load_as_mono_float(path: Path) -> Tuple[np.ndarray, int]:
-    audio, sr = sf.read(str(path), always_2d=True, dtype="float32")
-    # downmix
-    mono = np.mean(audio, axis=1).astype(np.float32)
-    return mono, int(sr)
 
+def _env_bool(key: str, default: bool = False) -> bool:
+    raw = os.environ.get(str(key), None)
+    if raw is None:
+        return bool(default)
+    val = str(raw).strip().lower()
+    if not val:
+        return bool(default)
+    return val in {"1", "true", "yes", "y", "on"}
 
-def _load_as_torch_channels_first(path: Path):
+
+def _get_infer_batch_process():
+    global _INFER_BATCH_PROCESS
+    if _INFER_BATCH_PROCESS is None:
+        from f5_tts.infer.utils_infer import infer_batch_process
+
+        _INFER_BATCH_PROCESS = infer_batch_process
+    return _INFER_BATCH_PROCESS
+
+
+def _load_as_mono_float(path: str | Path) -> Tuple[np.ndarray, int]:
+    with sf.SoundFile(os.fspath(path)) as f:
+        n = int(f.frames)
+        ch = int(f.channels)
+        sr = int(f.samplerate)
+        mono = np.empty((n,), dtype=np.float32)
+        if ch == 1:
+            got = f.read(n, dtype="float32", out=mono)
+        else:
+            # Downmix into the preallocated mono buffer. An explicit float32
+            # accumulator avoids the float64 intermediate `np.mean` would use.
+            scratch = np.empty((n, ch), dtype=np.float32)
+            got = f.read(n, dtype="float32", out=scratch)
+            np.sum(scratch, axis=1, dtype=np.float32, out=mono)
+            mono *= np.float32(1.0 / ch)
+    # Some containers report an approximate frame count; trim to what was decoded.
+    return mono[: len(got)], sr
+
+
+def _load_as_torch_channels_first(path: str | Path, *, device: Optional[str] = None):
     """Load audio as a float32 torch Tensor shaped (channels, frames).
 
     We prefer `soundfile` over `torchaudio.load()` because torchaudio's I/O backend
@@ -35,10 +74,89 @@ def _load_as_torch_channels_first(path: Path):
     except Exception as e:  # pragma: no cover - torch is required by f5_tts runtime anyway
         raise RuntimeError("torch is required for F5 cloning inference") from e
 
-    audio, sr = sf.read(str(path), always_2d=True, dtype="float32")
+    audio, sr = sf.read(os.fspath(path), always_2d=True, dtype="float32")
     # soundfile: (frames, channels) -> torch: (channels, frames)
-    arr = np.ascontiguousarray(audio.T, dtype=np.float32)
-    return torch.from_numpy(arr), int(sr)
+    if audio.shape[1] == 1:
+        # Mono (our prepared reference always is): the column is contiguous, so
+        # this is a view over the decoded buffer rather than a transpose copy.
+        t = torch.from_numpy(audio[:, 0]).unsqueeze(0)
+    else:
+        t = torch.from_numpy(np.ascontiguousarray(audio.T))
+    if device is not None:
+        t = t.to(device, non_blocking=True)
+    return t, int(sr)
+
+
+def _encode_wav_pcm16(audio, sample_rate: int) -> bytes:
+    """Encode a mono float waveform as PCM16 WAV bytes.
+
+    The waveform is handed to libsndfile as a contiguous float32 array so
+    soundfile does not make its own conversion copy, and the encoder streams
+    straight into the buffer (whose `getvalue()` can hand the storage over
+    without a second payload copy).
+    """
+    if hasattr(audio, "detach"):
+        audio = audio.detach().cpu().numpy()
+    audio = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+    buf = io.BytesIO()
+    with sf.SoundFile(
+        buf,
+        mode="w",
+        samplerate=int(sample_rate),
+        channels=1,
+        format="WAV",
+        subtype="PCM_16",
+    ) as out:
+        out.write(audio)
+    return buf.getvalue()
+
+
+def _encode_wav_pcm16_stream(chunks) -> bytes:
+    """Encode `(audio_chunk, sample_rate)` pairs as one PCM16 WAV, chunk by chunk.
+
+    The writer is opened on the first chunk (the sample rate is only known
+    then), so the full waveform is never concatenated before encoding.
+    """
+    buf = io.BytesIO()
+    out = None
+    try:
+        for chunk, sample_rate in chunks:
+            if out is None:
+                out = sf.SoundFile(
+                    buf,
+                    mode="w",
+                    samplerate=int(sample_rate),
+                    channels=1,
+                    format="WAV",
+                    subtype="PCM_16",
+                )
+            if hasattr(chunk, "detach"):
+                chunk = chunk.detach().cpu().numpy()
+            out.write(np.ascontiguousarray(chunk, dtype=np.float32).reshape(-1))
+    finally:
+        if out is not None:
+            out.close()
+    if out is None:
+        raise RuntimeError("F5 inference produced no audio")
+    return buf.getvalue()
+
+
+def _iter_in_inference_mode(gen):
+    """Advance `gen` one step at a time under `torch.inference_mode()`.
+
+    The mode is thread-local, so it must not stay active while the generator is
+    suspended at a `yield` (the consumer's own torch code would run under it).
+    """
+    import torch
+
+    it = iter(gen)
+    while True:
+        with torch.inference_mode():
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+        yield item
 
 
 @dataclass(frozen=True)
@@ -72,6 +190,7 @@ class F5TTSVoiceCloningEngine:
         vocoder_name: str = "vocos",
         target_rms: float = 0.1,
         cross_fade_duration: float = 0.15,
+        fast_cuda_math: bool | None = None,
     ):
         if sys.version_info < (3, 10):
             raise RuntimeError(
@@ -93,6 +212,11 @@ class F5TTSVoiceCloningEngine:
         self._target_rms = float(target_rms)
         self._cross_fade_duration = float(cross_fade_duration)
         self._quality_preset = "standard"
+        # Opt-in only: TF32 / cuDNN autotune are process-wide torch settings that
+        # would also change numerics for the host application.
+        if fast_cuda_math is None:
+            fast_cuda_math = _env_bool("ABSTRACTVOICE_F5_FAST_CUDA_MATH")
+        self._fast_cuda_math = bool(fast_cuda_math)
 
         # Lazy heavy objects (loaded on first inference).
         self._f5_model = None
@@ -100,6 +224,10 @@ class F5TTSVoiceCloningEngine:
         self._f5_device = None
         self._used_fallback = False
         self._fallback_reason: str | None = None
+        # Last complete artifact scan (see _scan_artifact_paths).
+        self._artifact_paths: dict[str, str] | None = None
+        # Reused across calls for multi-reference voices (see _prepare_reference_wav).
+        self._ref_executor: ThreadPoolExecutor | None = None
 
     def unload(self) -> None:
         """Best-effort release of loaded model/vocoder to free memory."""
@@ -108,6 +236,9 @@ class F5TTSVoiceCloningEngine:
         self._f5_device = None
         # STT adapter can also hold memory; drop references.
         self._stt = None
+        if self._ref_executor is not None:
+            self._ref_executor.shutdown(wait=False)
+            self._ref_executor = None
         try:
             gc.collect()
         except Exception:
@@ -186,17 +317,35 @@ class F5TTSVoiceCloningEngine:
         if self._stt is None:
             from ..adapters.stt_faster_whisper import FasterWhisperAdapter
 
-            self._stt = FasterWhisperAdapter(
-                model_size=self._whisper_model,
-                device="cpu",
-                compute_type="int8",
-            )
+            if str(self._f5_device or "").startswith("cuda"):
+                self._stt = FasterWhisperAdapter(
+                    model_size=self._whisper_model,
+                    device="cuda",
+                    compute_type="int8_float16",
+                )
+            else:
+                # Leave half the cores to the F5 sampler running alongside.
+                self._stt = FasterWhisperAdapter(
+                    model_size=self._whisper_model,
+                    device="cpu",
+                    compute_type="int8",
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                    num_workers=1,
+                )
         return self._stt
 
+    def unload_stt(self) -> None:
+        """Release the reference-transcription STT model (the TTS model stays loaded)."""
+        stt = self._stt
+        self._stt = None
+        if stt is not None:
+            try:
+                stt.unload()
+            except Exception:
+                pass
+
     def _ensure_f5_runtime(self) -> None:
         try:
-            import importlib.util
-
             if importlib.util.find_spec("f5_tts") is None:
                 raise ImportError("f5_tts not installed")
         except Exception as e:
@@ -212,19 +361,56 @@ class F5TTSVoiceCloningEngine:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
+    def _scan_artifact_paths(self, root: Path) -> dict[str, str]:
+        """Classify cached OpenF5 files as plain path strings (no network calls).
+
+        A complete result is remembered and only re-validated with three file
+        checks; incomplete results are never cached so a later download is seen.
+        """
+        cached = self._artifact_paths
+        if cached is not None and all(os.path.isfile(p) for p in cached.values()):
+            return dict(cached)
+
+        yaml_cfg = yml_cfg = ckpt = vocab = any_txt = None
+        for dirpath, _dirnames, filenames in os.walk(str(root)):
+            for name in filenames:
+                lower = name.lower()
+                if lower.endswith(".yaml"):
+                    yaml_cfg = yaml_cfg or os.path.join(dirpath, name)
+                elif lower.endswith(".yml"):
+                    yml_cfg = yml_cfg or os.path.join(dirpath, name)
+                elif lower.endswith(".pt"):
+                    ckpt = ckpt or os.path.join(dirpath, name)
+                elif lower.endswith(".txt"):
+                    if name.startswith("vocab"):
+                        vocab = vocab or os.path.join(dirpath, name)
+                    any_txt = any_txt or os.path.join(dirpath, name)
+
+        found: dict[str, str] = {}
+        if yaml_cfg or yml_cfg:
+            found["cfg"] = str(yaml_cfg or yml_cfg)
+        if ckpt:
+            found["ckpt"] = ckpt
+        if vocab or any_txt:
+            found["vocab"] = str(vocab or any_txt)
+        self._artifact_paths = dict(found) if len(found) == 3 else None
+        return found
+
     def _resolve_openf5_artifacts_local(self) -> OpenF5Artifacts:
         """Resolve artifacts from the local cache directory without any network calls."""
         root = self._artifact_root()
-        cfg = next(iter(root.rglob("*.yaml")), None) or next(iter(root.rglob("*.yml")), None)
-        ckpt = next(iter(root.rglob("*.pt")), None)
-        vocab = next(iter(root.rglob("vocab*.txt")), None) or next(iter(root.rglob("*.txt")), None)
-        if not (cfg and ckpt and vocab):
+        found = self._scan_artifact_paths(root)
+        if len(found) != 3:
             raise RuntimeError(
                 "OpenF5 artifacts are not present locally.\n"
                 "In the REPL run: /cloning_download\n"
                 f"Looked under: {root}"
             )
-        return OpenF5Artifacts(model_cfg=cfg, ckpt_file=ckpt, vocab_file=vocab)
+        return OpenF5Artifacts(
+            model_cfg=Path(found["cfg"]),
+            ckpt_file=Path(found["ckpt"]),
+            vocab_file=Path(found["vocab"]),
+        )
 
     def ensure_openf5_artifacts_downloaded(self) -> OpenF5Artifacts:
         """Explicit prefetch entry point (REPL should call this, not speak())."""
@@ -239,8 +425,6 @@ class F5TTSVoiceCloningEngine:
                 "Install with: pip install huggingface_hub"
             ) from e
 
-        import warnings
-
         with warnings.catch_warnings():
             # huggingface_hub deprecated `local_dir_use_symlinks`; keep prefetch UX clean.
             warnings.filterwarnings(
@@ -256,11 +440,7 @@ class F5TTSVoiceCloningEngine:
 
     def are_openf5_artifacts_available(self) -> bool:
         """Return True if artifacts are already present locally (no downloads)."""
-        root = self._artifact_root()
-        cfg = next(iter(root.rglob("*.yaml")), None) or next(iter(root.rglob("*.yml")), None)
-        ckpt = next(iter(root.rglob("*.pt")), None)
-        vocab = next(iter(root.rglob("vocab*.txt")), None) or next(iter(root.rglob("*.txt")), None)
-        return bool(cfg and ckpt and vocab)
+        return len(self._scan_artifact_paths(self._artifact_root())) == 3
 
     def _resolve_runtime(self):
         return resolve_torch_runtime(
@@ -277,9 +457,6 @@ class F5TTSVoiceCloningEngine:
         ckpt_file: Path,
         vocab_file: Path,
     ):
-        import contextlib
-        import io
-
         from f5_tts.infer.utils_infer import load_model, load_vocoder
 
         if self.debug:
@@ -364,28 +541,62 @@ class F5TTSVoiceCloningEngine:
             )
 
         self._f5_device = device
+        self._configure_torch_backends(device)
+
+    def _configure_torch_backends(self, device: str) -> None:
+        """Opt-in global torch knobs for steady-state CUDA sampling.
+
+        These change process-wide torch state (and float32 matmul precision), so
+        they only apply with `fast_cuda_math=True` or
+        `ABSTRACTVOICE_F5_FAST_CUDA_MATH=1`.
+        """
+        if not self._fast_cuda_math or not str(device).startswith("cuda"):
+            return
+        try:
+            import torch
+
+            # TF32 matmuls on Ampere+ (reduced float32 matmul precision).
+            torch.set_float32_matmul_precision("high")
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            # Diffusion sampling repeats the same shapes every step: let cuDNN
+            # autotune once and reuse the fastest algorithms.
+            torch.backends.cudnn.benchmark = True
+        except Exception:
+            pass
+
+    def _get_ref_executor(self) -> ThreadPoolExecutor:
+        if self._ref_executor is None:
+            self._ref_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="abstractvoice-f5-ref")
+        return self._ref_executor
 
     def _prepare_reference_wav(
         self, reference_paths: Iterable[str | Path], *, target_sr: int = 24000, max_seconds: float = 15.0
-    ) -> Path:
-        paths = [Path(p) for p in reference_paths]
+    ) -> str:
+        paths = [os.fspath(p) for p in reference_paths]
         if not paths:
             raise ValueError("reference_paths must contain at least one path")
 
         # Only support WAV/FLAC/OGG that soundfile can read reliably without extra system deps.
         supported = {".wav", ".flac", ".ogg"}
         for p in paths:
-            if p.suffix.lower() not in supported:
+            suffix = os.path.splitext(p)[1]
+            if suffix.lower() not in supported:
                 raise ValueError(
-                    f"Unsupported reference audio format: {p.suffix}. "
+                    f"Unsupported reference audio format: {suffix}. "
                     f"Provide WAV/FLAC/OGG (got: {p})."
                 )
 
-        merged: List[np.ndarray] = []
-        for p in paths:
+        def _load(p: str) -> np.ndarray:
             mono, sr = _load_as_mono_float(p)
-            mono = linear_resample_mono(mono, sr, target_sr)
-            merged.append(mono)
+            return linear_resample_mono(mono, sr, target_sr)
+
+        # Decoding and NumPy resampling release the GIL, so multi-reference
+        # voices overlap I/O with DSP. A single file skips the pool entirely.
+        if len(paths) == 1:
+            merged: List[np.ndarray] = [_load(paths[0])]
+        else:
+            merged = list(self._get_ref_executor().map(_load, paths))
 
         audio = np.concatenate(merged) if merged else np.zeros((0,), dtype=np.float32)
         max_len = int(target_sr * max_seconds)
@@ -396,7 +607,7 @@ class F5TTSVoiceCloningEngine:
         tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
         tmp.close()
         sf.write(tmp.name, audio, target_sr, subtype="PCM_16")
-        return Path(tmp.name)
+        return tmp.name
 
     def infer_to_wav_bytes(
         self,
@@ -420,17 +631,7 @@ class F5TTSVoiceCloningEngine:
                     "Provide reference_text when cloning, or set it via the voice store."
                 )
 
-            from f5_tts.infer.utils_infer import infer_process, preprocess_ref_audio_text
-            import contextlib
-            import io
-            import warnings
-
-            # f5_tts prints a lot (progress bars, ref_text, batching info).
-            # Keep default UX clean unless debug is enabled.
-            out_buf = io.StringIO()
-            err_buf = io.StringIO()
-            stdout_cm = contextlib.nullcontext() if self.debug else contextlib.redirect_stdout(out_buf)
-            stderr_cm = contextlib.nullcontext() if self.debug else contextlib.redirect_stderr(err_buf)
+            infer_batch_process = _get_infer_batch_process()
 
             with warnings.catch_warnings():
                 # Torchaudio emits noisy deprecation warnings; they don't help users here.
@@ -448,7 +649,6 @@ class F5TTSVoiceCloningEngine:
 
                 # Avoid f5_tts preprocess_ref_audio_text() because it prints loudly.
                 # We already clipped/resampled reference audio in _prepare_reference_wav().
-                ref_audio_path = str(ref_wav)
 
                 # Build gen_text batches with a simple chunker (no prints).
                 gen_text = str(text)
@@ -467,41 +667,40 @@ class F5TTSVoiceCloningEngine:
                 if cur:
                     batches.append(cur)
 
-                from f5_tts.infer.utils_infer import infer_batch_process
-                import numpy as _np
-                audio, sr = _load_as_torch_channels_first(Path(ref_audio_path))
-                # infer_batch_process returns a generator yielding final_wave at the end.
-                final_wave, final_sr, _spec = next(
-                    infer_batch_process(
-                        (audio, sr),
-                        ref_text if ref_text else " ",  # must not be empty
-                        batches or [" "],
-                        self._f5_model,
-                        self._f5_vocoder,
-                        mel_spec_type=self._vocoder_name,
-                        progress=None,
-                        target_rms=self._target_rms,
-                        cross_fade_duration=self._cross_fade_duration,
-                        nfe_step=self._nfe_step,
-                        cfg_strength=self._cfg_strength,
-                        sway_sampling_coef=self._sway_sampling_coef,
-                        speed=float(speed) if speed is not None else 1.0,
-                        fix_duration=None,
-                        device=self._f5_device,
-                        streaming=False,
-                    )
+                audio, sr = _load_as_torch_channels_first(ref_wav, device=self._f5_device)
+                # Streaming mode does not cross-fade between batches, so it is
+                # only used when there is a single batch to encode.
+                stream = len(batches) <= 1
+                generator = infer_batch_process(
+                    (audio, sr),
+                    ref_text if ref_text else " ",  # must not be empty
+                    batches or [" "],
+                    self._f5_model,
+                    self._f5_vocoder,
+                    mel_spec_type=self._vocoder_name,
+                    progress=None,
+                    target_rms=self._target_rms,
+                    cross_fade_duration=self._cross_fade_duration,
+                    nfe_step=self._nfe_step,
+                    cfg_strength=self._cfg_strength,
+                    sway_sampling_coef=self._sway_sampling_coef,
+                    speed=float(speed) if speed is not None else 1.0,
+                    fix_duration=None,
+                    device=self._f5_device,
+                    streaming=stream,
+                    chunk_size=4096,
                 )
+                if stream:
+                    return _encode_wav_pcm16_stream(_iter_in_inference_mode(generator))
 
-                audio_segment = _np.asarray(final_wave, dtype=_np.float32)
-                final_sr = int(final_sr)
+                # Non-streaming returns a generator yielding final_wave at the end.
+                final_wave, final_sr, _spec = next(_iter_in_inference_mode(generator))
 
-            buf = io.BytesIO()
-            sf.write(buf, audio_segment, int(final_sr), format="WAV", subtype="PCM_16")
-            return buf.getvalue()
+            return _encode_wav_pcm16(final_wave, int(final_sr))
         finally:
             try:
-                Path(ref_wav).unlink(missing_ok=True)  # type: ignore[arg-type]
-            except Exception:
+                os.unlink(ref_wav)
+            except OSError:
                 pass
 
     def infer_to_audio_chunks(
@@ -531,7 +730,7 @@ class F5TTSVoiceCloningEngine:
                     "Provide reference_text when cloning, or set it via the voice store."
                 )
 
-            import warnings
+            infer_batch_process = _get_infer_batch_process()
             with warnings.catch_warnings():
                 # Keep REPL and API logs clean.
                 warnings.filterwarnings("ignore", category=UserWarning, module=r"torchaudio\..*")
@@ -544,14 +743,11 @@ class F5TTSVoiceCloningEngine:
                     ref_text = ref_text + " "
 
                 # Prefer sentence boundaries to reduce audible "cuts".
-                from ..tts.text_chunking import split_text_batches
-
                 batches = split_text_batches(text, max_chars=int(max_chars)) or [" "]
 
-                from f5_tts.infer.utils_infer import infer_batch_process
-                audio, sr = _load_as_torch_channels_first(Path(ref_wav))
+                audio, sr = _load_as_torch_channels_first(ref_wav, device=self._f5_device)
 
-                for chunk, sr_out in infer_batch_process(
+                for chunk, sr_out in _iter_in_inference_mode(infer_batch_process(
                     (audio, sr),
                     ref_text if ref_text else " ",
                     batches,
@@ -569,10 +765,10 @@ class F5TTSVoiceCloningEngine:
                     device=self._f5_device,
                     streaming=True,
                     chunk_size=int(chunk_size),
-                ):
+                )):
                     yield np.asarray(chunk, dtype=np.float32), int(sr_out)
         finally:
             try:
-                Path(ref_wav).unlink(missing_ok=True)  # type: ignore[arg-type]
-            except Exception:
+                os.unlink(ref_wav)
+            except OSError:
                 pass
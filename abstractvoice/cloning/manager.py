@@ -1,13 +1,136 @@
 from __future__ import annotations
 
+import hashlib
+import math
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from ..audio.resample import linear_resample_mono
 from .store import VoiceCloneStore
 
+try:  # Optional C implementation for the reference-text consensus.
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except Exception:  # pragma: no cover - depends on the environment
+    _Levenshtein = None
+
+try:  # Optional C/SIMD resampler for the reference-text ASR clip.
+    import soxr as _soxr
+except Exception:  # pragma: no cover - depends on the environment
+    _soxr = None
+
 
 _REMOTE_CLONING_ENGINES = {"openai", "openai-compatible", "remote"}
 
+_SUPPORTED_REF_SUFFIXES = frozenset({".wav", ".flac", ".ogg"})
+# Remote providers decode compressed uploads themselves.
+_REMOTE_REF_SUFFIXES = _SUPPORTED_REF_SUFFIXES | {".mp3", ".mpeg", ".mpga", ".m4a", ".webm", ".aac"}
+
+# Sentence-final punctuation accepted at the end of an ASR reference transcript.
+_END_PUNCT = (".", "!", "?", "。")
+
+# Only short utterances are worth caching; this also bounds the cache's memory.
+_SYNTH_CACHE_MAX_TEXT_CHARS = 200
+
+
+def _iter_locked(chunks: Iterable[Any], lock: "threading.RLock"):
+    """Yield from `chunks`, holding `lock` only while each step is computed.
+
+    The lock is never held across a `yield`, so a slow consumer (audio
+    playback) does not block other callers, and re-entrant use from the
+    consuming thread cannot deadlock.
+    """
+    it = iter(chunks)
+    try:
+        while True:
+            with lock:
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(it, "close", None)
+        if callable(close):
+            close()
+
+
+def _resample_for_asr(mono: Any, src_sr: int, dst_sr: int) -> Any:
+    """Resample a mono float32 clip for STT; uses `soxr` (C, SIMD) when installed."""
+    if int(src_sr) == int(dst_sr):
+        return mono
+    if _soxr is not None:
+        return _soxr.resample(mono, int(src_sr), int(dst_sr), quality="QQ")
+    # simple linear resample (avoid extra deps)
+    return linear_resample_mono(mono, int(src_sr), int(dst_sr))
+
+
+def _decode_asr_part(path: Path, max_samples: int, target_sr: int) -> Any:
+    """Decode at most `max_samples` (at `target_sr`) of one file as mono float32."""
+    import numpy as np
+    import soundfile as sf
+
+    with sf.SoundFile(str(path)) as f:
+        sr = int(f.samplerate)
+        # Decode only what fits in the clip (long references are otherwise
+        # fully decoded just to be truncated).
+        need = int(math.ceil(int(max_samples) * sr / int(target_sr)))
+        audio = f.read(frames=need, dtype="float32", always_2d=True)
+    if audio.shape[1] == 1:
+        mono = audio[:, 0]
+    elif audio.shape[1] == 2:
+        mono = np.add(audio[:, 0], audio[:, 1], dtype=np.float32)
+        mono *= 0.5
+    else:
+        mono = audio.mean(axis=1, dtype=np.float32)
+    return _resample_for_asr(mono, sr, target_sr)
+
+
+def _edit_distance(a: str, b: str, *, threshold: int | None = None) -> int:
+    """Levenshtein distance; uses `rapidfuzz` (C, bit-parallel) when installed.
+
+    With `threshold`, any result above it only means "more than `threshold`"
+    (the computation stops as soon as that is certain).
+    """
+    a = str(a or "")
+    b = str(b or "")
+    if _Levenshtein is None:
+        return _edit_distance_py(a, b, threshold=threshold)
+    if threshold is None:
+        return int(_Levenshtein.distance(a, b))
+    return int(_Levenshtein.distance(a, b, score_cutoff=max(0, int(threshold))))
+
+
+def _edit_distance_py(a: str, b: str, *, threshold: int | None = None) -> int:
+    # Levenshtein distance (iterative DP, O(len(a)*len(b))).
+    if a == b:
+        return 0
+    # The length difference is a lower bound on the distance.
+    if threshold is not None and abs(len(a) - len(b)) > threshold:
+        return abs(len(a) - len(b))
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+    # Ensure `b` is the longer string to keep the inner list small.
+    if len(a) > len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        cur = [i]
+        for j, cb in enumerate(b, start=1):
+            ins = cur[j - 1] + 1
+            dele = prev[j] + 1
+            sub = prev[j - 1] + (0 if ca == cb else 1)
+            cur.append(min(ins, dele, sub))
+        prev = cur
+        # Row minima never decrease, so the final distance is at least this.
+        if threshold is not None and min(prev) > threshold:
+            return int(threshold) + 1
+    return int(prev[-1])
+
 
 def _normalize_cloning_engine(engine: str | None) -> str:
     name = str(engine or "").strip().lower().replace("_", "-")
@@ -38,6 +161,8 @@ class VoiceCloner:
         remote_timeout_s: float | None = None,
         remote_tts_model: str | None = None,
         remote_session: Any = None,
+        synth_cache_size: int = 64,
+        warmup: bool = False,
     ):
         self.store = store or VoiceCloneStore()
         self.debug = debug
@@ -51,15 +176,65 @@ class VoiceCloner:
         self._remote_tts_model = str(remote_tts_model).strip() if remote_tts_model else None
         self._remote_session = remote_session
         self._engines: Dict[str, Any] = {}
+        # Guards engine instantiation (the warmup thread and a first request may race).
+        self._engines_lock = threading.RLock()
+        # One inference at a time per local engine: concurrent calls would just
+        # contend for the same cores/GPU and slow each other down.
+        self._engine_locks: Dict[str, threading.RLock] = {}
         self._quality_preset = "standard"
+        # Per-voice lookups reused across speak calls; every voice mutation made
+        # through this class drops them (see `_invalidate_voice_caches`).
+        self._ref_text_cache: Dict[str, str] = {}
+        self._ref_paths_cache: Dict[str, List[Path]] = {}
+        # Reference-text STT adapter, loaded on first use (see `_get_stt`).
+        self._stt: Any = None
+        self._stt_lock = threading.Lock()
+        # Voices whose stored references were already normalized this session.
+        self._normalized: set[str] = set()
+        # Small LRU of synthesized WAV bytes for repeated short phrases
+        # ("Done.", prompts, errors). 0 disables it.
+        self._synth_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+        self._synth_cache_max = max(0, int(synth_cache_size or 0))
+        self._synth_cache_lock = threading.Lock()
+
+        # Opt-in: load the default local engine off the critical path so the first
+        # utterance does not pay for the model load.
+        self._warmup_thread: threading.Thread | None = None
+        if warmup and self._default_engine not in _REMOTE_CLONING_ENGINES:
+            self._warmup_thread = threading.Thread(
+                target=self._warmup_default_engine,
+                name="abstractvoice-cloning-warmup",
+                daemon=True,
+            )
+            self._warmup_thread.start()
+
+    def _warmup_default_engine(self) -> None:
+        name = self._default_engine
+        try:
+            with self._engine_lock(name):
+                inst = self._get_engine(name)
+                preload = getattr(inst, "preload", None)
+                if callable(preload):
+                    preload()
+        except Exception:
+            # Best-effort: the first real request surfaces the error.
+            pass
 
     def _get_engine(self, engine: str) -> Any:
         name = _normalize_cloning_engine(engine)
         if not name:
             raise ValueError("engine must be a non-empty string")
-        if name in self._engines:
-            return self._engines[name]
-
+        inst = self._engines.get(name)
+        if inst is not None:
+            return inst
+        with self._engines_lock:
+            inst = self._engines.get(name)
+            if inst is None:
+                inst = self._create_engine(name)
+                self._engines[name] = inst
+            return inst
+
+    def _create_engine(self, name: str) -> Any:
         # Lazy-load engines to avoid surprise model downloads during list/store operations.
         if name == "f5_tts":
             try:
@@ -122,7 +297,6 @@ class VoiceCloner:
         except Exception:
             pass
 
-        self._engines[name] = inst
         return inst
 
     def set_quality_preset(self, preset: str) -> None:
@@ -188,7 +362,7 @@ class VoiceCloner:
 
         if voice_text:
             try:
-                self.store.normalize_reference_audio(voice_text)
+                self._normalize_references_once(voice_text)
                 self._ensure_reference_text(voice_text)
                 voice_prepared = True
             except Exception as e:
@@ -201,7 +375,8 @@ class VoiceCloner:
                 warmed_via_steps = ["engine_preload"]
             if voice_text:
                 try:
-                    _ = self.speak_to_bytes(
+                    # Bypass the synthesis cache: a hit would skip the actual warmup.
+                    _ = self._synthesize_wav_bytes(
                         self._warmup_text_for_language(language),
                         voice_id=voice_text,
                         format="wav",
@@ -297,7 +472,8 @@ class VoiceCloner:
         return int(removed)
 
     def unload_all_engines(self) -> int:
-        """Unload all loaded engines."""
+        """Unload all loaded engines (and the reference-text STT model)."""
+        self.unload_stt()
         return self.unload_engines_except(None)
 
     def get_runtime_info(self) -> Dict[str, Any]:
@@ -333,16 +509,16 @@ class VoiceCloner:
         if not p.exists():
             raise FileNotFoundError(str(p))
 
-        supported = {".wav", ".flac", ".ogg"}
+        supported = _SUPPORTED_REF_SUFFIXES
 
         engine_name = _normalize_cloning_engine(engine or self._default_engine)
         if engine_name not in ("f5_tts", "chroma", "audiodit", "omnivoice", "qwen3-tts", *_REMOTE_CLONING_ENGINES):
             raise ValueError("engine must be one of: omnivoice|f5_tts|chroma|audiodit|qwen3-tts|openai|openai-compatible")
         if engine_name in _REMOTE_CLONING_ENGINES:
-            supported = supported | {".mp3", ".mpeg", ".mpga", ".m4a", ".webm", ".aac"}
+            supported = _REMOTE_REF_SUFFIXES
 
         if p.is_dir():
-            refs = sorted([x for x in p.glob("*") if x.suffix.lower() in supported])
+            refs = sorted(x for x in p.iterdir() if x.suffix.lower() in supported)
             if not refs:
                 raise ValueError(f"No supported reference audio files found in: {p}")
         else:
@@ -444,145 +620,244 @@ class VoiceCloner:
 
     def rename_cloned_voice(self, voice_id: str, new_name: str) -> None:
         self.store.rename_voice(voice_id, new_name)
+        self._invalidate_voice_caches(voice_id)
 
     def delete_cloned_voice(self, voice_id: str) -> None:
         self.store.delete_voice(voice_id)
+        self._invalidate_voice_caches(voice_id)
 
     def set_reference_text(self, voice_id: str, reference_text: str) -> None:
         self.store.set_reference_text(voice_id, reference_text, source="manual")
+        self._invalidate_voice_caches(voice_id)
 
-    def _ensure_reference_text(self, voice_id: str) -> str:
-        voice = self.store.get_voice(voice_id)
+    def _engine_lock(self, engine: str) -> threading.RLock:
+        name = _normalize_cloning_engine(engine)
+        lock = self._engine_locks.get(name)
+        if lock is None:
+            lock = self._engine_locks.setdefault(name, threading.RLock())
+        return lock
+
+    def _invalidate_voice_caches(self, voice_id: str) -> None:
+        self._normalized.discard(voice_id)
+        self._ref_text_cache.pop(voice_id, None)
+        self._ref_paths_cache.pop(voice_id, None)
+        with self._synth_cache_lock:
+            for key in [k for k in self._synth_cache if k[1] == voice_id]:
+                del self._synth_cache[key]
+
+    def _synth_cache_key(
+        self, text: str, voice_id: str, speed: Optional[float], language: Optional[str]
+    ) -> Optional[Tuple[Any, ...]]:
+        if self._synth_cache_max <= 0 or len(text) > _SYNTH_CACHE_MAX_TEXT_CHARS:
+            return None
+        # A voice's engine never changes, so voice_id stands in for it; the
+        # preset does change the output and is part of the key.
+        return (text, voice_id, speed, language, self.get_quality_preset())
+
+    def _synth_cache_get(self, key: Optional[Tuple[Any, ...]]) -> Optional[bytes]:
+        if key is None:
+            return None
+        with self._synth_cache_lock:
+            data = self._synth_cache.get(key)
+            if data is not None:
+                self._synth_cache.move_to_end(key)
+            return data
+
+    def _synth_cache_put(self, key: Optional[Tuple[Any, ...]], data: bytes) -> None:
+        if key is None or not data:
+            return
+        with self._synth_cache_lock:
+            self._synth_cache[key] = data
+            self._synth_cache.move_to_end(key)
+            while len(self._synth_cache) > self._synth_cache_max:
+                self._synth_cache.popitem(last=False)
+
+    def _resolve_paths_cached(self, voice_id: str) -> List[Path]:
+        paths = self._ref_paths_cache.get(voice_id)
+        if paths is None:
+            paths = self.store.resolve_reference_paths(voice_id)
+            self._ref_paths_cache[voice_id] = paths
+        return list(paths)
+
+    def _get_stt(self) -> Any:
+        """Return the cached reference-text STT adapter, or None if its model is unavailable."""
+        with self._stt_lock:
+            if self._stt is None:
+                # Use a slightly larger model by default for better transcript quality.
+                from ..adapters.stt_faster_whisper import FasterWhisperAdapter
+
+                stt = FasterWhisperAdapter(
+                    model_size=self._reference_text_whisper_model,
+                    device="cpu",
+                    compute_type="int8",
+                    allow_downloads=bool(self._allow_downloads),
+                )
+                if not stt.is_available():
+                    # Not cached: a later prefetch/download should be picked up.
+                    return None
+                self._stt = stt
+            return self._stt
+
+    def unload_stt(self) -> bool:
+        """Best-effort unload the reference-text STT model to free memory."""
+        with self._stt_lock:
+            stt, self._stt = self._stt, None
+        if stt is None:
+            return False
+        try:
+            if hasattr(stt, "unload"):
+                stt.unload()
+        except Exception:
+            pass
+        return True
+
+    def _normalize_references_once(self, voice_id: str) -> None:
+        if voice_id in self._normalized:
+            return
+        try:
+            if self.store.normalize_reference_audio(voice_id):
+                self._invalidate_voice_caches(voice_id)
+        except Exception:
+            return
+        self._normalized.add(voice_id)
+
+    def _ensure_reference_text(self, voice_id: str, *, voice: Any = None) -> str:
+        cached = self._ref_text_cache.get(voice_id)
+        if cached is not None:
+            return cached
+
+        if voice is None:
+            voice = self.store.get_voice(voice_id)
         if (voice.reference_text or "").strip():
-            return str(voice.reference_text).strip()
+            text = str(voice.reference_text).strip()
+            self._ref_text_cache[voice_id] = text
+            return text
 
         # One-time fallback: transcribe reference audio and persist.
         ref_paths = self.store.resolve_reference_paths(voice_id)
 
-        # Use a slightly larger model by default for better transcript quality.
-        from ..adapters.stt_faster_whisper import FasterWhisperAdapter
         import numpy as np
-        import soundfile as sf
 
         # Build a short mono float32 clip (<= 30s) at 16k for STT.
         # Chroma-style prompting can benefit from longer reference transcripts; this
         # is a one-time cost per cloned voice.
         max_seconds = 30.0
         target_sr = 16000
-        merged = []
-        for p in ref_paths:
-            audio, sr = sf.read(str(p), always_2d=True, dtype="float32")
-            mono = np.mean(audio, axis=1).astype(np.float32)
-            # simple linear resample (avoid extra deps)
-            from ..audio.resample import linear_resample_mono
-
-            mono = linear_resample_mono(mono, int(sr), target_sr)
-            merged.append(mono)
-        clip = np.concatenate(merged) if merged else np.zeros((0,), dtype=np.float32)
-        clip = clip[: int(target_sr * max_seconds)]
-
-        stt = FasterWhisperAdapter(
-            model_size=self._reference_text_whisper_model,
-            device="cpu",
-            compute_type="int8",
-            allow_downloads=bool(self._allow_downloads),
+        clip = np.empty((int(target_sr * max_seconds),), dtype=np.float32)
+        filled = 0
+        if len(ref_paths) > 1:
+            # Multi-file voices: decode in parallel (libsndfile releases the GIL);
+            # each file is still capped at the clip length.
+            with ThreadPoolExecutor(max_workers=min(4, len(ref_paths))) as ex:
+                parts = ex.map(lambda p: _decode_asr_part(p, clip.size, target_sr), ref_paths)
+                for mono in parts:
+                    n = min(len(mono), clip.size - filled)
+                    clip[filled : filled + n] = mono[:n]
+                    filled += n
+                    if filled >= clip.size:
+                        break
+        elif ref_paths:
+            mono = _decode_asr_part(ref_paths[0], clip.size, target_sr)
+            filled = min(len(mono), clip.size)
+            clip[:filled] = mono[:filled]
+        clip = clip[:filled]
+
+        # 3-pass ASR consensus: reduces occasional non-determinism / decoding instability.
+        def _normalize_ref_text(s: str) -> str:
+            s = str(s or "").strip()
+            # Whisper output is usually single-spaced already; only collapse when needed.
+            if "  " in s or "\t" in s or "\n" in s or "\r" in s:
+                s = " ".join(s.split())
+            if s and not s.endswith(_END_PUNCT):
+                s = s + "."
+            return s
+
+        # A retry on the same reference audio and STT model (e.g. after a cleared
+        # transcript) reuses the recorded candidates instead of re-running ASR.
+        # Only candidates that produced a usable transcript are recorded, so a
+        # failed pass is always retried.
+        clip_sha1 = hashlib.sha1(clip.tobytes()).hexdigest()
+        stt_model = str(self._reference_text_whisper_model or "")
+        cached_asr = (getattr(voice, "meta", None) or {}).get("asr_candidates")
+        fresh_asr = not (
+            isinstance(cached_asr, dict)
+            and cached_asr.get("clip_sha1") == clip_sha1
+            and cached_asr.get("stt_model") == stt_model
         )
-        if not stt.is_available():
+        if not fresh_asr:
+            candidates: List[str] = [str(c) for c in (cached_asr.get("candidates") or [])]
+        else:
+            stt = self._get_stt()
+            if stt is None:
+                raise RuntimeError(
+                    "This cloned voice has no stored reference_text.\n"
+                    "Auto-fallback requires a cached STT model, but downloads are disabled.\n"
+                    "Fix options:\n"
+                    "  - Prefetch outside the REPL: abstractvoice-prefetch --stt small\n"
+                    "  - Or set it manually: /clone_set_ref_text <id> \"...\""
+                )
+
+            # The clip is prepared once and each pass decodes it from memory (same
+            # beam/VAD settings as file-based STT). When the first two passes agree
+            # a third one cannot change the majority, so it is only run on a split.
+            candidates = [
+                _normalize_ref_text((t or "").strip())
+                for t in stt.transcribe_candidates(clip, int(target_sr), temperatures=(0.0, 0.2))
+            ]
+            if len(set(candidates)) != 1:
+                candidates.extend(
+                    _normalize_ref_text((t or "").strip())
+                    for t in stt.transcribe_candidates(clip, int(target_sr), temperatures=(0.4,))
+                )
+
+        # Majority vote on normalized candidates.
+        best, best_n = Counter(candidates).most_common(1)[0] if candidates else ("", 0)
+
+        # No majority: choose the closest candidate (consensus by edit distance).
+        if best_n <= 1 and candidates:
+            best_sum = None
+            best_c = ""
+            for i, c in enumerate(candidates):
+                s = 0
+                for j, other in enumerate(candidates):
+                    if j == i:
+                        continue
+                    if best_sum is None:
+                        s += _edit_distance(c, other)
+                        continue
+                    # Only a strictly smaller sum can win; stop once that is impossible.
+                    limit = best_sum - s - 1
+                    if limit < 0:
+                        s = best_sum
+                        break
+                    s += _edit_distance(c, other, threshold=limit)
+                if best_sum is None or s < best_sum:
+                    best_sum = int(s)
+                    best_c = c
+            best = best_c
+
+        best = _normalize_ref_text(best)
+        if not best.strip():
             raise RuntimeError(
-                "This cloned voice has no stored reference_text.\n"
-                "Auto-fallback requires a cached STT model, but downloads are disabled.\n"
+                "Failed to auto-generate reference_text from the reference audio.\n"
                 "Fix options:\n"
-                "  - Prefetch outside the REPL: abstractvoice-prefetch --stt small\n"
+                "  - Provide a clearer 6–10s reference sample\n"
                 "  - Or set it manually: /clone_set_ref_text <id> \"...\""
             )
-        import os
-        import tempfile
-
-        # Use file-based STT (stronger decoding settings in the adapter) for better transcript quality.
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        tmp_path = tmp.name
-        tmp.close()
-        try:
-            sf.write(str(tmp_path), clip, int(target_sr), format="WAV", subtype="PCM_16")
-
-            # 3-pass ASR consensus: reduces occasional non-determinism / decoding instability.
-            def _normalize_ref_text(s: str) -> str:
-                s = " ".join(str(s or "").strip().split())
-                if s and not (s.endswith(".") or s.endswith("!") or s.endswith("?") or s.endswith("。")):
-                    s = s + "."
-                return s
-
-            def _edit_distance(a: str, b: str) -> int:
-                # Levenshtein distance (iterative DP, O(len(a)*len(b))).
-                a = str(a or "")
-                b = str(b or "")
-                if a == b:
-                    return 0
-                if not a:
-                    return len(b)
-                if not b:
-                    return len(a)
-                # Ensure `b` is the longer string to keep the inner list small.
-                if len(a) > len(b):
-                    a, b = b, a
-                prev = list(range(len(b) + 1))
-                for i, ca in enumerate(a, start=1):
-                    cur = [i]
-                    for j, cb in enumerate(b, start=1):
-                        ins = cur[j - 1] + 1
-                        dele = prev[j] + 1
-                        sub = prev[j - 1] + (0 if ca == cb else 1)
-                        cur.append(min(ins, dele, sub))
-                    prev = cur
-                return int(prev[-1])
-
-            candidates: List[str] = []
-            for _ in range(3):
-                t = (stt.transcribe(str(tmp_path)) or "").strip()
-                candidates.append(_normalize_ref_text(t))
-
-            # Majority vote on normalized candidates.
-            counts: Dict[str, int] = {}
-            for c in candidates:
-                counts[c] = counts.get(c, 0) + 1
-            best = ""
-            best_n = -1
-            for c, n in counts.items():
-                if n > best_n:
-                    best = c
-                    best_n = int(n)
-
-            # No majority: choose the closest candidate (consensus by edit distance).
-            if best_n <= 1 and candidates:
-                best_sum = None
-                best_c = ""
-                for i, c in enumerate(candidates):
-                    s = 0
-                    for j, other in enumerate(candidates):
-                        if j == i:
-                            continue
-                        s += _edit_distance(c, other)
-                    if best_sum is None or s < best_sum:
-                        best_sum = int(s)
-                        best_c = c
-                best = best_c
 
-            best = _normalize_ref_text(best)
-            if not best.strip():
-                raise RuntimeError(
-                    "Failed to auto-generate reference_text from the reference audio.\n"
-                    "Fix options:\n"
-                    "  - Provide a clearer 6–10s reference sample\n"
-                    "  - Or set it manually: /clone_set_ref_text <id> \"...\""
-                )
-        finally:
+        if fresh_asr:
             try:
-                os.unlink(tmp_path)
+                self.store.set_meta(
+                    voice_id,
+                    "asr_candidates",
+                    {"clip_sha1": clip_sha1, "stt_model": stt_model, "candidates": list(candidates)},
+                )
             except Exception:
                 pass
 
         # Persist so we never re-transcribe for this voice.
         self.store.set_reference_text(voice_id, best, source="asr")
+        self._ref_text_cache[voice_id] = best
         return best
 
     def speak_to_bytes(
@@ -597,6 +872,23 @@ class VoiceCloner:
         if format.lower() != "wav":
             raise ValueError("Voice cloning currently supports WAV output only.")
 
+        cache_key = self._synth_cache_key(str(text), str(voice_id), speed, language)
+        cached = self._synth_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        data = self._synthesize_wav_bytes(text, voice_id=voice_id, format=format, speed=speed, language=language)
+        self._synth_cache_put(cache_key, data)
+        return data
+
+    def _synthesize_wav_bytes(
+        self,
+        text: str,
+        *,
+        voice_id: str,
+        format: str,
+        speed: Optional[float],
+        language: Optional[str],
+    ) -> bytes:
         voice = self.store.get_voice(voice_id)
         # Voices created before engine-bound metadata used OpenF5 semantics.
         # Keep that legacy fallback for old stores; new clones default to OmniVoice.
@@ -614,20 +906,18 @@ class VoiceCloner:
 
         # Best-effort: normalize stored references (e.g. MP3-in-WAV) to avoid noisy
         # native decoder stderr output during synthesis.
-        try:
-            self.store.normalize_reference_audio(voice_id)
-        except Exception:
-            pass
-        ref_paths = self.store.resolve_reference_paths(voice_id)
-        ref_text = self._ensure_reference_text(voice_id)
+        self._normalize_references_once(voice_id)
+        ref_paths = self._resolve_paths_cached(voice_id)
+        ref_text = self._ensure_reference_text(voice_id, voice=voice)
         eng = self._get_engine(getattr(voice, "engine", None) or "f5_tts")
-        return eng.infer_to_wav_bytes(
-            text=text,
-            reference_paths=ref_paths,
-            reference_text=ref_text,
-            speed=speed,
-            language=language,
-        )
+        with self._engine_lock(engine_name):
+            return eng.infer_to_wav_bytes(
+                text=text,
+                reference_paths=ref_paths,
+                reference_text=ref_text,
+                speed=speed,
+                language=language,
+            )
 
     def speak_to_audio_chunks(
         self,
@@ -652,18 +942,18 @@ class VoiceCloner:
                     language=language,
                 )
 
-        try:
-            self.store.normalize_reference_audio(voice_id)
-        except Exception:
-            pass
-        ref_paths = self.store.resolve_reference_paths(voice_id)
-        ref_text = self._ensure_reference_text(voice_id)
+        self._normalize_references_once(voice_id)
+        ref_paths = self._resolve_paths_cached(voice_id)
+        ref_text = self._ensure_reference_text(voice_id, voice=voice)
         eng = self._get_engine(getattr(voice, "engine", None) or "f5_tts")
-        return eng.infer_to_audio_chunks(
-            text=text,
-            reference_paths=ref_paths,
-            reference_text=ref_text,
-            speed=speed,
-            max_chars=int(max_chars),
-            language=language,
-        )
+        lock = self._engine_lock(engine_name)
+        with lock:
+            chunks = eng.infer_to_audio_chunks(
+                text=text,
+                reference_paths=ref_paths,
+                reference_text=ref_text,
+                speed=speed,
+                max_chars=int(max_chars),
+                language=language,
+            )
+        return _iter_locked(chunks, lock)
@@ -1,19 +1,139 @@
 from __future__ import annotations
 
+import heapq
 import json
 import os
 import shutil
+import stat
+import struct
 import tempfile
 import time
 import threading
 import uuid
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import appdirs
 
+try:  # Optional fast JSON for the voice index; stdlib json is the fallback.
+    import orjson as _orjson
+except Exception:  # pragma: no cover - depends on the environment
+    _orjson = None
+if _orjson is None:
+    try:
+        import ujson as _ujson
+    except Exception:  # pragma: no cover - depends on the environment
+        _ujson = None
+else:
+    _ujson = None
+
 _STDERR_FD_LOCK = threading.Lock()
+# Shared fd=2 redirect state for `_SilenceStderrFD` (guarded by the lock above).
+_STDERR_FD_DEPTH = 0
+_STDERR_FD_SAVED: Optional[int] = None
+_STDERR_FD_DEVNULL: Optional[int] = None
+
+_COMPRESSED_AUDIO_SUFFIXES = frozenset({".mp3", ".flac", ".ogg", ".opus", ".m4a", ".aac", ".webm"})
+
+# (format, subtype) header probes keyed by (path, mtime_ns, size); a rewritten
+# file gets a new key, so entries never go stale.
+_SF_INFO_CACHE: Dict[Tuple[str, int, int], Tuple[str, str]] = {}
+_SF_INFO_CACHE_MAX = 1024
+
+
+def _probe_key(path: Path) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return (os.path.abspath(path), int(st.st_mtime_ns), int(st.st_size))
+
+
+# WAVE `fmt ` chunk format tags that matter here (others map to "TAG_xxxx").
+_WAV_TAG_SUBTYPES = {0x0001: "PCM", 0x0003: "FLOAT", 0x0050: "MPEG", 0x0055: "MPEG_LAYER_III"}
+_WAV_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _wav_format_tag(path: Path) -> Optional[int]:
+    """Read the `fmt ` chunk's wFormatTag straight from a RIFF/WAVE header.
+
+    Returns None when the header is not a plain RIFF/WAVE one (RF64, truncated,
+    `fmt ` chunk past the first 4 KiB, ...) so callers can fall back to libsndfile.
+    """
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        head = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None
+    pos = 12
+    while pos + 8 <= len(head):
+        chunk_id = head[pos : pos + 4]
+        (size,) = struct.unpack_from("<I", head, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            if body + 2 > len(head):
+                return None
+            (tag,) = struct.unpack_from("<H", head, body)
+            if tag == _WAV_FORMAT_EXTENSIBLE:
+                # The real tag is the first 2 bytes of the SubFormat GUID.
+                if size < 26 or body + 26 > len(head):
+                    return None
+                (tag,) = struct.unpack_from("<H", head, body + 24)
+            return int(tag)
+        pos = body + size + (size & 1)  # chunks are word-aligned
+    return None
+
+
+def _probe_wav_fmt(path: Path) -> Tuple[str, str]:
+    """Return the upper-cased (format, subtype) of an audio file, e.g. ("WAV", "MPEG_LAYER_III").
+
+    RIFF/WAVE files are classified from their header bytes; anything else
+    goes through `soundfile.info`.
+    """
+    key = _probe_key(path)
+    hit = _SF_INFO_CACHE.get(key)
+    if hit is not None:
+        return hit
+    try:
+        tag = _wav_format_tag(path)
+    except OSError:
+        tag = None
+    if tag is not None:
+        value = ("WAV", _WAV_TAG_SUBTYPES.get(tag, f"TAG_{tag:04X}"))
+        _remember_wav_fmt(key, value)
+        return value
+    import soundfile as sf
+
+    info = sf.info(str(path))
+    fmt = str(getattr(info, "format", "") or "").strip().upper()
+    subtype = str(getattr(info, "subtype", "") or "").strip().upper()
+    _remember_wav_fmt(key, (fmt, subtype))
+    return fmt, subtype
+
+
+def _remember_wav_fmt(key: Tuple[str, int, int], value: Tuple[str, str]) -> None:
+    if len(_SF_INFO_CACHE) >= _SF_INFO_CACHE_MAX:
+        _SF_INFO_CACHE.clear()
+    _SF_INFO_CACHE[key] = value
+
+
+def _index_loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    if _ujson is not None:
+        return _ujson.loads(raw.decode("utf-8"))
+    return json.loads(raw.decode("utf-8"))
+
+
+def _index_dumps(data: Dict[str, Any]) -> bytes:
+    # Same layout with every backend: 2-space indent, sorted keys.
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS)
+    if _ujson is not None:
+        return _ujson.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
 
 
 class _SilenceStderrFD:
@@ -22,46 +142,87 @@ class _SilenceStderrFD:
     Some native decoders (e.g. mpg123 via libsndfile) write directly to fd=2,
     bypassing Python's sys.stderr. We use this to keep interactive CLI output
     clean when decoding odd inputs like MP3-in-WAV.
+
+    The redirect is process-wide, so it is reference-counted: the first
+    entrant installs it and the last one to leave restores fd=2. Concurrent
+    decodes share one redirect instead of queueing on a lock for their whole
+    duration (and nested use costs no extra syscalls).
     """
 
     def __enter__(self):
-        self._lock = _STDERR_FD_LOCK
-        self._lock.acquire()
-        self._devnull_fd = None
-        self._saved_stderr_fd = None
-        try:
-            self._devnull_fd = os.open(os.devnull, os.O_WRONLY)
-            self._saved_stderr_fd = os.dup(2)
-            os.dup2(self._devnull_fd, 2)
-        except Exception:
-            self.__exit__(None, None, None)
+        global _STDERR_FD_DEPTH, _STDERR_FD_SAVED, _STDERR_FD_DEVNULL
+        with _STDERR_FD_LOCK:
+            if _STDERR_FD_DEPTH == 0:
+                devnull_fd = None
+                saved_fd = None
+                try:
+                    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+                    saved_fd = os.dup(2)
+                    os.dup2(devnull_fd, 2)
+                except Exception:
+                    # Best-effort: run unsilenced rather than fail the decode.
+                    for fd in (saved_fd, devnull_fd):
+                        if fd is not None:
+                            try:
+                                os.close(fd)
+                            except Exception:
+                                pass
+                    devnull_fd = None
+                    saved_fd = None
+                _STDERR_FD_SAVED = saved_fd
+                _STDERR_FD_DEVNULL = devnull_fd
+            _STDERR_FD_DEPTH += 1
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        try:
-            if self._saved_stderr_fd is not None:
-                try:
-                    os.dup2(self._saved_stderr_fd, 2)
-                except Exception:
-                    pass
-        finally:
-            try:
-                if self._saved_stderr_fd is not None:
-                    os.close(self._saved_stderr_fd)
-            except Exception:
-                pass
-            try:
-                if self._devnull_fd is not None:
-                    os.close(self._devnull_fd)
-            except Exception:
-                pass
+        global _STDERR_FD_DEPTH, _STDERR_FD_SAVED, _STDERR_FD_DEVNULL
+        with _STDERR_FD_LOCK:
+            _STDERR_FD_DEPTH -= 1
+            if _STDERR_FD_DEPTH > 0:
+                return False
+            saved_fd, devnull_fd = _STDERR_FD_SAVED, _STDERR_FD_DEVNULL
+            _STDERR_FD_SAVED = None
+            _STDERR_FD_DEVNULL = None
             try:
-                self._lock.release()
-            except Exception:
-                pass
+                if saved_fd is not None:
+                    try:
+                        os.dup2(saved_fd, 2)
+                    except Exception:
+                        pass
+            finally:
+                for fd in (saved_fd, devnull_fd):
+                    if fd is not None:
+                        try:
+                            os.close(fd)
+                        except Exception:
+                            pass
         return False
 
 
+def _transcode_to_pcm16_wav(src: Path, dst: Path, *, blocksize: int = 65536) -> None:
+    """Decode `src` block by block into a PCM16 WAV at `dst`.
+
+    Streaming keeps memory flat for long references. Blocks are read as
+    float32: libsndfile does not rescale float-native sources when asked for
+    int16 (values would truncate to zero), while float -> PCM16 on write is
+    scaled and clipped correctly.
+    """
+    import soundfile as sf
+
+    with _SilenceStderrFD():
+        with sf.SoundFile(str(src)) as r:
+            with sf.SoundFile(
+                str(dst),
+                "w",
+                samplerate=int(r.samplerate),
+                channels=int(r.channels),
+                format="WAV",
+                subtype="PCM_16",
+            ) as w:
+                for block in r.blocks(blocksize=int(blocksize), dtype="float32", always_2d=True):
+                    w.write(block)
+
+
 @dataclass(frozen=True)
 class ClonedVoice:
     voice_id: str
@@ -73,6 +234,25 @@ class ClonedVoice:
     meta: Dict[str, Any] = None
 
 
+_CLONED_VOICE_FIELDS = tuple(f.name for f in fields(ClonedVoice))
+
+
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an index record with fresh nested lists/dicts.
+
+    Records are shared with the cached index; results handed to callers must
+    not let an in-place edit (e.g. `voice.meta[...] = ...`) reach the cache.
+    """
+    out: Dict[str, Any] = {}
+    for key, value in record.items():
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        out[key] = value
+    return out
+
+
 class VoiceCloneStore:
     """Stores cloned-voice metadata + reference audio bundles locally.
 
@@ -90,25 +270,147 @@ class VoiceCloneStore:
         self._base_dir.mkdir(parents=True, exist_ok=True)
 
         self._index_path = self._base_dir / "index.json"
+        # Parsed index, reused while index.json is unchanged on disk (another
+        # process writing it changes the stat signature and forces a re-read).
+        self._index_cache: Optional[Dict[str, Any]] = None
+        self._index_sig: Optional[tuple] = None
+        # Newest-first voice ids for the cached index (see `list_voices`).
+        self._sorted_ids: List[str] = []
+        self._sorted_ids_for: Optional[Dict[str, Any]] = None
+        # Open `_transaction()` (index shared by nested mutations, written once).
+        self._txn_lock = threading.RLock()
+        self._txn_index: Optional[Dict[str, Any]] = None
+        self._txn_owner: Optional[int] = None
+        # Records already copied by the open transaction (see `_mutable_record`).
+        self._txn_owned: set = set()
+        self._txn_dirty = False
         if not self._index_path.exists():
             self._write_index({})
 
+    def _index_stat_sig(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self._index_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
     def _read_index(self) -> Dict[str, Any]:
+        # Shallow copy: callers add/replace/delete top-level entries before
+        # writing back, and never edit a shared record in place.
+        return dict(self._peek_index())
+
+    def _peek_index(self) -> Dict[str, Any]:
+        """Return the current index without copying it. Read-only use only."""
+        if self._txn_index is not None and self._txn_owner == threading.get_ident():
+            # Inside our own transaction: see its uncommitted changes.
+            return self._txn_index
+        sig = self._index_stat_sig()
+        if sig is not None and sig == self._index_sig and self._index_cache is not None:
+            return self._index_cache
         try:
-            return json.loads(self._index_path.read_text(encoding="utf-8"))
+            data = _index_loads(self._index_path.read_bytes())
         except Exception:
+            self._index_cache = None
+            self._index_sig = None
             return {}
+        self._index_cache = data
+        self._index_sig = sig
+        return data
 
     def _write_index(self, data: Dict[str, Any]) -> None:
-        self._index_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        # Write a sibling temp file and rename it over index.json: a crash or a
+        # concurrent reader never sees a half-written index.
+        buf = memoryview(_index_dumps(data))
+        fd, tmp = tempfile.mkstemp(prefix=".index.", suffix=".tmp", dir=str(self._base_dir))
+        try:
+            try:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep the usual index mode
+                while buf:
+                    buf = buf[os.write(fd, buf) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self._index_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._index_cache = dict(data)
+        self._index_sig = self._index_stat_sig()
+
+    @contextmanager
+    def _transaction(self):
+        """Read the index once, yield it for in-place edits, write it once on success.
+
+        Nested transactions (a mutator called from `bulk_update`) share the
+        outer index and leave the write to the outermost one. Mutators call
+        `_mark_dirty()` (or `_mutable_record`) before editing; a transaction
+        that changed nothing does not rewrite the index.
+        """
+        with self._txn_lock:
+            if self._txn_index is not None:
+                yield self._txn_index
+                return
+            index = self._read_index()
+            self._txn_index = index
+            self._txn_owner = threading.get_ident()
+            self._txn_owned = set()
+            self._txn_dirty = False
+            try:
+                yield index
+                if self._txn_dirty:
+                    self._write_index(index)
+            finally:
+                self._txn_index = None
+                self._txn_owner = None
+                self._txn_owned = set()
+                self._txn_dirty = False
+
+    def _mutable_record(self, index: Dict[str, Any], voice_id: str) -> Dict[str, Any]:
+        """Return `index[voice_id]` for in-place edits inside a transaction.
+
+        Records are shared with the cached index, so each one is copied once
+        per transaction (not once per edit): a failed transaction must leave
+        the cache as it is on disk.
+        """
+        if voice_id not in index:
+            raise KeyError(f"Unknown voice_id: {voice_id}")
+        if voice_id not in self._txn_owned:
+            index[voice_id] = dict(index[voice_id])
+            self._txn_owned.add(voice_id)
+        self._txn_dirty = True
+        return index[voice_id]
+
+    @staticmethod
+    def _existing_record(index: Dict[str, Any], voice_id: str) -> Dict[str, Any]:
+        if voice_id not in index:
+            raise KeyError(f"Unknown voice_id: {voice_id}")
+        return index[voice_id]
+
+    def _mark_dirty(self) -> None:
+        self._txn_dirty = True
+
+    def bulk_update(self, fn: Callable[["VoiceCloneStore"], Any]) -> Any:
+        """Run `fn(store)` with every index mutation it makes written in one go.
+
+        Useful for batches (e.g. importing many voices). If `fn` raises,
+        nothing is written to the index (files already copied stay on disk).
+        """
+        with self._transaction():
+            return fn(self)
 
     def _voice_dir(self, voice_id: str) -> Path:
         return self._base_dir / voice_id
 
     def resolve_reference_paths(self, voice_id: str) -> List[Path]:
-        voice = self.get_voice(voice_id)
-        vdir = self._voice_dir(voice.voice_id)
-        return [vdir / rel for rel in voice.reference_files]
+        data = self._peek_index().get(voice_id)
+        if data is None:
+            raise KeyError(f"Unknown voice_id: {voice_id}")
+        vdir = self._voice_dir(voice_id)
+        return [vdir / rel for rel in (data.get("reference_files") or [])]
 
     def normalize_reference_audio(self, voice_id: str) -> int:
         """Best-effort normalize stored references for a voice.
@@ -124,47 +426,45 @@ class VoiceCloneStore:
             return 0
 
         vdir = self._voice_dir(voice.voice_id)
-        converted = 0
-        for rel in (voice.reference_files or []):
-            p = vdir / str(rel)
+        paths = [vdir / str(rel) for rel in (voice.reference_files or [])]
+
+        def _one(p: Path) -> bool:
             try:
-                if self._normalize_wav_mpeg_to_pcm_inplace(p):
-                    converted += 1
+                return self._normalize_wav_mpeg_to_pcm_inplace(p)
             except Exception:
                 # Normalization is best-effort; inference can still attempt decode.
-                continue
-        return converted
+                return False
+
+        if len(paths) <= 1:
+            return sum(map(_one, paths))
+        # Files are independent and libsndfile decodes without the GIL.
+        workers = min(8, os.cpu_count() or 1, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return sum(ex.map(_one, paths))
 
     def _normalize_wav_mpeg_to_pcm_inplace(self, path: Path) -> bool:
         if path.suffix.lower() != ".wav":
             return False
-        if not path.exists():
-            return False
         try:
-            import soundfile as sf
+            import soundfile  # noqa: F401
         except Exception:
             return False
 
         try:
-            info = sf.info(str(path))
+            fmt, subtype = _probe_wav_fmt(path)
         except Exception:
             return False
 
         # Example: format=WAV subtype=MPEG_LAYER_III
-        fmt = str(getattr(info, "format", "") or "").strip().upper()
-        subtype = str(getattr(info, "subtype", "") or "").strip().upper()
         if fmt != "WAV" or not subtype.startswith("MPEG"):
             return False
 
         # Decode once (silencing native decoder stderr), then rewrite as PCM16 WAV.
-        with _SilenceStderrFD():
-            audio, sr = sf.read(str(path), always_2d=True, dtype="float32")
-
         tmp = tempfile.NamedTemporaryFile(dir=str(path.parent), suffix=".wav", delete=False)
         tmp_path = Path(tmp.name)
         tmp.close()
         try:
-            sf.write(str(tmp_path), audio, int(sr), format="WAV", subtype="PCM_16")
+            _transcode_to_pcm16_wav(path, tmp_path)
             tmp_path.replace(path)
         finally:
             try:
@@ -186,9 +486,11 @@ class VoiceCloneStore:
         if not paths:
             raise ValueError("reference_paths must contain at least one file")
         for p in paths:
-            if not p.exists():
-                raise FileNotFoundError(str(p))
-            if p.is_dir():
+            try:
+                st = os.stat(p)
+            except FileNotFoundError:
+                raise FileNotFoundError(str(p)) from None
+            if stat.S_ISDIR(st.st_mode):
                 raise ValueError(f"Reference path must be a file, got directory: {p}")
 
         voice_id = uuid.uuid4().hex
@@ -198,26 +500,30 @@ class VoiceCloneStore:
         copied: List[str] = []
         for i, p in enumerate(paths):
             dest = vdir / f"ref_{i}{p.suffix.lower()}"
+            probed = None
             if p.suffix.lower() == ".wav":
                 # If the WAV container is actually MPEG-compressed, normalize to PCM16 WAV
                 # to avoid noisy mpg123 "resync" messages later during synthesis.
                 try:
-                    import soundfile as sf
-
-                    info = sf.info(str(p))
-                    fmt = str(getattr(info, "format", "") or "").strip().upper()
-                    subtype = str(getattr(info, "subtype", "") or "").strip().upper()
+                    probed = _probe_wav_fmt(p)
+                    fmt, subtype = probed
                     if fmt == "WAV" and subtype.startswith("MPEG"):
-                        with _SilenceStderrFD():
-                            audio, sr = sf.read(str(p), always_2d=True, dtype="float32")
-                        sf.write(str(dest), audio, int(sr), format="WAV", subtype="PCM_16")
+                        _transcode_to_pcm16_wav(p, dest)
                         copied.append(dest.name)
                         continue
                 except Exception:
                     # Fall back to raw copy; synthesis may still attempt decode.
                     pass
 
-            shutil.copy2(p, dest)
+            # Content only (no mode/mtime): lets the kernel copy in place
+            # (sendfile/copy_file_range on Linux, fcopyfile on macOS).
+            shutil.copyfile(p, dest)
+            if probed is not None:
+                # Same bytes as the probed source: spare `normalize_reference_audio` a re-probe.
+                try:
+                    _remember_wav_fmt(_probe_key(dest), probed)
+                except OSError:
+                    pass
             copied.append(dest.name)
 
         meta_out = dict(meta or {})
@@ -235,9 +541,9 @@ class VoiceCloneStore:
             meta=meta_out,
         )
 
-        index = self._read_index()
-        index[voice_id] = asdict(record)
-        self._write_index(index)
+        with self._transaction() as index:
+            self._mark_dirty()
+            index[voice_id] = asdict(record)
         return voice_id
 
     def create_voice_from_wav_bytes(
@@ -286,49 +592,79 @@ class VoiceCloneStore:
             meta=meta_out,
         )
 
-        index = self._read_index()
-        index[voice_id] = asdict(record)
-        self._write_index(index)
+        with self._transaction() as index:
+            self._mark_dirty()
+            index[voice_id] = asdict(record)
         return voice_id
 
     def get_voice(self, voice_id: str) -> ClonedVoice:
-        index = self._read_index()
+        index = self._peek_index()
         if voice_id not in index:
             raise KeyError(f"Unknown voice_id: {voice_id}")
-        data = index[voice_id]
-        return ClonedVoice(**data)
+        # Only the record is copied (not the whole index), with its own
+        # meta/reference_files so callers can edit them freely.
+        return ClonedVoice(**_copy_record(index[voice_id]))
 
     def get_voice_dict(self, voice_id: str) -> Dict[str, Any]:
         """Return the stored voice record as a JSON-serializable dict."""
         v = self.get_voice(voice_id)
-        return {"voice_id": voice_id, **asdict(v)}
-
-    def list_voices(self) -> List[Dict[str, Any]]:
-        index = self._read_index()
-        out: List[Dict[str, Any]] = []
-        for voice_id, data in index.items():
-            out.append({"voice_id": voice_id, **data})
-        # newest first
-        out.sort(key=lambda d: float(d.get("created_at", 0)), reverse=True)
+        out: Dict[str, Any] = {"voice_id": voice_id}
+        for f in _CLONED_VOICE_FIELDS:
+            out[f] = getattr(v, f)
         return out
 
+    def list_voices(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return voice records, newest first (at most `limit` of them)."""
+        index = self._peek_index()
+
+        def _created(voice_id: str) -> float:
+            return float(index[voice_id].get("created_at", 0))
+
+        if limit is not None:
+            order = heapq.nlargest(max(0, int(limit)), index, key=_created)
+        elif self._txn_index is None and self._index_cache is not None and self._sorted_ids_for is self._index_cache:
+            # The order only changes when the index does; reuse it between calls.
+            order = self._sorted_ids
+        else:
+            order = sorted(index, key=_created, reverse=True)
+            if self._txn_index is None and self._index_cache is not None:
+                self._sorted_ids = order
+                self._sorted_ids_for = self._index_cache
+        return [{"voice_id": voice_id, **_copy_record(index[voice_id])} for voice_id in order]
+
     def set_reference_text(self, voice_id: str, reference_text: str, *, source: str | None = None) -> None:
         """Set (or replace) the stored reference text for a cloned voice.
 
         This matters a lot for cloning quality: if reference_text is garbled,
         the model often produces artifacts (wrong words bleeding into output).
         """
-        index = self._read_index()
-        if voice_id not in index:
-            raise KeyError(f"Unknown voice_id: {voice_id}")
-        data = dict(index[voice_id])
-        data["reference_text"] = str(reference_text or "")
-        if source:
+        with self._transaction() as index:
+            current = self._existing_record(index, voice_id)
+            unchanged = current.get("reference_text") == str(reference_text or "")
+            if unchanged and (not source or (current.get("meta") or {}).get("reference_text_source") == str(source)):
+                return
+            data = self._mutable_record(index, voice_id)
+            data["reference_text"] = str(reference_text or "")
+            if source:
+                meta = dict(data.get("meta") or {})
+                meta["reference_text_source"] = str(source)
+                data["meta"] = meta
+
+    def set_meta(self, voice_id: str, key: str, value: Any) -> None:
+        """Set (or remove, with `value=None`) one metadata entry of a cloned voice."""
+        with self._transaction() as index:
+            current = self._existing_record(index, voice_id).get("meta") or {}
+            if (value is None and str(key) not in current) or (
+                value is not None and str(key) in current and current[str(key)] == value
+            ):
+                return
+            data = self._mutable_record(index, voice_id)
             meta = dict(data.get("meta") or {})
-            meta["reference_text_source"] = str(source)
+            if value is None:
+                meta.pop(str(key), None)
+            else:
+                meta[str(key)] = value
             data["meta"] = meta
-        index[voice_id] = data
-        self._write_index(index)
 
     def export_voice(self, voice_id: str, path: str | Path) -> str:
         """Export a voice bundle as a zip archive."""
@@ -347,7 +683,9 @@ class VoiceCloneStore:
             z.writestr("voice.json", json.dumps(asdict(voice), indent=2, sort_keys=True))
             for rel in voice.reference_files:
                 fp = vdir / rel
-                z.write(fp, arcname=f"refs/{rel}")
+                # Deflate barely shrinks already-compressed audio; store it as-is.
+                compress_type = zipfile.ZIP_STORED if fp.suffix.lower() in _COMPRESSED_AUDIO_SUFFIXES else None
+                z.write(fp, arcname=f"refs/{rel}", compress_type=compress_type)
 
         return str(out_path)
 
@@ -360,7 +698,14 @@ class VoiceCloneStore:
             raise FileNotFoundError(str(src))
 
         with zipfile.ZipFile(src, "r") as z:
-            voice_data = json.loads(z.read("voice.json").decode("utf-8"))
+            voice_data = _index_loads(z.read("voice.json"))
+            # Validate before touching the store so a bad bundle leaves no partial state.
+            if not isinstance(voice_data, dict):
+                raise ValueError(f"Invalid voice bundle (voice.json is not an object): {src}")
+            missing = [k for k in ("name", "created_at") if k not in voice_data]
+            if missing:
+                raise ValueError(f"Invalid voice bundle (voice.json missing {', '.join(missing)}): {src}")
+            ref_members = [i for i in z.infolist() if i.filename.startswith("refs/") and not i.is_dir()]
 
             # New id on import to avoid collisions.
             new_id = uuid.uuid4().hex
@@ -368,46 +713,47 @@ class VoiceCloneStore:
             vdir.mkdir(parents=True, exist_ok=True)
 
             refs = []
-            for name in z.namelist():
-                if not name.startswith("refs/"):
-                    continue
-                rel = Path(name).name
-                dest = vdir / rel
-                with z.open(name) as src_fp, open(dest, "wb") as out_fp:
-                    shutil.copyfileobj(src_fp, out_fp)
-                refs.append(rel)
-
-            voice_data["voice_id"] = new_id
-            voice_data["reference_files"] = refs
-
-            index = self._read_index()
-            index[new_id] = voice_data
-            self._write_index(index)
+            try:
+                for info in ref_members:
+                    rel = Path(info.filename).name
+                    # Flatten to the voice dir (also drops any `..` components).
+                    info.filename = rel
+                    z.extract(info, path=str(vdir))
+                    refs.append(rel)
+
+                voice_data["voice_id"] = new_id
+                voice_data["reference_files"] = refs
+
+                with self._transaction() as index:
+                    self._mark_dirty()
+                    index[new_id] = voice_data
+            except BaseException:
+                shutil.rmtree(vdir, ignore_errors=True)
+                raise
 
         return new_id
 
     def rename_voice(self, voice_id: str, new_name: str) -> None:
-        index = self._read_index()
-        if voice_id not in index:
-            raise KeyError(f"Unknown voice_id: {voice_id}")
-        data = dict(index[voice_id])
-        data["name"] = str(new_name or "").strip() or data.get("name") or f"voice_{voice_id[:8]}"
-        index[voice_id] = data
-        self._write_index(index)
+        with self._transaction() as index:
+            current = self._existing_record(index, voice_id)
+            name = str(new_name or "").strip() or current.get("name") or f"voice_{voice_id[:8]}"
+            if current.get("name") == name:
+                return
+            self._mutable_record(index, voice_id)["name"] = name
 
     def delete_voice(self, voice_id: str) -> None:
         """Delete a voice entry and its reference files from disk."""
-        index = self._read_index()
-        if voice_id not in index:
-            raise KeyError(f"Unknown voice_id: {voice_id}")
+        with self._transaction() as index:
+            if voice_id not in index:
+                raise KeyError(f"Unknown voice_id: {voice_id}")
 
-        vdir = self._voice_dir(voice_id)
-        try:
-            if vdir.exists():
-                shutil.rmtree(vdir)
-        except Exception:
-            # If deletion fails, do not leave index in an inconsistent state.
-            raise
+            vdir = self._voice_dir(voice_id)
+            try:
+                if vdir.exists():
+                    shutil.rmtree(vdir)
+            except Exception:
+                # If deletion fails, do not leave index in an inconsistent state.
+                raise
 
-        del index[voice_id]
-        self._write_index(index)
+            self._mark_dirty()
+            del index[voice_id]
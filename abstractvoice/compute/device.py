@@ -12,17 +12,38 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 
 
 def best_torch_device() -> str:
     """Return best torch device string: cuda|mps|xpu|cpu.
 
     Honors env var `ABSTRACTVOICE_TORCH_DEVICE` when set (e.g. "cpu", "mps", "cuda").
+    With `ABSTRACTVOICE_NO_TORCH_PROBE=1`, returns "cpu" instead of importing
+    torch just to probe (a probe still runs if torch is already imported).
     """
     forced = (os.environ.get("ABSTRACTVOICE_TORCH_DEVICE") or "").strip().lower()
     if forced:
         return forced
+    if "torch" not in sys.modules and _env_bool("ABSTRACTVOICE_NO_TORCH_PROBE"):
+        return "cpu"
+    return _detect_torch_device()
 
+
+def _env_bool(key: str, default: bool = False) -> bool:
+    raw = os.environ.get(str(key), None)
+    if raw is None:
+        return bool(default)
+    val = str(raw).strip().lower()
+    if not val:
+        return bool(default)
+    return val in {"1", "true", "yes", "y", "on"}
+
+
+@lru_cache(maxsize=None)
+def _detect_torch_device() -> str:
+    # Cached: hardware does not change within a process, and the probes
+    # (CUDA runtime init in particular) are not free on repeated calls.
     try:
         import torch
 
@@ -63,7 +84,11 @@ def best_faster_whisper_device() -> str:
         if forced.startswith("cuda"):
             return "cuda"
         return forced
+    return _detect_faster_whisper_device()
 
+
+@lru_cache(maxsize=None)
+def _detect_faster_whisper_device() -> str:
     # IMPORTANT:
     # faster-whisper is backed by CTranslate2 and can be CUDA-enabled even when
     # PyTorch is not installed. Therefore, CUDA detection must not rely on torch.
@@ -94,3 +119,8 @@ def best_faster_whisper_device() -> str:
 
     return "cpu"
 
+
+def invalidate_device_cache() -> None:
+    """Forget cached device probes (e.g. in tests, or after changing visible devices)."""
+    _detect_torch_device.cache_clear()
+    _detect_faster_whisper_device.cache_clear()
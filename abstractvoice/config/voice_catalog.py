@@ -3,9 +3,13 @@
 Remote engines treat language as a provider hint. Piper validates against its
 own small curated mapping; broader local engines such as Supertonic use this
 catalog for display / UX messaging.
+
+The catalog is read-only (shared by every VoiceManager via `LANGUAGES`).
 """
 
-LANGUAGES = {
+from types import MappingProxyType
+
+_LANGUAGES = {
     "ar": {"name": "Arabic"},
     "bg": {"name": "Bulgarian"},
     "cs": {"name": "Czech"},
@@ -40,5 +44,8 @@ LANGUAGES = {
     "zh": {"name": "Chinese"},
 }
 
+LANGUAGES = MappingProxyType({code: MappingProxyType(info) for code, info in _LANGUAGES.items()})
+del _LANGUAGES
+
 # Universal safe fallback language code.
 SAFE_FALLBACK = "en"
@@ -11,15 +11,18 @@ from __future__ import annotations
 import argparse
 import cmd
 import atexit
+import contextlib
+import functools
 import json
+import os
 import re
+import select
 import shlex
 import shutil
 import sys
 import importlib.util
 import threading
 import time
-import requests
 from abstractvoice import VoiceManager
 from abstractvoice.examples.llm_provider import (
     resolve_provider,
@@ -30,6 +33,190 @@ from abstractvoice.examples.llm_provider import (
 )
 from abstractvoice.examples.tts_defaults import normalize_tts_engine_name, resolve_interactive_tts_engine
 
+try:  # Optional fast JSON for LLM responses; stdlib json is the fallback.
+    import orjson as _orjson
+except Exception:  # pragma: no cover
+    _orjson = None
+
+
+# Rough chars-per-token ratio for history budgeting and display-only token
+# estimates (tiktoken is optional).
+_CHARS_PER_TOKEN = 4
+
+
+def _approx_tokens(text) -> int:
+    """~4 chars/token estimate (Latin scripts); 0 for blank text, else at least 1."""
+    s = str(text or "").strip()
+    return max(1, int(round(len(s) / _CHARS_PER_TOKEN))) if s else 0
+
+
+def _json_loads(raw: bytes):
+    """Parse a JSON payload straight from response bytes (orjson when installed)."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact UTF-8 JSON bytes (orjson when installed)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Token counts kept from an OpenAI-compatible `usage` object (buffered or final stream chunk).
+_USAGE_METRIC_KEYS = frozenset({"prompt_tokens", "completion_tokens"})
+
+
+def _usage_metrics(data) -> dict:
+    usage = data.get("usage") if isinstance(data, dict) else None
+    if not isinstance(usage, dict):
+        return {}
+    return {k: v for k, v in usage.items() if k in _USAGE_METRIC_KEYS}
+
+
+# Streamed LLM text is flushed to the terminal when a delta ends a sentence or line.
+_RE_STREAM_FLUSH = re.compile(r"[.!?…。！？:;\n]")
+
+# Role markers some models leak into replies; everything from the first one on is dropped.
+_RE_ROLE_LEAK = re.compile(r"(?:user:|<\|user\|>|assistant:|<\|assistant\|>|<\|end\|>).*", re.DOTALL)
+
+# Reference audio suffixes accepted by the clone shortcut and source summaries.
+_CLONE_SHORTCUT_SUFFIXES = (".wav", ".flac", ".ogg")
+
+
+@functools.lru_cache(maxsize=64)
+def _scan_audio_dir(path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Sorted reference-audio files in `path`; keyed on the dir mtime so edits re-scan."""
+    # `scandir` entries carry the file type from the directory read.
+    with os.scandir(path) as it:
+        return tuple(sorted(e.path for e in it if e.name.lower().endswith(_CLONE_SHORTCUT_SUFFIXES) and e.is_file()))
+
+
+def _list_audio_dir(path) -> tuple[str, ...]:
+    p = os.fspath(path)
+    return _scan_audio_dir(p, os.stat(p).st_mtime_ns)
+
+
+def _read_raw_keys(fd: int, timeout: float = 0.1) -> bytes | None:
+    """One read from a raw-mode tty: the pending key bytes, `b""` on timeout, `None` at EOF.
+
+    A read can batch several keys, so callers treat any ESC byte in it as "exit"
+    and any number of SPACE bytes as a single toggle. The timeout lets key loops
+    notice state changes instead of blocking in `read` forever.
+    """
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return b""
+    return os.read(fd, 8) or None
+
+
+def _close_input_stream(stream, *, drain: bool = True) -> None:
+    """Stop and close a sounddevice stream; safe on `None` and on already-closed streams.
+
+    `drain=False` uses `abort()`, which drops in-flight buffers instead of waiting
+    for PortAudio to deliver them.
+    """
+    if stream is None:
+        return
+    try:
+        if drain:
+            stream.stop()
+        else:
+            stream.abort()
+    except Exception:
+        pass
+    try:
+        stream.close()
+    except Exception:
+        pass
+
+
+class _PcmCapture:
+    """Mono int16 PCM written by the PTT mic callback into one preallocated buffer.
+
+    numpy is imported on construction (it ships with `sounddevice`), so the REPL
+    itself keeps importing without it.
+    """
+
+    def __init__(self, sample_rate: int, seconds: float = 60.0):
+        import numpy as np
+
+        self._buf = np.empty(max(1, int(sample_rate * seconds)), dtype=np.int16)
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._copyto = np.copyto
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pos = 0
+
+    def append(self, samples) -> None:
+        """Copy one int16 callback block (shape `(n,)` or `(n, 1)`) after the captured prefix.
+
+        Runs on the audio thread: one in-place copy, no per-block allocations.
+        """
+        n = len(samples)
+        with self._lock:
+            pos = self._pos
+            end = pos + n
+            if end > len(self._buf):
+                # Rare (over-long recording): grow geometrically, keep the prefix.
+                import numpy as np
+
+                grown = np.empty(max(end, 2 * len(self._buf)), dtype=np.int16)
+                grown[:pos] = self._buf[:pos]
+                self._buf = grown
+            self._copyto(self._buf[pos:end], samples.reshape(-1), casting="no")
+            self._pos = end
+
+    def __len__(self) -> int:
+        return self._pos
+
+    def pcm_bytes(self) -> bytes:
+        with self._lock:
+            return self._buf[: self._pos].tobytes()
+
+
+# Piper-mapped languages: display names and the localized lines spoken after a switch.
+_PIPER_LANG_NAMES = {
+    'en': 'English', 'fr': 'French', 'es': 'Spanish',
+    'de': 'German', 'ru': 'Russian', 'zh': 'Chinese'
+}
+_LANG_SWITCH_MSGS = {
+    'en': "Language switched to English.",
+    'fr': "Langue changée en français.",
+    'es': "Idioma cambiado a español.",
+    'de': "Sprache auf Deutsch umgestellt.",
+    'ru': "Язык переключен на русский.",
+    'zh': "语言已切换到中文。"
+}
+_VOICE_SWITCH_MSGS = {
+    'en': 'Voice changed to English.',
+    'fr': 'Voix changée en français.',
+    'es': 'Voz cambiada al español.',
+    'de': 'Stimme auf Deutsch geändert.',
+    'ru': 'Голос изменён на русский.',
+    'zh': '语音已切换到中文。'
+}
+
+
+# /voice modes; the continuous-listening ones print a banner once the mic is up.
+_VOICE_MODES = frozenset({"off", "full", "wait", "stop", "ptt"})
+_LISTEN_MODE_BANNERS = {
+    "wait": "Voice mode: WAIT - Listens continuously except while speaking.\nUse /voice off to disable.",
+    "stop": "Voice mode: STOP - Always listens; stop phrase stops TTS.\nUse /voice off to disable.",
+    "full": "Voice mode: FULL - Interrupts TTS on any speech (best with AEC/headset).\nUse /voice off to disable.",
+}
+
+# Base TTS engines whose single model covers many languages (Piper loads one voice per language).
+_MULTILINGUAL_TTS_ENGINES = frozenset({"supertonic", "omnivoice", "qwen3-tts", "openai", "openai-compatible"})
+
+# How long a /setvoice model listing is reused before re-enumerating.
+_VOICE_MODELS_TTL_S = 30.0
+
 
 # ANSI color codes
 class Colors:
@@ -43,6 +230,26 @@ class Colors:
     END = "\033[0m"
 
 
+class _NoColors:
+    BLUE = CYAN = GREEN = YELLOW = RED = BOLD = UNDERLINE = END = ""
+
+
+def _stdout_is_tty() -> bool:
+    try:
+        return bool(sys.stdout.isatty())
+    except Exception:
+        return False
+
+
+# Piped/redirected output (tee, CI logs) gets plain text: decided once at import.
+if not _stdout_is_tty():
+    Colors = _NoColors  # type: ignore[misc]
+
+
+# Verbose turn stats are printed in yellow; built once, filled per line.
+_YELLOW_WRAP = f"{Colors.YELLOW}{{}}{Colors.END}"
+
+
 class VoiceREPL(cmd.Cmd):
     """Voice-enabled REPL for LLM interaction."""
     
@@ -142,6 +349,8 @@ class VoiceREPL(cmd.Cmd):
         # When reference_text is auto-generated via ASR ("asr" source), print a
         # ready-to-copy `/clone_set_ref_text ...` hint once per voice for easy correction.
         self._printed_asr_ref_text_hint: set[str] = set()
+        # (resolved path, mtime_ns, size) -> duration seconds, for `_summarize_audio_source`.
+        self._audio_info_cache: dict[tuple[str, int, int], float] = {}
         self._last_debug_wav_path: str | None = None
 
         # Seed a default cloned voice (HAL9000) if samples are present.
@@ -165,9 +374,23 @@ class VoiceREPL(cmd.Cmd):
         # thread. Serialize LLM calls + history updates to avoid interleaved or
         # duplicated message sequences.
         self._chat_lock = threading.Lock()
+        # Background test-message speech from /language and /setvoice runs under this
+        # lock, as do TTS engine/voice swaps. Bumping the generation (under the lock)
+        # cancels a test message that has not started speaking yet.
+        self._switch_speak_lock = threading.RLock()
+        self._switch_speak_gen = 0
+        # /setvoice listing: ((manager id, adapter id), monotonic ts, models); see `_cached_voice_models`.
+        self._voice_models_cache: tuple[tuple[int, int], float, dict] | None = None
         
         # Message history
         self.messages = [{"role": "system", "content": self.system_prompt}]
+        # Rough cap on the history sent each turn (~4 chars/token). Oldest turns are
+        # dropped first; the system prompt and latest exchange are always kept.
+        # Servers otherwise truncate silently from the front (system prompt included).
+        # 0 disables trimming.
+        self.history_token_budget = 8192
+        # id(message) -> (message, JSON bytes); see `_encode_chat_body`.
+        self._message_json_cache: dict[int, tuple[dict, bytes]] = {}
         
         # Token counting
         self.system_tokens = 0
@@ -182,11 +405,15 @@ class VoiceREPL(cmd.Cmd):
         # Best-effort tokenizer cache (tiktoken optional).
         self._tiktoken_encoding = None
         self._tiktoken_unavailable = False
+        # (encoding name, system prompt) -> token count; kept across /system changes.
+        self._system_prompt_tok_cache: dict[tuple[str, str], int] = {}
         self._count_system_tokens()
         self._count_system_words()
 
         # Best-effort metrics captured from voice input paths.
         self._pending_stt_metrics: dict | None = None
+        # Stats of the last completed LLM turn (see `process_query`).
+        self._last_turn_metrics: dict | None = None
 
         if self.debug_mode:
             print(f"Initialized provider: {self.provider}")
@@ -311,6 +538,70 @@ class VoiceREPL(cmd.Cmd):
         except Exception:
             pass
 
+    def _prewarm_ptt_imports_async(self) -> None:
+        """Import `sounddevice` (PortAudio init) in the background before a PTT session.
+
+        `_run_ptt_session` still imports it itself; that import then finds the module
+        in `sys.modules` (or waits on the in-flight import) instead of paying for it.
+        """
+        if "sounddevice" in sys.modules:
+            return
+
+        def _worker() -> None:
+            try:
+                import sounddevice  # noqa: F401
+            except Exception:
+                pass
+
+        try:
+            threading.Thread(target=_worker, daemon=True, name="abstractvoice-ptt-imports").start()
+        except Exception:
+            pass
+
+    def _speak_switch_message_async(self, text: str) -> None:
+        """Speak a language/voice switch confirmation without blocking the prompt.
+
+        Buffered engines synthesize the whole line before `speak()` returns; doing
+        that on a worker gives the prompt back immediately. `speak()` itself already
+        streams (plays from the first chunk) for cloned voices and for
+        `/tts delivery streamed`, so it is not bypassed here: the user's delivery
+        choice stays in effect for these short one-sentence lines.
+        """
+        vm = self.voice_manager
+        voice = self.current_tts_voice
+        with self._switch_speak_lock:
+            self._switch_speak_gen += 1
+            gen = self._switch_speak_gen
+
+        def _worker() -> None:
+            with self._switch_speak_lock:
+                # Superseded by a newer query, switch or test message: stay silent.
+                if self._switch_speak_gen != gen:
+                    return
+                try:
+                    vm.speak(text, voice=voice)
+                except Exception as e:
+                    if self.debug_mode:
+                        print(f"Test message failed: {e}")
+
+        threading.Thread(target=_worker, daemon=True, name="abstractvoice-switch-speak").start()
+
+    def _cancel_switch_message(self) -> None:
+        """Drop a pending switch test message; waits if one is mid-`speak()`.
+
+        Callers stop playback right after, so an already-enqueued test message is
+        cut off instead of overlapping what comes next.
+        """
+        with self._switch_speak_lock:
+            self._switch_speak_gen += 1
+
+    @contextlib.contextmanager
+    def _voice_switch(self):
+        """Hold the switch lock across a TTS engine/voice swap (cancels pending test speech)."""
+        with self._switch_speak_lock:
+            self._switch_speak_gen += 1
+            yield
+
     def _get_intro(self):
         """Generate intro message with help."""
         intro = f"\n{Colors.BOLD}Welcome to AbstractVoice CLI REPL{Colors.END}\n"
@@ -363,29 +654,36 @@ class VoiceREPL(cmd.Cmd):
         return intro
         
     def _count_system_tokens(self):
-        """Count tokens in the system prompt."""
-        self._count_tokens(self.system_prompt, "system")
+        """Count tokens in the system prompt (memoized per encoding + prompt text)."""
+        encoding = self._get_tiktoken_encoding()
+        if encoding is None:
+            return
+        key = (str(getattr(encoding, "name", "")), str(self.system_prompt or ""))
+        cache = self._system_prompt_tok_cache
+        if key in cache:
+            self.system_tokens = cache[key]
+            return
+        count = self._count_tokens(self.system_prompt, "system")
+        if isinstance(count, int):
+            cache[key] = count
 
     def _count_system_words(self):
         self.system_words = self._count_words(self.system_prompt)
 
     def _count_words(self, text: str) -> int:
-        s = str(text or "").strip()
-        if not s:
-            return 0
         # A "word" here is whitespace-delimited for simplicity across languages.
-        return len([w for w in re.split(r"\s+", s) if w])
+        return len(str(text or "").split())
 
     def _get_tiktoken_encoding(self):
-        if getattr(self, "_tiktoken_unavailable", False):
-            return None
-        enc = getattr(self, "_tiktoken_encoding", None)
-        if enc is not None:
+        # Hot path: both attributes are set in __init__, so the per-turn callers
+        # (`_count_tokens`, `/speak` verbose stats) pay two attribute reads.
+        enc = self._tiktoken_encoding
+        if enc is not None or self._tiktoken_unavailable:
             return enc
         try:
             import tiktoken
         except ImportError:
-            self._tiktoken_unavailable = True
+            self._disable_token_counting()
             return None
 
         try:
@@ -394,12 +692,16 @@ class VoiceREPL(cmd.Cmd):
             try:
                 enc = tiktoken.get_encoding("cl100k_base")
             except Exception:
-                self._tiktoken_unavailable = True
+                self._disable_token_counting()
                 return None
 
         self._tiktoken_encoding = enc
         return enc
 
+    def _disable_token_counting(self) -> None:
+        """No tokenizer: the per-turn token counters return early from now on."""
+        self._tiktoken_unavailable = True
+
     def _fmt_s(self, seconds: float | None) -> str:
         try:
             if seconds is None:
@@ -444,13 +746,12 @@ class VoiceREPL(cmd.Cmd):
         except Exception:
             return None, None
 
-        supported = {".wav", ".flac", ".ogg"}
         files = []
         try:
             if p.is_file():
                 files = [p]
             elif p.is_dir():
-                files = sorted([x for x in p.iterdir() if x.is_file() and x.suffix.lower() in supported])
+                files = [Path(x) for x in _list_audio_dir(p)]
             else:
                 return None, None
         except Exception:
@@ -458,10 +759,15 @@ class VoiceREPL(cmd.Cmd):
 
         total_s = 0.0
         max_files = 25
+        durations = self._audio_info_cache
         for fp in files[:max_files]:
             try:
-                info = sf.info(str(fp))
-                d = float(getattr(info, "duration", 0.0) or 0.0)
+                st = fp.stat()
+                key = (str(fp.resolve()), int(st.st_mtime_ns), int(st.st_size))
+                d = durations.get(key)
+                if d is None:
+                    info = sf.info(str(fp))
+                    d = durations[key] = float(getattr(info, "duration", 0.0) or 0.0)
                 if d > 0:
                     total_s += d
             except Exception:
@@ -471,7 +777,7 @@ class VoiceREPL(cmd.Cmd):
         return (int(len(files)) if files else 0), (float(total_s) if total_s > 0 else None)
 
     def _print_verbose_turn_stats(self, turn: dict) -> None:
-        if not bool(getattr(self, "verbose_mode", False)):
+        if not self.verbose_mode:
             return
         if not isinstance(turn, dict):
             return
@@ -498,20 +804,18 @@ class VoiceREPL(cmd.Cmd):
             stt_s = stt.get("stt_s")
             stt_a = stt.get("audio_s")
             stt_rtf = stt.get("rtf")
-            stt_txt = f"STT {self._fmt_s(stt_s)}"
-            if stt_a:
-                stt_txt += f"(a{self._fmt_s(stt_a)})"
+            stt_pieces = [f"STT {self._fmt_s(stt_s)}" + (f"(a{self._fmt_s(stt_a)})" if stt_a else "")]
             if stt_rtf is not None:
-                stt_txt += f" rtf{self._fmt_num(stt_rtf, digits=2)}"
-            parts1.append(stt_txt)
+                stt_pieces.append(f"rtf{self._fmt_num(stt_rtf, digits=2)}")
+            parts1.append(" ".join(stt_pieces))
 
         if llm_s is not None or api_prompt_tok is not None or api_out_tok is not None:
-            llm_txt = f"LLM {self._fmt_s(llm_s)}"
+            llm_pieces = ["LLM", self._fmt_s(llm_s)]
             if api_prompt_tok is not None or api_out_tok is not None:
                 p = str(api_prompt_tok) if api_prompt_tok is not None else "--"
                 o = str(api_out_tok) if api_out_tok is not None else "--"
-                llm_txt += f" (api p{p} o{o})"
-            parts1.append(llm_txt)
+                llm_pieces.append(f"(api p{p} o{o})")
+            parts1.append(" ".join(llm_pieces))
 
         # `/speak` is not an LLM turn; show a single text size indicator.
         if kind == "speak" and not stt and not llm:
@@ -581,19 +885,21 @@ class VoiceREPL(cmd.Cmd):
                             mode = "buf"
                     except Exception:
                         mode = None
-                    mode_txt = f"{mode} " if mode else ""
-                    tts_txt = f"TTS {label} {mode_txt}{self._fmt_s(synth_s)}→{self._fmt_s(audio_s)}"
+                    tts_pieces = ["TTS", label]
+                    if mode:
+                        tts_pieces.append(mode)
+                    tts_pieces.append(f"{self._fmt_s(synth_s)}→{self._fmt_s(audio_s)}")
                     if rtf is not None:
-                        tts_txt += f" rtf{self._fmt_num(rtf, digits=2)}"
+                        tts_pieces.append(f"rtf{self._fmt_num(rtf, digits=2)}")
 
                     # Extra streaming details when available.
                     if bool(tts.get("streaming")):
                         ttfb_s = tts.get("ttfb_s")
                         if ttfb_s is not None:
-                            tts_txt += f" ttfb{self._fmt_s(ttfb_s)}"
+                            tts_pieces.append(f"ttfb{self._fmt_s(ttfb_s)}")
                         ch = tts.get("chunks")
                         if isinstance(ch, int):
-                            tts_txt += f" ch{ch}"
+                            tts_pieces.append(f"ch{ch}")
 
                     wps_spoken = None
                     try:
@@ -602,27 +908,28 @@ class VoiceREPL(cmd.Cmd):
                     except Exception:
                         wps_spoken = None
                     if wps_spoken is not None:
-                        tts_txt += f" ({self._fmt_num(wps_spoken, digits=1)}w/s)"
+                        tts_pieces.append(f"({self._fmt_num(wps_spoken, digits=1)}w/s)")
 
-                    parts2.append(tts_txt)
+                    parts2.append(" ".join(tts_pieces))
         else:
             parts2.append("TTS off")
 
-        total_words = int(getattr(self, "system_words", 0) + getattr(self, "user_words", 0) + getattr(self, "assistant_words", 0))
+        # Counters are always set in `__init__` (and reset by `_clear_history`).
+        total_words = int(self.system_words + self.user_words + self.assistant_words)
         total_tokens = None
-        if self._get_tiktoken_encoding() is not None:
-            total_tokens = int(getattr(self, "system_tokens", 0) + getattr(self, "user_tokens", 0) + getattr(self, "assistant_tokens", 0))
+        if self._tiktoken_encoding is not None:
+            total_tokens = int(self.system_tokens + self.user_tokens + self.assistant_tokens)
 
         tot_txt = f"tot {self._fmt_wtok(total_words, total_tokens)}"
-        if isinstance(getattr(self, "total_llm_out_tokens", None), int) and getattr(self, "total_llm_out_tokens") > 0:
-            tot_txt += f" (api out {int(getattr(self, 'total_llm_out_tokens'))}tok)"
+        api_out_total = self.total_llm_out_tokens
+        if isinstance(api_out_total, int) and api_out_total > 0:
+            tot_txt += f" (api out {api_out_total}tok)"
         parts2.append(tot_txt)
 
         line2 = " | ".join(parts2)
 
         # Keep it readable; two lines max.
-        print(f"{Colors.YELLOW}{line1}{Colors.END}")
-        print(f"{Colors.YELLOW}{line2}{Colors.END}")
+        print(_YELLOW_WRAP.format(line1) + "\n" + _YELLOW_WRAP.format(line2))
     
     def parseline(self, line):
         """Parse the line to extract command and arguments.
@@ -644,7 +951,7 @@ class VoiceREPL(cmd.Cmd):
             except Exception:
                 pass
             return super().parseline(raw)
-        return super().parseline(line.strip())
+        return super().parseline(s)
         
     def default(self, line):
         """Handle regular text input.
@@ -652,7 +959,8 @@ class VoiceREPL(cmd.Cmd):
         Only 'stop' is recognized as a command without /
         All other commands MUST use / prefix.
         """
-        # Skip empty lines
+        # Skip empty lines. `onecmd` passes the line returned by `parseline`,
+        # which is already stripped (so this is a no-copy no-op in practice).
         text = line.strip()
         if not text:
             return
@@ -670,6 +978,7 @@ class VoiceREPL(cmd.Cmd):
 
         # Interrupt any ongoing TTS playback immediately when the user types.
         # This is the expected “barge-in by typing” UX for a REPL.
+        self._cancel_switch_message()
         try:
             if self.voice_manager:
                 self.voice_manager.stop_speaking()
@@ -683,21 +992,22 @@ class VoiceREPL(cmd.Cmd):
         if self._maybe_handle_clone_shortcut(text):
             return
         
-        # Everything else goes to LLM
+        # Everything else goes to LLM (playback was already stopped above).
         self._pending_stt_metrics = None
-        self.process_query(text)
+        self.process_query(text, interrupt=False)
 
     # NOTE: PTT is implemented as a dedicated key-loop session (no typing).
 
     def _maybe_handle_clone_shortcut(self, text: str) -> bool:
-        """Best-effort: treat a pasted WAV/FLAC/OGG path as `/clone_use`."""
+        """Best-effort: treat a pasted WAV/FLAC/OGG path as `/clone_use`.
+
+        `text` is the stripped, non-empty input line from `default`.
+        """
         if not self.voice_manager:
             return False
 
-        raw = (text or "").strip()
-        if not raw:
-            return False
-        if raw.startswith("/"):
+        raw = text
+        if not raw or raw.startswith("/"):
             return False
 
         # Optional transcript with a simple pipe syntax:
@@ -720,6 +1030,11 @@ class VoiceREPL(cmd.Cmd):
         if (path_str.startswith('"') and path_str.endswith('"')) or (path_str.startswith("'") and path_str.endswith("'")):
             path_str = path_str[1:-1].strip()
 
+        # Cheap pre-check so ordinary chat lines never touch the filesystem:
+        # only an audio file name or something path-like is worth a stat.
+        if not (path_str.lower().endswith(_CLONE_SHORTCUT_SUFFIXES) or "/" in path_str or "\\" in path_str):
+            return False
+
         try:
             from pathlib import Path
 
@@ -735,7 +1050,7 @@ class VoiceREPL(cmd.Cmd):
             # to interpret it as a path. Treat as normal chat input instead.
             return False
 
-        exts = {".wav", ".flac", ".ogg"}
+        exts = _CLONE_SHORTCUT_SUFFIXES
         try:
             is_file = bool(p.is_file())
         except OSError:
@@ -749,10 +1064,7 @@ class VoiceREPL(cmd.Cmd):
             return False
         if is_dir:
             try:
-                has_audio = any(
-                    (x.is_file() and x.suffix.lower() in exts)
-                    for x in p.iterdir()
-                )
+                has_audio = bool(_list_audio_dir(p))
             except Exception:
                 has_audio = False
             if not has_audio:
@@ -775,23 +1087,32 @@ class VoiceREPL(cmd.Cmd):
                 traceback.print_exc()
         return True
         
-    def process_query(self, query):
-        """Process a query and get a response from the LLM."""
+    def process_query(self, query, *, interrupt: bool = True):
+        """Process a query and get a response from the LLM.
+
+        `interrupt=False` skips stopping current playback, for callers that
+        already did (typed input barges in from `default`).
+        """
         query = str(query or "").strip()
         if not query:
             return
 
+        # Imported on first use (not at module import) to keep REPL startup fast.
+        import requests
+
         # Consume any pending STT metrics for this turn (voice/PTT input).
         stt_metrics = getattr(self, "_pending_stt_metrics", None)
         self._pending_stt_metrics = None
 
         # If audio is currently playing, stop it so the new request can be handled
         # without overlapping speech.
-        try:
-            if self.voice_manager:
-                self.voice_manager.stop_speaking()
-        except Exception:
-            pass
+        if interrupt:
+            self._cancel_switch_message()
+            try:
+                if self.voice_manager:
+                    self.voice_manager.stop_speaking()
+            except Exception:
+                pass
 
         # Serialize history updates + LLM call so we don't build an interleaved
         # message list when microphone callbacks and typed input overlap.
@@ -811,6 +1132,9 @@ class VoiceREPL(cmd.Cmd):
                     "temperature": self.temperature,
                     "max_tokens": self.max_tokens,
                 }
+                if payload["stream"]:
+                    # Ask for a final usage chunk so streamed turns keep token stats.
+                    payload["stream_options"] = {"include_usage": True}
 
                 llm_t0 = time.monotonic()
                 api_llm_metrics = {}
@@ -818,22 +1142,20 @@ class VoiceREPL(cmd.Cmd):
                 tts_pipelined = False
 
                 if not bool(payload.get("stream")):
-                    response = requests.post(
+                    response = self.provider.session.post(
                         self.provider.chat_url,
-                        json=payload,
+                        data=self._encode_chat_body(payload),
+                        headers=_JSON_HEADERS,
                         # Avoid indefinite hangs if the server stalls.
                         timeout=(5.0, 600.0),
                     )
                     response.raise_for_status()
 
                     try:
-                        response_data = response.json()
+                        response_data = _json_loads(response.content)
 
                         # OpenAI-compat usage (prompt_tokens, completion_tokens).
-                        usage = response_data.get("usage")
-                        if isinstance(usage, dict):
-                            api_llm_metrics["prompt_tokens"] = usage.get("prompt_tokens")
-                            api_llm_metrics["completion_tokens"] = usage.get("completion_tokens")
+                        api_llm_metrics.update(_usage_metrics(response_data))
 
                         # OpenAI-compat response format.
                         choices = response_data.get("choices")
@@ -852,9 +1174,10 @@ class VoiceREPL(cmd.Cmd):
                         api_llm_metrics = {}
                 else:
                     # Stream OpenAI-compatible deltas and optionally pipe into streamed TTS.
-                    response = requests.post(
+                    response = self.provider.session.post(
                         self.provider.chat_url,
-                        json=payload,
+                        data=self._encode_chat_body(payload),
+                        headers=_JSON_HEADERS,
                         stream=True,
                         # Avoid indefinite hangs if the server stalls.
                         timeout=(5.0, 600.0),
@@ -863,6 +1186,18 @@ class VoiceREPL(cmd.Cmd):
 
                     response_parts: list[str] = []
                     in_think = False
+                    pending: list[str] = []
+                    pending_chars = 0
+
+                    def _flush_pending() -> None:
+                        nonlocal pending_chars
+                        try:
+                            sys.stdout.write("".join(pending))
+                            sys.stdout.flush()
+                        except Exception:
+                            pass
+                        pending.clear()
+                        pending_chars = 0
 
                     tts_stream = None
                     try:
@@ -884,12 +1219,8 @@ class VoiceREPL(cmd.Cmd):
                             except Exception:
                                 tts_stream = None
 
-                        # Print in cyan while streaming.
-                        try:
-                            sys.stdout.write(Colors.CYAN)
-                            sys.stdout.flush()
-                        except Exception:
-                            pass
+                        # Print in cyan while streaming (emitted with the first flush).
+                        pending.append(Colors.CYAN)
 
                         def _filter_think_delta(delta: str) -> str:
                             nonlocal in_think
@@ -914,24 +1245,24 @@ class VoiceREPL(cmd.Cmd):
                                         in_think = False
                             return out
 
-                        for raw_line in response.iter_lines(decode_unicode=True):
-                            if raw_line is None:
-                                continue
-                            line = str(raw_line).strip()
-                            if not line:
+                        # Raw bytes: the JSON parser detects UTF-8 itself, so each line is
+                        # parsed once without a str copy (and without requests guessing
+                        # ISO-8859-1 for a `text/event-stream` with no charset).
+                        for raw_line in response.iter_lines():
+                            if not raw_line or not raw_line.startswith(b"data:"):
                                 continue
-                            if not line.startswith("data:"):
-                                continue
-                            data = line[len("data:") :].strip()
+                            data = raw_line[5:].strip()
                             if not data:
                                 continue
-                            if data == "[DONE]":
+                            if data == b"[DONE]":
                                 break
                             try:
-                                event = json.loads(data)
-                            except Exception:
+                                event = _json_loads(data)
+                            except ValueError:
                                 continue
 
+                            api_llm_metrics.update(_usage_metrics(event))
+
                             delta_txt = ""
                             try:
                                 choices = event.get("choices")
@@ -956,11 +1287,12 @@ class VoiceREPL(cmd.Cmd):
                                 continue
 
                             response_parts.append(clean)
-                            try:
-                                sys.stdout.write(clean)
-                                sys.stdout.flush()
-                            except Exception:
-                                pass
+                            # Batch terminal output: write/flush at sentence or line
+                            # ends (or every ~80 chars), not once per token.
+                            pending.append(clean)
+                            pending_chars += len(clean)
+                            if pending_chars >= 80 or _RE_STREAM_FLUSH.search(clean):
+                                _flush_pending()
 
                             if tts_stream is not None:
                                 try:
@@ -968,11 +1300,8 @@ class VoiceREPL(cmd.Cmd):
                                 except Exception:
                                     pass
                     finally:
-                        try:
-                            sys.stdout.write(Colors.END + "\n")
-                            sys.stdout.flush()
-                        except Exception:
-                            pass
+                        pending.append(Colors.END + "\n")
+                        _flush_pending()
                         try:
                             if tts_stream is not None:
                                 tts_stream.close()
@@ -993,22 +1322,25 @@ class VoiceREPL(cmd.Cmd):
                 llm_s = float(llm_t1 - llm_t0)
 
                 # Commit durable history only after we have a response.
-                self.messages = list(messages_for_call) + [{"role": "assistant", "content": response_text}]
+                self.messages.append(user_message)
+                self.messages.append({"role": "assistant", "content": response_text})
+                self._trim_history()
 
                 # Per-turn counts (only for committed history).
                 user_words = self._count_words(query)
                 assistant_words = self._count_words(response_text)
                 self.user_words += int(user_words)
                 self.assistant_words += int(assistant_words)
-                user_tokens = self._count_tokens(query, "user")
-                assistant_tokens = self._count_tokens(response_text, "assistant")
+                user_tokens, assistant_tokens = self._count_tokens_batch(
+                    [("user", query), ("assistant", response_text)]
+                )
 
                 # Display the response with color (unless we already streamed it).
                 if not bool(payload.get("stream")):
                     print(f"{Colors.CYAN}{response_text}{Colors.END}")
 
                 # Record last-turn stats (best-effort; printed only in verbose mode).
-                self._last_turn_metrics = {
+                turn_metrics = {
                     "stt": stt_metrics,
                     "llm": {
                         "s": llm_s,
@@ -1021,12 +1353,10 @@ class VoiceREPL(cmd.Cmd):
                         "out_tokens": int(assistant_tokens) if isinstance(assistant_tokens, int) else None,
                     },
                 }
-                try:
-                    out_tok = api_llm_metrics.get("completion_tokens") if isinstance(api_llm_metrics, dict) else None
-                    if isinstance(out_tok, int) and out_tok >= 0:
-                        self.total_llm_out_tokens += int(out_tok)
-                except Exception:
-                    pass
+                self._last_turn_metrics = turn_metrics
+                out_tok = api_llm_metrics.get("completion_tokens")
+                if isinstance(out_tok, int) and out_tok >= 0:
+                    self.total_llm_out_tokens += out_tok
 
                 # Speak the response if voice manager is available (unless pipelined).
                 if self.voice_manager and self.use_tts and not bool(tts_pipelined):
@@ -1050,18 +1380,15 @@ class VoiceREPL(cmd.Cmd):
                 except Exception:
                     tts_metrics = None
 
-                try:
-                    if isinstance(getattr(self, "_last_turn_metrics", None), dict):
-                        self._last_turn_metrics["tts"] = tts_metrics
-                except Exception:
-                    pass
+                turn_metrics["tts"] = tts_metrics
 
-                # Verbose stats (max 2 lines).
-                try:
-                    if self.verbose_mode and isinstance(getattr(self, "_last_turn_metrics", None), dict):
-                        self._print_verbose_turn_stats(self._last_turn_metrics)
-                except Exception:
-                    pass
+                # Verbose stats (max 2 lines). Malformed engine metrics must not turn a
+                # delivered reply into an error report.
+                if self.verbose_mode:
+                    try:
+                        self._print_verbose_turn_stats(turn_metrics)
+                    except (AttributeError, KeyError, TypeError, ValueError):
+                        pass
 
             except requests.exceptions.ConnectionError as e:
                 print(f"❌ Cannot connect to {self.provider.name} at {self.provider.base_url}")
@@ -1094,6 +1421,8 @@ class VoiceREPL(cmd.Cmd):
     
     def _count_tokens(self, text, role):
         """Count tokens in text."""
+        if self._tiktoken_unavailable:
+            return None
         encoding = self._get_tiktoken_encoding()
         if encoding is None:
             return None
@@ -1118,18 +1447,47 @@ class VoiceREPL(cmd.Cmd):
             print(f"Total tokens: {total_tokens}")
         return int(token_count)
     
+    def _count_tokens_batch(self, items):
+        """Count tokens for `(role, text)` pairs with one batched encode call.
+
+        Updates the per-role totals like `_count_tokens` and returns the counts
+        in input order (`None` entries when no tokenizer is available).
+        """
+        if self._tiktoken_unavailable:
+            return [None] * len(items)
+        encoding = self._get_tiktoken_encoding()
+        if encoding is None:
+            return [None] * len(items)
+        texts = [str(text or "") for _role, text in items]
+        try:
+            encode_batch = getattr(encoding, "encode_ordinary_batch", None)
+            if encode_batch is not None:
+                counts = [len(tokens) for tokens in encode_batch(texts)]
+            else:
+                counts = [len(encoding.encode(t)) for t in texts]
+        except Exception as e:
+            if self.debug_mode:
+                print(f"Error counting tokens: {e}")
+            return [None] * len(items)
+
+        for (role, _text), token_count in zip(items, counts):
+            if role == "system":
+                self.system_tokens = int(token_count)
+            elif role == "user":
+                self.user_tokens += int(token_count)
+            elif role == "assistant":
+                self.assistant_tokens += int(token_count)
+            if self.debug_mode:
+                print(f"{str(role).capitalize()} tokens: {token_count}")
+
+        if self.debug_mode:
+            total_tokens = self.system_tokens + self.user_tokens + self.assistant_tokens
+            print(f"Total tokens: {total_tokens}")
+        return counts
+
     def _clean_response(self, text):
         """Clean LLM response text."""
-        patterns = [
-            r"user:.*", r"<\|user\|>.*", 
-            r"assistant:.*", r"<\|assistant\|>.*", 
-            r"<\|end\|>.*"
-        ]
-        
-        for pattern in patterns:
-            text = re.sub(pattern, "", text, flags=re.DOTALL)
-            
-        return text.strip()
+        return _RE_ROLE_LEAK.sub("", text).strip()
 
     def do_language(self, args):
         """Switch voice language.
@@ -1151,17 +1509,7 @@ class VoiceREPL(cmd.Cmd):
             # The built-in language catalog is Piper-focused. For engines like OmniVoice
             # we treat the language code as a pass-through hint and do not enumerate
             # the full upstream language list here.
-            engine = ""
-            try:
-                engine = str(getattr(self.voice_manager, "_tts_engine_name", "") or "").strip().lower()
-            except Exception:
-                engine = ""
-            if not engine:
-                try:
-                    a = getattr(self.voice_manager, "tts_adapter", None)
-                    engine = str(getattr(a, "engine_id", "") or "").strip().lower()
-                except Exception:
-                    engine = ""
+            engine = self._active_tts_engine_id()
 
             if engine in ("omnivoice",):
                 print("Language codes:")
@@ -1195,7 +1543,9 @@ class VoiceREPL(cmd.Cmd):
 
         # Switch language
         old_lang = self.current_language
-        if self.voice_manager.set_language(language):
+        with self._voice_switch():
+            switched = self.voice_manager.set_language(language)
+        if switched:
             self.current_language = language
             self.current_tts_voice = None
             old_name = self.voice_manager.get_language_name(old_lang)
@@ -1203,18 +1553,10 @@ class VoiceREPL(cmd.Cmd):
             print(f"🌍 Language changed: {old_name} → {new_name}")
 
             # Test the new language with localized message
-            test_messages = {
-                'en': "Language switched to English.",
-                'fr': "Langue changée en français.",
-                'es': "Idioma cambiado a español.",
-                'de': "Sprache auf Deutsch umgestellt.",
-                'ru': "Язык переключен на русский.",
-                'zh': "语言已切换到中文。"
-            }
-            test_msg = test_messages.get(language, "Language switched.")
+            test_msg = _LANG_SWITCH_MSGS.get(language, "Language switched.")
             # Respect TTS toggle: if the user disabled TTS, don't speak test messages.
-            if getattr(self, "use_tts", True):
-                self.voice_manager.speak(test_msg, voice=self.current_tts_voice)
+            if self.use_tts:
+                self._speak_switch_message_async(test_msg)
 
             # Restart voice mode if it was active
             if was_active:
@@ -1227,6 +1569,22 @@ class VoiceREPL(cmd.Cmd):
                 import traceback
                 traceback.print_exc()
 
+    def _cached_voice_models(self) -> dict:
+        """`list_available_models()` for /setvoice, reused for a short while.
+
+        Enumeration checks every voice's cache status on disk; repeated listings
+        within `_VOICE_MODELS_TTL_S` on the same engine reuse the last result.
+        """
+        vm = self.voice_manager
+        key = (id(vm), id(getattr(vm, "tts_adapter", None)))
+        now = time.monotonic()
+        cached = self._voice_models_cache
+        if cached is not None and cached[0] == key and (now - cached[1]) < _VOICE_MODELS_TTL_S:
+            return cached[2]
+        models = vm.list_available_models()
+        self._voice_models_cache = (key, now, models)
+        return models
+
     def do_setvoice(self, args):
         """Legacy Piper voice-model command.
 
@@ -1247,32 +1605,30 @@ class VoiceREPL(cmd.Cmd):
             print(f"\n{Colors.CYAN}Available Voice Models:{Colors.END}")
 
             try:
-                models = self.voice_manager.list_available_models()
+                models = self._cached_voice_models()
 
+                # Rendered in full, then written with a single print.
+                lines: list[str] = []
                 for language, voices in models.items():
-                    # Get language name
-                    lang_names = {
-                        'en': 'English', 'fr': 'French', 'es': 'Spanish',
-                        'de': 'German', 'ru': 'Russian', 'zh': 'Chinese'
-                    }
-                    lang_name = lang_names.get(language, language.upper())
+                    lang_name = _PIPER_LANG_NAMES.get(language, language.upper())
 
-                    print(f"\n🌍 {lang_name} ({language}):")
+                    lines.append(f"\n🌍 {lang_name} ({language}):")
 
                     for voice_id, voice_info in voices.items():
                         cached_icon = "✅" if voice_info.get('cached', False) else "📥"
                         quality_icon = "🔧"
                         size_text = f"{voice_info.get('size_mb', 0)}MB"
 
-                        print(f"  {cached_icon} {quality_icon} {language}.{voice_id}")
-                        print(f"      {voice_info['name']} ({size_text})")
-                        print(f"      {voice_info['description']}")
+                        lines.append(f"  {cached_icon} {quality_icon} {language}.{voice_id}")
+                        lines.append(f"      {voice_info['name']} ({size_text})")
+                        lines.append(f"      {voice_info['description']}")
                         # Piper has no system deps.
 
-                print(f"\n{Colors.YELLOW}Usage:{Colors.END}")
-                print("  /setvoice <language>.<voice_id>")
-                print("  Example: /setvoice fr.siwis")
-                print("\n📥 = Download needed  ✅ = Ready")
+                lines.append(f"\n{Colors.YELLOW}Usage:{Colors.END}")
+                lines.append("  /setvoice <language>.<voice_id>")
+                lines.append("  Example: /setvoice fr.siwis")
+                lines.append("\n📥 = Download needed  ✅ = Ready")
+                print("\n".join(lines))
 
             except Exception as e:
                 print(f"❌ Error listing models: {e}")
@@ -1304,23 +1660,18 @@ class VoiceREPL(cmd.Cmd):
         # Download and set the specific voice using programmatic API
         try:
             print(f"🔄 Setting voice {voice_spec}...")
-            success = self.voice_manager.set_voice(language, voice_id)
+            with self._voice_switch():
+                success = self.voice_manager.set_voice(language, voice_id)
 
             if success:
+                # `cached` flags change once the chosen voice is downloaded.
+                self._voice_models_cache = None
                 self.current_language = language
                 print(f"✅ Voice set to {voice_spec}")
 
-                test_messages = {
-                    'en': 'Voice changed to English.',
-                    'fr': 'Voix changée en français.',
-                    'es': 'Voz cambiada al español.',
-                    'de': 'Stimme auf Deutsch geändert.',
-                    'ru': 'Голос изменён на русский.',
-                    'zh': '语音已切换到中文。'
-                }
-                test_msg = test_messages.get(language, f'Voice changed to {language}.')
-                if getattr(self, "use_tts", True):
-                    self.voice_manager.speak(test_msg, voice=self.current_tts_voice)
+                test_msg = _VOICE_SWITCH_MSGS.get(language, f'Voice changed to {language}.')
+                if self.use_tts:
+                    self._speak_switch_message_async(test_msg)
 
                 if was_active:
                     self.do_voice(self.voice_mode)
@@ -1422,16 +1773,38 @@ class VoiceREPL(cmd.Cmd):
         print("  /voices models                List raw Piper model/catalog entries")
         print("  /voices setvoice fr.siwis     Compatibility Piper selector")
 
+    def _active_tts_engine_id(self) -> str:
+        """Lowercase id of the active base TTS engine ("" when unknown)."""
+        engine = ""
+        try:
+            engine = str(getattr(self.voice_manager, "_tts_engine_name", "") or "").strip().lower()
+        except Exception:
+            engine = ""
+        if not engine:
+            try:
+                a = getattr(self.voice_manager, "tts_adapter", None)
+                engine = str(getattr(a, "engine_id", "") or "").strip().lower()
+            except Exception:
+                engine = ""
+        return engine
+
     def do_lang_info(self, args):
         """Show current language information."""
-        info = self.voice_manager.get_language_info()
+        if not self.voice_manager:
+            print("🔇 TTS is disabled. Use '/tts on' to enable voice features.")
+            return
+        code = self.voice_manager.get_language()
+        engine = self._active_tts_engine_id()
+        try:
+            voices = list(self._cached_voice_models().get(code, {}).keys())
+        except Exception:
+            voices = []
         print(f"\n{Colors.CYAN}Current Language Information:{Colors.END}")
-        print(f"  Language: {info['name']} ({info['code']})")
-        print(f"  Model: {info['model']}")
-        print(f"  Available models: {list(info['available_models'].keys())}")
+        print(f"  Language: {self.voice_manager.get_language_name(code)} ({code})")
+        print(f"  Engine: {engine or 'unknown'}")
+        print(f"  Available models: {voices}")
 
-        # Check if XTTS supports multiple languages
-        if 'xtts' in (info['model'] or '').lower():
+        if engine in _MULTILINGUAL_TTS_ENGINES:
             print(f"  ✅ Supports multilingual synthesis")
         else:
             print(f"  ℹ️ Monolingual model")
@@ -1460,11 +1833,15 @@ class VoiceREPL(cmd.Cmd):
         if arg == "on":
             arg = "wait"
         
-        if arg in ["off", "full", "wait", "stop", "ptt"]:
+        if arg in _VOICE_MODES:
             if not self.voice_manager:
                 print("🔇 Voice features are disabled. Use '/tts on' to enable.")
                 return
 
+            if arg == "ptt":
+                # Overlap the PortAudio import with stopping the current mic session.
+                self._prewarm_ptt_imports_async()
+
             # Exit PTT session if running.
             if self._ptt_session_active:
                 self._ptt_session_active = False
@@ -1510,15 +1887,7 @@ class VoiceREPL(cmd.Cmd):
                 print("   Tip: check microphone permissions/device availability.")
                 return
 
-            if arg == "wait":
-                print("Voice mode: WAIT - Listens continuously except while speaking.")
-                print("Use /voice off to disable.")
-            elif arg == "stop":
-                print("Voice mode: STOP - Always listens; stop phrase stops TTS.")
-                print("Use /voice off to disable.")
-            elif arg == "full":
-                print("Voice mode: FULL - Interrupts TTS on any speech (best with AEC/headset).")
-                print("Use /voice off to disable.")
+            print(_LISTEN_MODE_BANNERS[arg])
         else:
             print("Usage: /voice off | full | wait | stop | ptt")
             print("  off  - Disable voice input")
@@ -1565,9 +1934,6 @@ class VoiceREPL(cmd.Cmd):
         self._ptt_busy = False
 
         # Lazy imports: keep REPL startup snappy.
-        import io
-        import wave
-
         try:
             import sounddevice as sd
         except Exception as e:
@@ -1576,26 +1942,37 @@ class VoiceREPL(cmd.Cmd):
             return
 
         sr = 16000
-        frames: list[bytes] = []
+        capture = _PcmCapture(sr)
         stream = {"obj": None}
-        cols = 80
-        try:
-            cols = int(shutil.get_terminal_size((80, 20)).columns)
-        except Exception:
-            cols = 80
+        # Terminal width and the status-clearing string, rebuilt only on resize.
+        # The key loop polls the size (one ioctl per read) instead of installing
+        # a SIGWINCH handler, which would replace readline's own C handler.
+        term = {"cols": 0, "clear": ""}
+
+        def _measure_terminal() -> None:
+            try:
+                cols = int(shutil.get_terminal_size((80, 20)).columns)
+            except Exception:
+                cols = 80
+            if cols == term["cols"]:
+                return
+            term["cols"] = cols
+            term["clear"] = "\r" + (" " * max(10, cols - 1)) + "\r"
+
+        _measure_terminal()
 
         def _clear_status() -> None:
             try:
-                sys.stdout.write("\r" + (" " * max(10, cols - 1)) + "\r")
+                sys.stdout.write(term["clear"])
                 sys.stdout.flush()
             except Exception:
                 pass
 
         def _status_line(msg: str) -> None:
             # Render on a single line (no newline) so SPACE can be pressed repeatedly.
+            # Clear + message go out as one write/flush.
             try:
-                _clear_status()
-                sys.stdout.write(str(msg)[: max(0, cols - 1)])
+                sys.stdout.write(term["clear"] + str(msg)[: max(0, term["cols"] - 1)])
                 sys.stdout.flush()
             except Exception:
                 pass
@@ -1604,19 +1981,29 @@ class VoiceREPL(cmd.Cmd):
             # When in raw terminal mode, '\n' does NOT reliably return to column 0.
             # Use CRLF explicitly to prevent "diagonal drifting" rendering.
             try:
-                _clear_status()
-                sys.stdout.write("\r\n" + str(msg) + "\r\n")
+                sys.stdout.write(f"{term['clear']}\r\n{msg}\r\n")
                 sys.stdout.flush()
             except Exception:
                 pass
 
+        def _close_stream() -> None:
+            # The capture already holds what was recorded: abort instead of draining.
+            s, stream["obj"] = stream["obj"], None
+            _close_input_stream(s, drain=False)
+
+        # One mic callback for the whole session (not rebuilt on every SPACE press).
+        def _cb(indata, _frames, _time, status):
+            try:
+                capture.append(indata)
+            except Exception:
+                pass
+
         def _start_recording() -> None:
-            nonlocal frames
             if self._ptt_recording:
                 return
             if self._ptt_busy:
                 return
-            frames = []
+            capture.reset()
 
             # Interrupt any speech immediately.
             try:
@@ -1624,14 +2011,6 @@ class VoiceREPL(cmd.Cmd):
             except Exception:
                 pass
 
-            def _cb(indata, _frames, _time, status):
-                if status and self.debug_mode:
-                    pass
-                try:
-                    frames.append(indata.copy().tobytes())
-                except Exception:
-                    pass
-
             try:
                 stream["obj"] = sd.InputStream(
                     samplerate=sr,
@@ -1654,33 +2033,13 @@ class VoiceREPL(cmd.Cmd):
                 return
             self._ptt_recording = False
             _clear_status()
+            _close_stream()
 
-            try:
-                if stream["obj"] is not None:
-                    try:
-                        stream["obj"].stop()
-                    except Exception:
-                        pass
-                    try:
-                        stream["obj"].close()
-                    except Exception:
-                        pass
-            finally:
-                stream["obj"] = None
-
-            pcm = b"".join(frames)
+            pcm = capture.pcm_bytes()
             if len(pcm) < int(sr * 0.25) * 2:
                 _println("…(too short, try again)")
                 return
 
-            buf = io.BytesIO()
-            with wave.open(buf, "wb") as w:
-                w.setnchannels(1)
-                w.setsampwidth(2)
-                w.setframerate(sr)
-                w.writeframes(pcm)
-            wav_bytes = buf.getvalue()
-
             self._ptt_busy = True
             try:
                 audio_s = 0.0
@@ -1691,7 +2050,7 @@ class VoiceREPL(cmd.Cmd):
                     audio_s = 0.0
 
                 t0 = time.monotonic()
-                text = (self.voice_manager.transcribe_from_bytes(wav_bytes, language=self.current_language) or "").strip()
+                text = (self._transcribe_ptt_pcm(pcm, sr) or "").strip()
                 t1 = time.monotonic()
                 stt_s = float(t1 - t0)
                 self._pending_stt_metrics = {
@@ -1762,12 +2121,13 @@ class VoiceREPL(cmd.Cmd):
                             pass
 
                 while self._ptt_session_active:
-                    ch = sys.stdin.read(1)
-                    if ch == "\x1b":  # ESC
+                    keys = _read_raw_keys(fd)
+                    _measure_terminal()
+                    if keys is None or b"\x1b" in keys:  # EOF or ESC
                         break
-                    if self._ptt_busy:
+                    if not keys or self._ptt_busy:  # timeout
                         continue
-                    if ch == " ":
+                    if b" " in keys:
                         if not self._ptt_recording:
                             _start_recording()
                         else:
@@ -1778,12 +2138,7 @@ class VoiceREPL(cmd.Cmd):
         self._ptt_session_active = False
         self._ptt_recording = False
         self._ptt_busy = False
-        try:
-            if stream["obj"] is not None:
-                stream["obj"].stop()
-                stream["obj"].close()
-        except Exception:
-            pass
+        _close_stream()
         _clear_status()
         # Ensure we end on a clean line before restoring other modes.
         try:
@@ -1797,6 +2152,23 @@ class VoiceREPL(cmd.Cmd):
         except Exception:
             pass
     
+    def _transcribe_ptt_pcm(self, pcm: bytes, sample_rate: int) -> str:
+        """Hand captured PCM16 straight to STT; wrap it in a WAV only for older managers."""
+        vm = self.voice_manager
+        if hasattr(vm, "transcribe_from_pcm16"):
+            return vm.transcribe_from_pcm16(pcm, sample_rate, language=self.current_language)
+
+        import io
+        import wave
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(int(sample_rate))
+            w.writeframes(pcm)
+        return vm.transcribe_from_bytes(buf.getvalue(), language=self.current_language)
+
     def _voice_callback(self, text):
         """Callback for voice recognition."""
         # Capture best-effort STT metrics from the recognizer (for verbose stats).
@@ -2293,26 +2665,9 @@ class VoiceREPL(cmd.Cmd):
             self._speak_with_spinner_until_audio_starts(text)
             if self.verbose_mode:
                 out_words = self._count_words(text)
-                out_tokens: int | str | None = None
-                try:
-                    enc = self._get_tiktoken_encoding()
-                    if enc is not None:
-                        out_tokens = int(len(enc.encode(str(text or ""))))
-                    else:
-                        # Best-effort approximation (useful when `tiktoken` isn't installed).
-                        # Rule of thumb: ~4 chars/token in Latin scripts.
-                        s = str(text or "").strip()
-                        approx = int(round(len(s) / 4.0)) if s else 0
-                        approx = max(1, approx) if s else 0
-                        out_tokens = f"~{approx}" if approx else None
-                except Exception:
-                    try:
-                        s = str(text or "").strip()
-                        approx = int(round(len(s) / 4.0)) if s else 0
-                        approx = max(1, approx) if s else 0
-                        out_tokens = f"~{approx}" if approx else None
-                    except Exception:
-                        out_tokens = None
+                # Display only (not part of the token totals): estimate, don't run BPE.
+                approx = _approx_tokens(text)
+                out_tokens: str | None = f"~{approx}" if approx else None
 
                 tts_metrics = None
                 try:
@@ -2387,6 +2742,13 @@ class VoiceREPL(cmd.Cmd):
 
             # Wait until audio playback actually starts (or synthesis ends without audio).
             vm = self.voice_manager
+            ready = getattr(vm, "_cloned_audio_ready", None)
+            if isinstance(ready, threading.Event):
+                # Event-driven: the synthesis worker sets it on first queued audio
+                # or when it finishes; the spinner animates on its own thread.
+                while not ready.wait(timeout=0.5):
+                    pass
+                return
             while True:
                 try:
                     playing = bool(vm.is_speaking())
@@ -3454,6 +3816,10 @@ class VoiceREPL(cmd.Cmd):
           /tts_voice base   (alias: piper)
           /tts_voice clone <voice_id_or_name>
         """
+        with self._voice_switch():
+            self._select_tts_voice(arg)
+
+    def _select_tts_voice(self, arg):
         if not self.voice_manager:
             print("🔇 TTS is disabled. Use '/tts on' to enable voice features.")
             return
@@ -3593,7 +3959,7 @@ class VoiceREPL(cmd.Cmd):
         # (weight load + accelerator kernel compilation + prompt encoding).
         # Pay it now so the first real `/speak ...` after selecting the voice is much faster.
         try:
-            if not bool(getattr(self, "use_tts", True)):
+            if not self.use_tts:
                 return
             eng_l = str(eng or "").strip().lower()
             if eng_l:
@@ -3655,7 +4021,8 @@ class VoiceREPL(cmd.Cmd):
             return None
 
         sr = int(sample_rate)
-        frames: list[bytes] = []
+        # int16 mono PCM; `extend` takes the callback array through the buffer protocol.
+        pcm_buf = bytearray()
         stream = {"obj": None}
         recording = {"active": False}
 
@@ -3690,24 +4057,14 @@ class VoiceREPL(cmd.Cmd):
                 pass
 
         def _stop_stream() -> None:
-            try:
-                if stream["obj"] is not None:
-                    try:
-                        stream["obj"].stop()
-                    except Exception:
-                        pass
-                    try:
-                        stream["obj"].close()
-                    except Exception:
-                        pass
-            finally:
-                stream["obj"] = None
+            s, stream["obj"] = stream["obj"], None
+            _close_input_stream(s)
 
         def _start_recording() -> None:
-            nonlocal sr, frames
+            nonlocal sr
             if recording["active"]:
                 return
-            frames = []
+            pcm_buf.clear()
 
             # Interrupt any speech immediately (expected UX).
             try:
@@ -3719,7 +4076,7 @@ class VoiceREPL(cmd.Cmd):
                 if status and self.debug_mode:
                     pass
                 try:
-                    frames.append(indata.copy().tobytes())
+                    pcm_buf.extend(indata)
                 except Exception:
                     pass
 
@@ -3754,7 +4111,7 @@ class VoiceREPL(cmd.Cmd):
             _clear_status()
             _stop_stream()
 
-            pcm = b"".join(frames)
+            pcm = bytes(pcm_buf)
             audio_s = 0.0
             try:
                 if sr and sr > 0:
@@ -3813,10 +4170,12 @@ class VoiceREPL(cmd.Cmd):
         try:
             tty.setraw(fd)
             while True:
-                ch = sys.stdin.read(1)
-                if ch == "\x1b":  # ESC
+                keys = _read_raw_keys(fd)
+                if keys is None or b"\x1b" in keys:  # EOF or ESC
                     break
-                if ch == " ":
+                if not keys:  # timeout
+                    continue
+                if b" " in keys:
                     if not recording["active"]:
                         _start_recording()
                     else:
@@ -4213,6 +4572,10 @@ class VoiceREPL(cmd.Cmd):
 
         Switching resets the base TTS profile to that engine/language default.
         """
+        with self._voice_switch():
+            self._select_tts_engine(arg)
+
+    def _select_tts_engine(self, arg):
         engine = arg.strip().lower().replace("_", "-")
         if engine in ("remote", "compatible", "proxy"):
             engine = "openai-compatible"
@@ -5325,10 +5688,11 @@ class VoiceREPL(cmd.Cmd):
         self.user_words = 0
         self.assistant_words = 0
         
-        # Count tokens for all messages
+        # Count tokens for all messages (one batched encode for the whole history)
+        counted = []
         for msg in self.messages:
             if isinstance(msg, dict) and "content" in msg and "role" in msg:
-                self._count_tokens(msg["content"], msg["role"])
+                counted.append((msg["role"], msg["content"]))
                 w = self._count_words(msg["content"])
                 r = msg.get("role")
                 if r == "system":
@@ -5337,7 +5701,51 @@ class VoiceREPL(cmd.Cmd):
                     self.user_words += int(w)
                 elif r == "assistant":
                     self.assistant_words += int(w)
+        self._count_tokens_batch(counted)
     
+    def _encode_chat_body(self, payload: dict) -> bytes:
+        """Serialize a chat payload, re-encoding only messages not sent before.
+
+        History messages are never edited in place (turns are appended, edits
+        replace the dict), so their JSON is cached by identity across turns.
+        """
+        cache = self._message_json_cache
+        fresh: dict[int, tuple[dict, bytes]] = {}
+        parts = []
+        for m in payload.get("messages") or []:
+            hit = cache.get(id(m))
+            enc = hit[1] if hit is not None and hit[0] is m else _json_dumps(m)
+            fresh[id(m)] = (m, enc)
+            parts.append(enc)
+        # Keep only what this turn sent (drops trimmed/cleared history).
+        self._message_json_cache = fresh
+        head = _json_dumps({k: v for k, v in payload.items() if k != "messages"})
+        sep = b"," if len(head) > 2 else b""
+        return head[:-1] + sep + b'"messages":[' + b",".join(parts) + b"]}"
+
+    def _trim_history(self) -> int:
+        """Drop the oldest non-system messages until history fits `history_token_budget`."""
+        budget = int(getattr(self, "history_token_budget", 0) or 0)
+        msgs = self.messages
+        if budget <= 0 or not isinstance(msgs, list):
+            return 0
+        sizes = [len(str(m.get("content") or "")) // _CHARS_PER_TOKEN if isinstance(m, dict) else 0 for m in msgs]
+        est = sum(sizes)
+        if est <= budget:
+            return 0
+        start = 1 if msgs and isinstance(msgs[0], dict) and msgs[0].get("role") == "system" else 0
+        drop = 0
+        # Keep at least the latest user/assistant exchange.
+        while est > budget and len(msgs) - start - drop > 2:
+            est -= sizes[start + drop]
+            drop += 1
+        # Do not leave an orphaned assistant reply at the head of the history.
+        while len(msgs) - start - drop > 2 and isinstance(msgs[start + drop], dict) and msgs[start + drop].get("role") == "assistant":
+            drop += 1
+        if drop:
+            del msgs[start : start + drop]
+        return drop
+
     def _ensure_system_message(self):
         """Ensure there's a system message at the start of messages."""
         has_system = False
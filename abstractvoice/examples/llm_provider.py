@@ -10,10 +10,13 @@ A provider is a (name, base_url) pair — no SDK dependency required.
 
 from __future__ import annotations
 
+import atexit
 import re
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
-import requests
+if TYPE_CHECKING:  # `requests` is imported on first HTTP use (keeps REPL startup fast).
+    import requests
 
 
 _THINK_BLOCK_RE = re.compile(r"<think\b[^>]*>.*?</think\s*>\s*", flags=re.IGNORECASE | re.DOTALL)
@@ -67,6 +70,8 @@ class LLMProvider:
     def __init__(self, name: str, base_url: str) -> None:
         self.name = name
         self.base_url = base_url.rstrip("/")
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
 
     # -- endpoints -----------------------------------------------------------
 
@@ -78,12 +83,33 @@ class LLMProvider:
     def models_url(self) -> str:
         return f"{self.base_url}/v1/models"
 
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive HTTP session shared by every call to this provider.
+
+        Reusing pooled connections skips the TCP (and TLS) handshake on each
+        chat turn. Created on first use and closed at interpreter exit.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    atexit.register(session.close)
+                    self._session = session
+        return self._session
+
     # -- helpers -------------------------------------------------------------
 
     def list_models(self, timeout: float = 5.0) -> list[str]:
         """Fetch available model ids from the provider (empty list on failure)."""
         try:
-            resp = requests.get(self.models_url, timeout=timeout)
+            resp = self.session.get(self.models_url, timeout=timeout)
             resp.raise_for_status()
             data = resp.json()
             models = data.get("data", []) if isinstance(data, dict) else []
@@ -93,7 +119,7 @@ class LLMProvider:
 
     def is_reachable(self, timeout: float = 3.0) -> bool:
         try:
-            resp = requests.get(self.models_url, timeout=timeout)
+            resp = self.session.get(self.models_url, timeout=timeout)
             return resp.status_code == 200
         except Exception:
             return False
@@ -119,7 +145,7 @@ class LLMProvider:
             "temperature": float(temperature),
             "max_tokens": int(max_tokens),
         }
-        resp = requests.post(self.chat_url, json=payload, timeout=timeout)
+        resp = self.session.post(self.chat_url, json=payload, timeout=timeout)
         resp.raise_for_status()
 
         try:
@@ -18,7 +18,8 @@ from dataclasses import dataclass
 _RE_WS = re.compile(r"\s+")
 
 # Sentence terminators (keep it simple + multilingual).
-_SENTENCE_TERMINATORS = set(".!?。！？")
+_SENTENCE_TERMINATORS = set(".!?…。！？")
+_RE_SENTENCE_END = re.compile(r"(?<=[.!?…。！？])\s+")
 # Soft boundaries that are usually safe to cut on for streamed speech.
 # These are *not* always sentence ends, but they often represent a natural pause.
 _SOFT_TERMINATORS = set(",;:，；：")
@@ -46,7 +47,7 @@ def split_text_batches(text: str, *, max_chars: int = 240) -> list[str]:
         return [s]
 
     # Split on common sentence terminators.
-    parts = re.split(r"(?<=[\.\!\?\。\！\？])\s+", s)
+    parts = _RE_SENTENCE_END.split(s)
 
     # Ensure each part fits under max_chars (word-based fallback).
     pieces: list[str] = []
@@ -61,7 +62,7 @@ def split_text_batches(text: str, *, max_chars: int = 240) -> list[str]:
         # Fallback for long sentences:
         # 1) try soft boundaries first (commas/semicolons/colons)
         # 2) then word-based chunking.
-        soft_parts = re.split(_RE_SOFT_END, p) if ("," in p or "，" in p or ";" in p or "；" in p or ":" in p or "：" in p) else [p]
+        soft_parts = _RE_SOFT_END.split(p) if ("," in p or "，" in p or ";" in p or "；" in p or ":" in p or "：" in p) else [p]
         for sp in soft_parts:
             sp = str(sp or "").strip()
             if not sp:
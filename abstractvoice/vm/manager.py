@@ -147,6 +147,9 @@ class VoiceManager(VoiceManagerCore, TtsMixin, SttMixin):
 
         # Tracks whether cloned TTS synthesis is currently running (separate from playback).
         self._cloned_synthesis_active = threading.Event()
+        # Per-utterance "first cloned audio queued (or synthesis over)" signal; see `speak()`.
+        self._cloned_audio_ready = threading.Event()
+        self._cloned_audio_ready.set()
 
         # Best-effort last TTS metrics (used by verbose REPL output).
         self._last_tts_metrics = None
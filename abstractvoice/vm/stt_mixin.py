@@ -198,6 +198,26 @@ class SttMixin:
             except Exception:
                 pass
 
+    def transcribe_from_pcm16(self, pcm16_bytes: bytes, sample_rate: int, language: Optional[str] = None) -> str:
+        """Transcribe raw mono PCM16 (e.g. a push-to-talk capture) without a WAV container."""
+        stt = self._get_stt_adapter()
+        if stt is not None and hasattr(stt, "transcribe_from_array"):
+            import numpy as np
+
+            audio = np.frombuffer(pcm16_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+            return stt.transcribe_from_array(audio, sample_rate=int(sample_rate), language=language)
+
+        import io
+        import wave
+
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(int(sample_rate))
+            w.writeframes(pcm16_bytes)
+        return self.transcribe_from_bytes(buf.getvalue(), language=language)
+
     def transcribe_file(self, audio_path: str, language: Optional[str] = None) -> str:
         stt = self._get_stt_adapter()
         if stt is not None:
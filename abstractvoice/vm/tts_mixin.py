@@ -1298,6 +1298,10 @@ class TtsMixin:
                 pass
             cancel = threading.Event()
             setattr(self, "_cloned_cancel_event", cancel)
+            # Per-utterance too: set once the first audio is queued or synthesis ends,
+            # so callers (REPL spinner) can block on it instead of polling.
+            audio_ready = threading.Event()
+            setattr(self, "_cloned_audio_ready", audio_ready)
 
             cloner = self._get_voice_cloner()
             # Prefer playing cloned audio at its native rate (F5 is typically 24kHz).
@@ -1424,6 +1428,7 @@ class TtsMixin:
                                 self.tts_engine.audio_player.play_audio(mono)
                         else:
                             break
+                        audio_ready.set()
 
                     t1 = time.monotonic()
                     audio_s = (float(total_samples) / float(target_sr)) if total_samples else 0.0
@@ -1469,6 +1474,7 @@ class TtsMixin:
                             synth_active.clear()
                     except Exception:
                         pass
+                    audio_ready.set()
 
             threading.Thread(target=_worker, daemon=True).start()
             return True
@@ -0,0 +1,796 @@
+from __future__ import annotations
+
+import threading
+
+
+class FakeProvider:
+    name = "dummy"
+    base_url = "http://localhost:11434"
+    chat_url = "http://localhost:11434/v1/chat/completions"
+
+    def __init__(self, response) -> None:
+        self.response = response
+        self.payloads: list[dict] = []
+        self.session = self
+
+    def post(self, url, json=None, data=None, headers=None, stream=False, timeout=None):
+        import json as _json
+
+        self.payloads.append(json if json is not None else _json.loads(data))
+        return self.response
+
+
+class StreamResponse:
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = [line.encode("utf-8") for line in lines]
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_lines(self, decode_unicode=False):
+        for line in self.lines:
+            yield line.decode("utf-8") if decode_unicode else line
+
+    def close(self) -> None:
+        return None
+
+
+def _bare_repl(provider, *, streaming: bool = False):
+    from abstractvoice.examples.cli_repl import VoiceREPL
+
+    repl = VoiceREPL.__new__(VoiceREPL)
+    repl.provider = provider
+    repl.model = "m"
+    repl.temperature = 0.4
+    repl.max_tokens = 256
+    repl.llm_streaming = streaming
+    repl.debug_mode = False
+    repl.verbose_mode = False
+    repl.voice_manager = None
+    repl.use_tts = False
+    repl.current_tts_voice = None
+    repl._chat_lock = threading.Lock()
+    repl._pending_stt_metrics = None
+    repl.messages = [{"role": "system", "content": "sys"}]
+    repl.system_tokens = repl.user_tokens = repl.assistant_tokens = 0
+    repl.system_words = repl.user_words = repl.assistant_words = 0
+    repl.total_llm_out_tokens = 0
+    repl._tiktoken_encoding = None
+    repl._tiktoken_unavailable = True
+    repl._message_json_cache = {}
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
+    return repl
+
+
+def test_repl_streamed_turn_keeps_usage_metrics(capsys) -> None:
+    provider = FakeProvider(
+        StreamResponse(
+            [
+                'data: {"choices": [{"delta": {"content": "Hello"}}]}',
+                'data: {"choices": [{"delta": {"content": " there."}}]}',
+                'data: {"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 2}}',
+                "data: [DONE]",
+            ]
+        )
+    )
+    repl = _bare_repl(provider, streaming=True)
+
+    repl.process_query("hi")
+
+    assert provider.payloads[0]["stream"] is True
+    assert provider.payloads[0]["stream_options"] == {"include_usage": True}
+    assert repl.messages[-1] == {"role": "assistant", "content": "Hello there."}
+    assert repl._last_turn_metrics["llm"]["api"] == {"prompt_tokens": 7, "completion_tokens": 2}
+    assert repl.total_llm_out_tokens == 2
+    assert "Hello there." in capsys.readouterr().out
+
+
+def test_repl_streamed_turn_decodes_utf8_without_a_charset(capsys) -> None:
+    provider = FakeProvider(
+        StreamResponse(
+            [
+                ": keep-alive",
+                "",
+                'data: {"choices": [{"delta": {"content": "Déjà vu "}}]}',
+                "data: not json",
+                'data: {"choices": [{"delta": {"content": "\u2014 ok."}}]}',
+                "data: [DONE]",
+                'data: {"choices": [{"delta": {"content": "after done"}}]}',
+            ]
+        )
+    )
+    repl = _bare_repl(provider, streaming=True)
+
+    repl.process_query("hi")
+
+    assert repl.messages[-1]["content"] == "Déjà vu — ok."
+
+
+def test_repl_count_words_splits_on_any_whitespace_run() -> None:
+    repl = _bare_repl(FakeProvider(None))
+
+    assert repl._count_words("") == 0
+    assert repl._count_words(None) == 0
+    assert repl._count_words("  one\ttwo\n\nthree　four  ") == 4
+
+
+def test_repl_system_prompt_tokens_are_encoded_once_per_prompt() -> None:
+    calls: list[str] = []
+
+    class Encoding:
+        name = "fake"
+
+        def encode(self, text):
+            calls.append(text)
+            return text.split()
+
+    repl = _bare_repl(FakeProvider(None))
+    repl._tiktoken_unavailable = False
+    repl._tiktoken_encoding = Encoding()
+    repl._system_prompt_tok_cache = {}
+
+    repl.system_prompt = "be brief"
+    repl._count_system_tokens()
+    repl.system_prompt = "be very brief"
+    repl._count_system_tokens()
+    repl.system_prompt = "be brief"
+    repl.system_tokens = 0
+    repl._count_system_tokens()
+
+    assert repl.system_tokens == 2
+    assert calls == ["be brief", "be very brief"]
+
+
+def test_repl_summarize_audio_source_reads_each_header_once(tmp_path, monkeypatch) -> None:
+    import numpy as np
+    import soundfile as sf
+
+    for name in ("a.wav", "b.wav"):
+        sf.write(str(tmp_path / name), np.zeros((1600,), dtype=np.float32), 16000)
+    (tmp_path / "notes.txt").write_text("x")
+
+    calls: list[str] = []
+    real_info = sf.info
+
+    def counting_info(path, *args, **kwargs):
+        calls.append(path)
+        return real_info(path, *args, **kwargs)
+
+    monkeypatch.setattr(sf, "info", counting_info)
+    repl = _bare_repl(FakeProvider(None))
+    repl._audio_info_cache = {}
+
+    assert repl._summarize_audio_source(str(tmp_path)) == (2, 0.2)
+    assert repl._summarize_audio_source(str(tmp_path)) == (2, 0.2)
+    assert len(calls) == 2
+
+    sf.write(str(tmp_path / "a.wav"), np.zeros((3200,), dtype=np.float32), 16000)
+    n, total = repl._summarize_audio_source(str(tmp_path))
+    assert n == 2 and abs(total - 0.3) < 1e-9
+    assert len(calls) == 3
+
+
+def test_repl_verbose_turn_stats_prints_two_lines(capsys) -> None:
+    repl = _bare_repl(FakeProvider(None))
+    repl.verbose_mode = True
+    repl.system_words, repl.user_words, repl.assistant_words = 3, 2, 4
+    repl.total_llm_out_tokens = 5
+
+    repl._print_verbose_turn_stats(
+        {
+            "llm": {"s": 0.5, "api": {"prompt_tokens": 7, "completion_tokens": 5}},
+            "counts": {"in_words": 2, "out_words": 4, "in_tokens": None, "out_tokens": None},
+        }
+    )
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 2
+    assert "LLM 0.50s (api p7 o5)" in lines[0]
+    assert "(8.0w/s)" in lines[0]
+    assert "TTS off" in lines[1]
+    assert "tot 9w" in lines[1]
+    assert "(api out 5tok)" in lines[1]
+
+
+def test_repl_plain_text_line_reaches_llm_stripped(monkeypatch) -> None:
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_mode = "off"
+    repl.voice_mode_active = False
+    seen: list[str] = []
+    monkeypatch.setattr(repl, "process_query", lambda text, **_kwargs: seen.append(text))
+
+    repl.onecmd("   hello there  ")
+
+    assert seen == ["hello there"]
+
+
+def test_repl_buffered_turn_parses_response_bytes(monkeypatch, capsys) -> None:
+    import abstractvoice.examples.cli_repl as cli_repl
+
+    class Response:
+        content = '{"choices": [{"message": {"content": "Ça va."}}], "usage": {"completion_tokens": 3}}'.encode()
+        text = "fallback"
+
+        def raise_for_status(self) -> None:
+            return None
+
+    monkeypatch.setattr(cli_repl, "_orjson", None)
+    provider = FakeProvider(Response())
+    repl = _bare_repl(provider)
+
+    repl.process_query("hi")
+
+    assert provider.payloads[0]["stream"] is False
+    assert "stream_options" not in provider.payloads[0]
+    assert repl.messages[-1] == {"role": "assistant", "content": "Ça va."}
+    assert repl.total_llm_out_tokens == 3
+    assert "Ça va." in capsys.readouterr().out
+
+
+def test_repl_token_counting_becomes_noop_without_tiktoken(monkeypatch) -> None:
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_tiktoken(name, *args, **kwargs):
+        if name == "tiktoken":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_tiktoken)
+    repl = _bare_repl(FakeProvider(None))
+    repl._tiktoken_unavailable = False
+
+    assert repl._count_tokens("hello", "user") is None
+    assert repl._tiktoken_unavailable is True
+    assert "_count_tokens" not in vars(repl)
+    assert repl._count_tokens("again", "user") is None
+    assert repl.user_tokens == 0
+
+
+def test_repl_history_is_trimmed_to_budget_keeping_system_prompt() -> None:
+    repl = _bare_repl(FakeProvider(None))
+    repl.history_token_budget = 30
+    long = "x" * 40  # ~10 tokens each
+    for i in range(4):
+        repl.messages.append({"role": "user", "content": f"{i}{long}"})
+        repl.messages.append({"role": "assistant", "content": f"{i}{long}"})
+
+    dropped = repl._trim_history()
+
+    assert dropped == 6
+    assert repl.messages[0] == {"role": "system", "content": "sys"}
+    assert [m["role"] for m in repl.messages[1:]] == ["user", "assistant"]
+    assert repl.messages[1]["content"].startswith("3")
+
+    repl.history_token_budget = 0
+    repl.messages.extend([{"role": "user", "content": long}] * 10)
+    assert repl._trim_history() == 0
+
+
+def test_repl_buffered_turn_appends_to_history(capsys) -> None:
+    class Response:
+        content = b'{"choices": [{"message": {"content": "Sure."}}]}'
+        text = ""
+
+        def raise_for_status(self) -> None:
+            return None
+
+    repl = _bare_repl(FakeProvider(Response()))
+    repl.history_token_budget = 8192
+    history = repl.messages
+
+    repl.process_query("one")
+    repl.process_query("two")
+
+    assert repl.messages is history
+    assert [m["content"] for m in history] == ["sys", "one", "Sure.", "two", "Sure."]
+
+
+def test_repl_chat_body_reuses_encoded_history_messages(monkeypatch) -> None:
+    import json
+
+    import abstractvoice.examples.cli_repl as cli_repl
+
+    encoded: list[object] = []
+    real_dumps = cli_repl._json_dumps
+
+    def counting_dumps(obj):
+        encoded.append(obj)
+        return real_dumps(obj)
+
+    monkeypatch.setattr(cli_repl, "_json_dumps", counting_dumps)
+    repl = _bare_repl(FakeProvider(None))
+    sys_msg = repl.messages[0]
+    first = {"role": "user", "content": "héllo \"quoted\""}
+    payload = {"model": "m", "messages": [sys_msg, first], "stream": False}
+
+    body = repl._encode_chat_body(payload)
+    assert json.loads(body) == payload
+
+    second = {"role": "user", "content": "again"}
+    payload = {"model": "m", "messages": [sys_msg, first, second], "stream": False}
+    encoded.clear()
+    assert json.loads(repl._encode_chat_body(payload)) == payload
+    assert [o for o in encoded if isinstance(o, dict) and "role" in o] == [second]
+
+
+def test_repl_clone_shortcut_skips_filesystem_for_plain_chat(tmp_path, monkeypatch) -> None:
+    from pathlib import Path
+
+    import numpy as np
+    import soundfile as sf
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = object()
+    used: list[str] = []
+    monkeypatch.setattr(repl, "do_clone_use", used.append, raising=False)
+
+    def no_stat(self, *args, **kwargs):
+        raise AssertionError(f"unexpected filesystem access for {self}")
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "exists", no_stat)
+        assert repl._maybe_handle_clone_shortcut("hello there, how are you?") is False
+        assert repl._maybe_handle_clone_shortcut("samples") is False
+
+    (tmp_path / "samples").mkdir()
+    sf.write(str(tmp_path / "samples" / "ref.wav"), np.zeros((160,), dtype=np.float32), 16000)
+    monkeypatch.chdir(tmp_path)
+    assert repl._maybe_handle_clone_shortcut("samples/ref.wav | Hello.") is True
+    assert len(used) == 1 and "--text" in used[0]
+
+
+def test_repl_clone_shortcut_accepts_only_directories_with_audio(tmp_path, monkeypatch) -> None:
+    import numpy as np
+    import soundfile as sf
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = object()
+    used: list[str] = []
+    monkeypatch.setattr(repl, "do_clone_use", used.append, raising=False)
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "empty" / "notes.txt").write_text("x")
+    (tmp_path / "voice").mkdir()
+    sf.write(str(tmp_path / "voice" / "a.FLAC"), np.zeros((160,), dtype=np.float32), 16000)
+    monkeypatch.chdir(tmp_path)
+
+    assert repl._maybe_handle_clone_shortcut("empty/") is False
+    assert repl._maybe_handle_clone_shortcut("voice/") is True
+    assert used and used[0].endswith(" voice")
+
+
+def test_repl_verbose_turn_stats_formats_stt_and_tts_details(capsys) -> None:
+    repl = _bare_repl(FakeProvider(None))
+    repl.verbose_mode = True
+    repl.voice_manager = object()
+    repl.use_tts = True
+    repl.system_words = 3
+    turn = {
+        "stt": {"stt_s": 0.3, "audio_s": 1.5, "rtf": 0.2},
+        "llm": {"s": 0.5, "api": {"prompt_tokens": 7}},
+        "counts": {"in_words": 2, "out_words": 4},
+        "tts": {
+            "engine": "clone",
+            "clone_engine": "f5",
+            "streaming": True,
+            "synth_s": 1.2,
+            "audio_s": 2.0,
+            "rtf": 0.6,
+            "ttfb_s": 0.25,
+            "chunks": 3,
+        },
+    }
+
+    repl._print_verbose_turn_stats(turn)
+    turn["tts"] = {"engine": "piper", "profile_id": "M1", "streaming": False, "synth_s": 0.2, "audio_s": 1.0}
+    repl._print_verbose_turn_stats(turn)
+
+    from abstractvoice.examples.cli_repl import Colors
+
+    head, tail = len(Colors.YELLOW), len(Colors.END)  # empty when stdout is not a TTY
+    lines = [line[head : len(line) - tail] for line in capsys.readouterr().out.splitlines()]
+    assert lines == [
+        "STT 0.30s(a1.50s) rtf0.20 | LLM 0.50s (api p7 o--) | in 2w/--tok | out 4w/--tok (8.0w/s)",
+        "TTS clone[f5] stream 1.20s→2.00s rtf0.60 ttfb0.25s ch3 (2.0w/s) | tot 3w/--tok",
+        "STT 0.30s(a1.50s) rtf0.20 | LLM 0.50s (api p7 o--) | in 2w/--tok | out 4w/--tok (8.0w/s)",
+        "TTS piper[M1] buf 0.20s→1.00s (4.0w/s) | tot 3w/--tok",
+    ]
+
+
+def test_repl_audio_dir_listing_is_cached_until_dir_changes(tmp_path, monkeypatch) -> None:
+    import os
+
+    import abstractvoice.examples.cli_repl as cli_repl
+
+    (tmp_path / "b.wav").write_bytes(b"")
+    (tmp_path / "a.ogg").write_bytes(b"")
+    (tmp_path / "c.txt").write_bytes(b"")
+    scans = 0
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        nonlocal scans
+        scans += 1
+        return real_scandir(path)
+
+    monkeypatch.setattr(cli_repl.os, "scandir", counting_scandir)
+    cli_repl._scan_audio_dir.cache_clear()
+
+    first = cli_repl._list_audio_dir(tmp_path)
+    assert [os.path.basename(x) for x in first] == ["a.ogg", "b.wav"]
+    assert cli_repl._list_audio_dir(tmp_path) == first
+    assert scans == 1
+
+    (tmp_path / "d.flac").write_bytes(b"")
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert len(cli_repl._list_audio_dir(tmp_path)) == 3
+    assert scans == 2
+
+
+def test_repl_streamed_output_is_written_per_sentence(monkeypatch) -> None:
+    import io
+    import sys
+
+    class CountingStdout(io.StringIO):
+        writes = 0
+
+        def write(self, s):
+            CountingStdout.writes += 1
+            return super().write(s)
+
+    deltas = ["Hel", "lo", " there", ".", " How", " are", " you", "?"]
+    provider = FakeProvider(
+        StreamResponse([f'data: {{"choices": [{{"delta": {{"content": "{d}"}}}}]}}' for d in deltas] + ["data: [DONE]"])
+    )
+    repl = _bare_repl(provider, streaming=True)
+    out = CountingStdout()
+    monkeypatch.setattr(sys, "stdout", out)
+
+    repl.process_query("hi")
+
+    assert "Hello there. How are you?" in out.getvalue()
+    # One write per sentence plus the closing color reset.
+    assert CountingStdout.writes == 3
+
+
+def test_usage_metrics_keeps_only_token_counts() -> None:
+    from abstractvoice.examples.cli_repl import _usage_metrics
+
+    assert _usage_metrics({"usage": {"prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6}}) == {
+        "prompt_tokens": 4,
+        "completion_tokens": 2,
+    }
+    assert _usage_metrics({"usage": None}) == {}
+    assert _usage_metrics(["not", "a", "dict"]) == {}
+
+
+def test_repl_typed_turn_stops_playback_once(capsys) -> None:
+    class Response:
+        content = b'{"choices": [{"message": {"content": "Ok."}}]}'
+        text = ""
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeVoiceManager:
+        stops = 0
+
+        def stop_speaking(self):
+            FakeVoiceManager.stops += 1
+
+    repl = _bare_repl(FakeProvider(Response()))
+    repl.voice_manager = FakeVoiceManager()
+    repl.voice_mode = "off"
+    repl.voice_mode_active = False
+
+    repl.onecmd("hello")
+    assert FakeVoiceManager.stops == 1
+    assert repl.messages[-1]["content"] == "Ok."
+
+    # Voice callbacks call process_query directly and still interrupt playback.
+    repl.process_query("again")
+    assert FakeVoiceManager.stops == 2
+
+
+def test_clean_response_truncates_at_earliest_role_marker() -> None:
+    repl = _bare_repl(FakeProvider(None))
+
+    assert repl._clean_response("  Hi there.  ") == "Hi there."
+    assert repl._clean_response("Answer<|end|>user: more") == "Answer"
+    assert repl._clean_response("A\nassistant: x <|user|> y") == "A"
+    assert repl._clean_response("B <|assistant|>\nuser: z") == "B"
+
+
+def test_tiktoken_encoding_is_loaded_once(monkeypatch) -> None:
+    import sys
+    import types
+
+    calls: list[str] = []
+
+    class FakeEncoding:
+        name = "fake"
+
+        def encode(self, text):
+            return text.split()
+
+    def encoding_for_model(model):
+        calls.append(model)
+        return FakeEncoding()
+
+    monkeypatch.setitem(sys.modules, "tiktoken", types.SimpleNamespace(encoding_for_model=encoding_for_model))
+    repl = _bare_repl(FakeProvider(None))
+    repl._tiktoken_unavailable = False
+
+    assert repl._count_tokens("one two three", "user") == 3
+    assert repl._count_tokens("four", "assistant") == 1
+    assert repl._get_tiktoken_encoding() is repl._tiktoken_encoding
+    assert calls == ["gpt-3.5-turbo"]
+
+
+def test_count_tokens_batch_encodes_turn_in_one_call() -> None:
+    batches: list[list[str]] = []
+
+    class FakeEncoding:
+        name = "fake"
+
+        def encode_ordinary_batch(self, texts):
+            batches.append(list(texts))
+            return [t.split() for t in texts]
+
+    repl = _bare_repl(FakeProvider(None))
+    repl._tiktoken_unavailable = False
+    repl._tiktoken_encoding = FakeEncoding()
+
+    counts = repl._count_tokens_batch([("user", "a b"), ("assistant", "c d e")])
+
+    assert counts == [2, 3]
+    assert batches == [["a b", "c d e"]]
+    assert (repl.user_tokens, repl.assistant_tokens) == (2, 3)
+
+    repl._disable_token_counting()
+    assert repl._count_tokens_batch([("user", "x")]) == [None]
+
+
+def test_pcm_capture_appends_blocks_and_grows() -> None:
+    import numpy as np
+
+    from abstractvoice.examples.cli_repl import _PcmCapture
+
+    cap = _PcmCapture(sample_rate=4, seconds=1.0)
+    cap.append(np.array([[1], [2], [3]], dtype=np.int16))
+    cap.append(np.array([[4], [5], [6]], dtype=np.int16))
+
+    assert len(cap) == 6
+    assert cap.pcm_bytes() == np.arange(1, 7, dtype=np.int16).tobytes()
+
+    cap.reset()
+    cap.append(np.array([7, 8], dtype=np.int16))
+    assert cap.pcm_bytes() == np.array([7, 8], dtype=np.int16).tobytes()
+
+
+def test_pcm_capture_rejects_non_int16_blocks() -> None:
+    import numpy as np
+    import pytest
+
+    from abstractvoice.examples.cli_repl import _PcmCapture
+
+    cap = _PcmCapture(sample_rate=4, seconds=1.0)
+    with pytest.raises(TypeError):
+        cap.append(np.zeros((2, 1), dtype=np.float32))
+
+
+def test_language_switch_speaks_test_message_off_the_prompt_thread() -> None:
+    import threading
+
+    release = threading.Event()
+    spoken: list[tuple[str, object, str]] = []
+
+    class FakeVoiceManager:
+        def set_language(self, language):
+            return True
+
+        def get_language_name(self, code):
+            return str(code)
+
+        def speak(self, text, voice=None):
+            release.wait(timeout=5)
+            spoken.append((text, voice, threading.current_thread().name))
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = FakeVoiceManager()
+    repl.voice_mode_active = False
+    repl.current_language = "en"
+    repl.use_tts = True
+
+    repl.do_language("fr")  # returns while speak() is still blocked
+
+    assert spoken == []
+    release.set()
+    for t in threading.enumerate():
+        if t.name == "abstractvoice-switch-speak":
+            t.join(timeout=5)
+    assert spoken == [("Langue changée en français.", None, "abstractvoice-switch-speak")]
+
+
+def test_pending_switch_message_is_dropped_once_cancelled() -> None:
+    spoken: list[str] = []
+
+    class FakeVoiceManager:
+        def speak(self, text, voice=None):
+            spoken.append(text)
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = FakeVoiceManager()
+    repl.current_tts_voice = None
+
+    # Hold the lock so the worker cannot reach speak() before the cancel lands.
+    with repl._switch_speak_lock:
+        repl._speak_switch_message_async("Voice changed.")
+        repl._cancel_switch_message()
+    for t in threading.enumerate():
+        if t.name == "abstractvoice-switch-speak":
+            t.join(timeout=5)
+    assert spoken == []
+
+
+def test_approx_tokens_estimate() -> None:
+    from abstractvoice.examples.cli_repl import _approx_tokens
+
+    assert _approx_tokens("") == 0
+    assert _approx_tokens("   ") == 0
+    assert _approx_tokens("hi") == 1
+    assert _approx_tokens("x" * 40) == 10
+
+
+def test_setvoice_listing_reuses_models_until_voice_changes(capsys) -> None:
+    calls: list[int] = []
+
+    class FakeVoiceManager:
+        tts_adapter = object()
+
+        def list_available_models(self):
+            calls.append(1)
+            return {"en": {"amy": {"name": "Amy", "description": "US", "size_mb": 60, "cached": True}}}
+
+        def set_voice(self, language, voice_id):
+            return True
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = FakeVoiceManager()
+    repl.voice_mode_active = False
+    repl._voice_models_cache = None
+
+    repl.do_setvoice("")
+    repl.do_setvoice("")
+    assert len(calls) == 1
+    out = capsys.readouterr().out
+    assert "✅ 🔧 en.amy\n      Amy (60MB)\n      US\n" in out
+    assert "🌍 English (en):" in out
+
+    repl.do_setvoice("en.amy")
+    repl.do_setvoice("")
+    assert len(calls) == 2
+
+
+def test_voice_mode_banner_is_printed_after_listening_starts(capsys) -> None:
+    modes: list[str] = []
+
+    class FakeVoiceManager:
+        def stop_listening(self):
+            return None
+
+        def set_voice_mode(self, mode):
+            modes.append(mode)
+
+        def listen(self, on_transcription=None, on_stop=None):
+            return True
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = FakeVoiceManager()
+    repl._ptt_session_active = False
+    repl.voice_mode_active = False
+
+    repl.do_voice("on")  # legacy alias for "wait"
+
+    assert modes == ["wait"]
+    assert repl.voice_mode_active is True
+    assert capsys.readouterr().out == (
+        "Voice mode: WAIT - Listens continuously except while speaking.\nUse /voice off to disable.\n"
+    )
+
+
+def test_colors_are_plain_when_stdout_is_not_a_tty() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "from abstractvoice.examples import cli_repl\n"
+        "print(repr(cli_repl.Colors.CYAN + cli_repl.Colors.END + cli_repl._YELLOW_WRAP))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == repr("{}")
+
+
+def test_close_input_stream_aborts_or_drains_and_tolerates_errors() -> None:
+    from abstractvoice.examples.cli_repl import _close_input_stream
+
+    class FakeStream:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def stop(self):
+            self.calls.append("stop")
+
+        def abort(self):
+            self.calls.append("abort")
+            raise RuntimeError("already stopped")
+
+        def close(self):
+            self.calls.append("close")
+
+    drained, aborted = FakeStream(), FakeStream()
+    _close_input_stream(drained)
+    _close_input_stream(aborted, drain=False)
+    _close_input_stream(None)
+
+    assert drained.calls == ["stop", "close"]
+    assert aborted.calls == ["abort", "close"]
+
+
+def test_read_raw_keys_returns_whole_sequences_timeouts_and_eof() -> None:
+    import os
+
+    from abstractvoice.examples.cli_repl import _read_raw_keys
+
+    r, w = os.pipe()
+    try:
+        assert _read_raw_keys(r, timeout=0.0) == b""
+        os.write(w, b"\x1b[A")
+        assert _read_raw_keys(r, timeout=1.0) == b"\x1b[A"
+        os.write(w, b" ")
+        assert _read_raw_keys(r, timeout=1.0) == b" "
+        os.close(w)
+        w = -1
+        assert _read_raw_keys(r, timeout=1.0) is None
+    finally:
+        os.close(r)
+        if w != -1:
+            os.close(w)
+
+
+def test_lang_info_reports_engine_and_multilingual_support(capsys) -> None:
+    class FakeAdapter:
+        engine_id = "piper"
+
+        def list_available_models(self, language=None):
+            return {"fr": {"siwis": {}}}
+
+    class FakeVoiceManager:
+        tts_adapter = FakeAdapter()
+
+        def get_language(self):
+            return "fr"
+
+        def get_language_name(self, code):
+            return "French"
+
+        def list_available_models(self):
+            return self.tts_adapter.list_available_models()
+
+    repl = _bare_repl(FakeProvider(None))
+    repl.voice_manager = FakeVoiceManager()
+    repl._voice_models_cache = None
+
+    repl.do_lang_info("")
+    out = capsys.readouterr().out
+    assert "Language: French (fr)" in out
+    assert "Engine: piper" in out
+    assert "Available models: ['siwis']" in out
+    assert "Monolingual model" in out
+
+    FakeAdapter.engine_id = "supertonic"
+    repl.do_lang_info("")
+    assert "Supports multilingual synthesis" in capsys.readouterr().out
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 
@@ -22,6 +24,8 @@ def test_repl_speak_unavailable_supertonic_uses_supertonic_message() -> None:
         tts_adapter = FakeAdapter()
 
     repl = VoiceREPL.__new__(VoiceREPL)
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
     repl.voice_manager = FakeVoiceManager()
     repl.current_tts_voice = None
     repl.current_language = "en"
@@ -56,6 +60,8 @@ def test_repl_tts_engine_switch_resets_clone_and_reports_default_profile(capsys)
 
     vm = FakeVoiceManager()
     repl = VoiceREPL.__new__(VoiceREPL)
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
     repl.voice_manager = vm
     repl.current_language = "en"
     repl.current_tts_voice = "clone_a"
@@ -91,6 +97,8 @@ def test_repl_tts_engine_rejects_local_policy_alias(capsys) -> None:
 
     vm = FakeVoiceManager()
     repl = VoiceREPL.__new__(VoiceREPL)
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
     repl.voice_manager = vm
     repl.current_language = "en"
     repl.current_tts_voice = None
@@ -136,6 +144,8 @@ def test_repl_stt_engine_switch_accepts_transformers_model_and_preserves_whisper
     monkeypatch.setattr("abstractvoice.examples.cli_repl.VoiceManager", FakeVoiceManager)
 
     repl = VoiceREPL.__new__(VoiceREPL)
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
     repl.voice_manager = CurrentVoiceManager()
     repl.current_language = "en"
     repl._initial_tts_model = None
@@ -184,6 +194,8 @@ def test_repl_stt_engine_switch_defaults_transformers_model_when_missing(capsys,
     monkeypatch.setattr("abstractvoice.examples.cli_repl.VoiceManager", FakeVoiceManager)
 
     repl = VoiceREPL.__new__(VoiceREPL)
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
     repl.voice_manager = CurrentVoiceManager()
     repl.current_language = "en"
     repl._initial_tts_model = None
@@ -219,6 +231,8 @@ def test_repl_tts_engine_switch_when_recreating_vm_preserves_initial_whisper(mon
     monkeypatch.setattr("abstractvoice.examples.cli_repl.VoiceManager", FakeVoiceManager)
 
     repl = VoiceREPL.__new__(VoiceREPL)
+    repl._switch_speak_lock = threading.RLock()
+    repl._switch_speak_gen = 0
     repl.voice_manager = None
     repl.current_language = "en"
     repl.current_tts_voice = None
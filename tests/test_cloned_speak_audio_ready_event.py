@@ -0,0 +1,46 @@
+import threading
+
+from abstractvoice import VoiceManager
+
+
+def test_cloned_speak_sets_audio_ready_on_first_queued_chunk(monkeypatch):
+    vm = VoiceManager(remote_api_key="sk-test")
+    release = threading.Event()
+    queued = []
+
+    class FakeEngine:
+        def begin_playback(self, callback=None, **_kwargs):
+            return None
+
+        def enqueue_audio(self, a, **_kwargs):
+            queued.append(len(a))
+
+        def stop(self):
+            return True
+
+    vm.tts_engine = FakeEngine()
+
+    class FakeCloner:
+        def speak_to_audio_chunks(self, text, *, voice_id, speed=None, max_chars=240, language=None):
+            yield ([0.1] * 240, 24000)
+            release.wait(timeout=5)
+            yield ([0.1] * 240, 24000)
+
+    monkeypatch.setattr(vm, "_get_voice_cloner", lambda: FakeCloner())
+    monkeypatch.setattr(vm, "tts_delivery_mode", "streamed", raising=False)
+
+    vm.speak("hello", voice="voice_id")
+    ready = vm._cloned_audio_ready
+
+    # Signalled while synthesis is still running (second chunk is held back).
+    assert ready.wait(timeout=5)
+    assert queued == [240]
+    assert vm._cloned_synthesis_active.is_set()
+
+    release.set()
+
+    # A new utterance gets a fresh, unset event.
+    vm.speak("again", voice="voice_id")
+    assert vm._cloned_audio_ready is not ready
+    assert vm._cloned_audio_ready.wait(timeout=5)
+    release.set()
@@ -20,7 +20,7 @@ def test_reference_text_autofallback_is_persisted(tmp_path: Path, monkeypatch: p
     cloner = VoiceCloner(store=store, debug=False)
 
     # Avoid running real STT in unit tests.
-    monkeypatch.setattr(cloner, "_ensure_reference_text", lambda _vid: "Hello, Dave.")
+    monkeypatch.setattr(cloner, "_ensure_reference_text", lambda _vid, **_kwargs: "Hello, Dave.")
 
     # Call speak path; it should route through _ensure_reference_text.
     class FakeEngine:
@@ -32,3 +32,26 @@ def test_reference_text_autofallback_is_persisted(tmp_path: Path, monkeypatch: p
 
     data = cloner.speak_to_bytes("test", voice_id=voice_id, format="wav")
     assert data.startswith(b"RIFF")
+
+
+def test_reference_text_is_cached_until_voice_is_edited(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import numpy as np
+    import soundfile as sf
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((24000,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice([ref], name="v", reference_text="Hello.", engine="f5_tts")
+    cloner = VoiceCloner(store=store, debug=False)
+
+    assert cloner._ensure_reference_text(voice_id) == "Hello."
+
+    reads = []
+    original_get_voice = store.get_voice
+    monkeypatch.setattr(store, "get_voice", lambda vid: reads.append(vid) or original_get_voice(vid))
+    assert cloner._ensure_reference_text(voice_id) == "Hello."
+    assert reads == []
+
+    cloner.set_reference_text(voice_id, "Goodbye.")
+    assert cloner._ensure_reference_text(voice_id) == "Goodbye."
@@ -0,0 +1,40 @@
+import sys
+import types
+
+import pytest
+
+
+def test_best_torch_device_probes_once_and_honors_env(monkeypatch: pytest.MonkeyPatch):
+    from abstractvoice.compute import device
+
+    calls = 0
+
+    def is_available():
+        nonlocal calls
+        calls += 1
+        return True
+
+    fake_torch = types.SimpleNamespace(cuda=types.SimpleNamespace(is_available=is_available))
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.delenv("ABSTRACTVOICE_TORCH_DEVICE", raising=False)
+    device.invalidate_device_cache()
+    try:
+        assert device.best_torch_device() == "cuda"
+        assert device.best_torch_device() == "cuda"
+        assert calls == 1
+
+        monkeypatch.setenv("ABSTRACTVOICE_TORCH_DEVICE", "cpu")
+        assert device.best_torch_device() == "cpu"
+    finally:
+        device.invalidate_device_cache()
+
+
+def test_best_torch_device_can_skip_importing_torch(monkeypatch: pytest.MonkeyPatch):
+    from abstractvoice.compute import device
+
+    monkeypatch.delenv("ABSTRACTVOICE_TORCH_DEVICE", raising=False)
+    monkeypatch.delitem(sys.modules, "torch", raising=False)
+    monkeypatch.setenv("ABSTRACTVOICE_NO_TORCH_PROBE", "1")
+
+    assert device.best_torch_device() == "cpu"
+    assert "torch" not in sys.modules
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 10), reason="F5/OpenF5 is unsupported on Python < 3.10")
+
+
+def _engine(root):
+    pytest.importorskip("soundfile")
+    from abstractvoice.cloning.engine_f5 import F5TTSVoiceCloningEngine
+
+    engine = F5TTSVoiceCloningEngine()
+    engine._artifact_root = lambda: root
+    return engine
+
+
+def test_openf5_artifact_scan_prefers_vocab_and_finds_nested_files(tmp_path) -> None:
+    engine = _engine(tmp_path)
+    assert engine.are_openf5_artifacts_available() is False
+
+    (tmp_path / "cfg").mkdir()
+    (tmp_path / "cfg" / "model.yaml").write_text("model: {}")
+    (tmp_path / "model.pt").write_bytes(b"weights")
+    (tmp_path / "notes.txt").write_text("not a vocab")
+    (tmp_path / "cfg" / "vocab.txt").write_text("a\nb\n")
+
+    assert engine.are_openf5_artifacts_available() is True
+    artifacts = engine._resolve_openf5_artifacts_local()
+    assert artifacts.model_cfg == tmp_path / "cfg" / "model.yaml"
+    assert artifacts.ckpt_file == tmp_path / "model.pt"
+    assert artifacts.vocab_file == tmp_path / "cfg" / "vocab.txt"
+
+
+def test_openf5_artifact_scan_notices_removed_files(tmp_path) -> None:
+    engine = _engine(tmp_path)
+    (tmp_path / "model.yml").write_text("model: {}")
+    (tmp_path / "model.pt").write_bytes(b"weights")
+    (tmp_path / "vocab.txt").write_text("a\n")
+    assert engine.are_openf5_artifacts_available() is True
+
+    (tmp_path / "model.pt").unlink()
+
+    assert engine.are_openf5_artifacts_available() is False
+    with pytest.raises(RuntimeError, match="not present locally"):
+        engine._resolve_openf5_artifacts_local()
+
+
+def test_cuda_backend_tuning_is_opt_in(tmp_path, monkeypatch) -> None:
+    import types
+
+    calls: list[str] = []
+    fake_torch = types.SimpleNamespace(
+        set_float32_matmul_precision=lambda p: calls.append(p),
+        backends=types.SimpleNamespace(
+            cuda=types.SimpleNamespace(matmul=types.SimpleNamespace(allow_tf32=False)),
+            cudnn=types.SimpleNamespace(allow_tf32=False, benchmark=False),
+        ),
+    )
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.delenv("ABSTRACTVOICE_F5_FAST_CUDA_MATH", raising=False)
+
+    _engine(tmp_path)._configure_torch_backends("cuda:0")
+    assert calls == []
+    assert fake_torch.backends.cudnn.benchmark is False
+
+    monkeypatch.setenv("ABSTRACTVOICE_F5_FAST_CUDA_MATH", "1")
+    engine = _engine(tmp_path)
+    engine._configure_torch_backends("cpu")
+    assert calls == []
+    engine._configure_torch_backends("cuda:0")
+    assert calls == ["high"]
+    assert fake_torch.backends.cudnn.benchmark is True
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sf = pytest.importorskip("soundfile")
+
+from abstractvoice.cloning.engine_f5 import (
+    F5TTSVoiceCloningEngine,
+    _encode_wav_pcm16,
+    _encode_wav_pcm16_stream,
+    _load_as_mono_float,
+)
+
+
+def test_load_as_mono_float_passes_mono_through(tmp_path) -> None:
+    path = tmp_path / "mono.wav"
+    x = np.linspace(-0.5, 0.5, 800, dtype=np.float32)
+    sf.write(str(path), x, 16000, subtype="FLOAT")
+
+    mono, sr = _load_as_mono_float(path)
+
+    assert sr == 16000
+    assert mono.dtype == np.float32
+    assert mono.shape == (800,)
+    assert np.allclose(mono, x)
+
+
+def test_load_as_mono_float_downmixes_stereo(tmp_path) -> None:
+    path = tmp_path / "stereo.wav"
+    left = np.full((500,), 0.25, dtype=np.float32)
+    right = np.full((500,), -0.75, dtype=np.float32)
+    sf.write(str(path), np.stack([left, right], axis=1), 24000, subtype="FLOAT")
+
+    mono, sr = _load_as_mono_float(path)
+
+    assert sr == 24000
+    assert mono.dtype == np.float32
+    assert mono.shape == (500,)
+    assert np.allclose(mono, -0.25)
+
+
+def test_encode_wav_pcm16_roundtrips_float64_input() -> None:
+    x = np.linspace(-0.5, 0.5, 1200, dtype=np.float64)
+
+    wav = _encode_wav_pcm16(x, 24000)
+
+    info = sf.info(io.BytesIO(wav))
+    assert info.samplerate == 24000
+    assert info.channels == 1
+    assert info.frames == 1200
+    assert info.subtype == "PCM_16"
+    y, _sr = sf.read(io.BytesIO(wav), dtype="float32")
+    assert np.allclose(y, x, atol=1e-3)
+
+
+def test_encode_wav_pcm16_stream_concatenates_chunks() -> None:
+    chunks = [(np.full((300,), 0.25, dtype=np.float32), 24000), (np.full((200,), -0.25), 24000)]
+
+    wav = _encode_wav_pcm16_stream(iter(chunks))
+
+    y, sr = sf.read(io.BytesIO(wav), dtype="float32")
+    assert sr == 24000
+    assert y.shape == (500,)
+    assert np.allclose(y[:300], 0.25, atol=1e-3)
+    assert np.allclose(y[300:], -0.25, atol=1e-3)
+
+
+def test_encode_wav_pcm16_stream_rejects_empty_stream() -> None:
+    with pytest.raises(RuntimeError):
+        _encode_wav_pcm16_stream(iter(()))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="F5/OpenF5 is unsupported on Python < 3.10")
+def test_prepare_reference_wav_keeps_multi_reference_order(tmp_path) -> None:
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.flac"
+    sf.write(str(first), np.full((2400,), 0.5, dtype=np.float32), 24000)
+    sf.write(str(second), np.full((4800,), -0.5, dtype=np.float32), 48000)
+
+    engine = F5TTSVoiceCloningEngine()
+    try:
+        ref_wav = engine._prepare_reference_wav([first, second])
+        audio, sr = sf.read(str(ref_wav), dtype="float32")
+        os.unlink(ref_wav)
+    finally:
+        engine.unload()
+
+    assert sr == 24000
+    assert audio.shape == (4800,)
+    assert np.allclose(audio[:2400], 0.5, atol=1e-3)
+    assert np.allclose(audio[2400:], -0.5, atol=1e-3)
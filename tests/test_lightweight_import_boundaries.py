@@ -121,3 +121,19 @@ def test_default_voicemanager_constructs_without_local_voice_deps() -> None:
 
     assert result.returncode == 0, result.stderr + result.stdout
     assert result.stdout.strip() == "ok"
+
+
+def test_import_cli_repl_defers_http_client() -> None:
+    result = _run_blocked_import_smoke(
+        """
+        import sys
+
+        from abstractvoice.examples.cli_repl import VoiceREPL
+
+        assert "requests" not in sys.modules
+        print("ok")
+        """
+    )
+
+    assert result.returncode == 0, result.stderr + result.stdout
+    assert result.stdout.strip() == "ok"
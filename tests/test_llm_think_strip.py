@@ -46,9 +46,8 @@ def test_llm_provider_chat_extracts_and_strips_think_blocks(monkeypatch) -> None
         captured.update({"url": url, "json": json, "timeout": timeout})
         return Response()
 
-    monkeypatch.setattr("abstractvoice.examples.llm_provider.requests.post", fake_post)
-
     provider = LLMProvider("dummy", "http://localhost:11434")
+    monkeypatch.setattr(provider.session, "post", fake_post)
     result = provider.chat(
         model="local-model",
         messages=[{"role": "user", "content": "Hi"}],
@@ -62,3 +61,11 @@ def test_llm_provider_chat_extracts_and_strips_think_blocks(monkeypatch) -> None
     assert captured["json"]["stream"] is False
     assert captured["json"]["messages"] == [{"role": "user", "content": "Hi"}]
     assert provider_strip_think_blocks("<think>x</think>ok") == "ok"
+
+
+def test_llm_provider_reuses_one_pooled_session() -> None:
+    provider = LLMProvider("dummy", "http://localhost:11434")
+    session = provider.session
+
+    assert provider.session is session
+    assert session.get_adapter("http://localhost:11434")._pool_maxsize == 16
@@ -23,8 +23,10 @@ def test_reference_text_autofallback_offline_when_model_is_cached(tmp_path: Path
         def is_available(self):
             return True
 
-        def transcribe(self, *_args, **_kwargs):
-            return "hello dave"
+        def transcribe_candidates(self, audio_array, sample_rate, *, temperatures=(0.0,), **_kwargs):
+            assert sample_rate == 16000
+            assert audio_array.dtype == np.float32
+            return ["hello dave" for _ in temperatures]
 
     # Patch the adapter import used by VoiceCloner to simulate cached offline availability.
     monkeypatch.setattr("abstractvoice.adapters.stt_faster_whisper.FasterWhisperAdapter", FakeSTT)
@@ -37,3 +39,175 @@ def test_reference_text_autofallback_offline_when_model_is_cached(tmp_path: Path
     info = store.get_voice(voice_id)
     assert (info.reference_text or "").strip()
     assert (info.meta or {}).get("reference_text_source") == "asr"
+
+
+def test_reference_text_consensus_skips_third_pass_when_first_two_agree(tmp_path: Path, monkeypatch):
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((16000,), dtype=np.float32), 16000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    agree_id = store.create_voice([ref], name="a", reference_text=None, engine="f5_tts")
+    split_id = store.create_voice([ref], name="b", reference_text=None, engine="f5_tts")
+
+    passes: list[float] = []
+    texts = {0.0: "hello dave", 0.2: "hello dave", 0.4: "hello dave"}
+
+    class FakeSTT:
+        def __init__(self, *args, **kwargs):
+            return
+
+        def is_available(self):
+            return True
+
+        def transcribe_candidates(self, audio_array, sample_rate, *, temperatures=(0.0,), **_kwargs):
+            passes.extend(temperatures)
+            return [texts[t] for t in temperatures]
+
+    monkeypatch.setattr("abstractvoice.adapters.stt_faster_whisper.FasterWhisperAdapter", FakeSTT)
+    cloner = VoiceCloner(store=store, allow_downloads=False)
+
+    assert cloner._ensure_reference_text(agree_id) == "hello dave."
+    assert passes == [0.0, 0.2]
+
+    passes.clear()
+    texts[0.2] = "hello day"
+    assert cloner._ensure_reference_text(split_id) == "hello dave."
+    assert passes == [0.0, 0.2, 0.4]
+
+
+def test_reference_text_clip_keeps_multi_file_order(tmp_path: Path, monkeypatch):
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.wav"
+    sf.write(str(first), np.full((16000,), 0.5, dtype=np.float32), 16000, subtype="FLOAT")
+    sf.write(str(second), np.full((8000,), -0.5, dtype=np.float32), 16000, subtype="FLOAT")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice([first, second], name="v", reference_text=None, engine="f5_tts")
+
+    clips: list[np.ndarray] = []
+
+    class FakeSTT:
+        def __init__(self, *args, **kwargs):
+            return
+
+        def is_available(self):
+            return True
+
+        def transcribe_candidates(self, audio_array, sample_rate, *, temperatures=(0.0,), **_kwargs):
+            clips.append(np.array(audio_array))
+            return ["hello dave" for _ in temperatures]
+
+    monkeypatch.setattr("abstractvoice.adapters.stt_faster_whisper.FasterWhisperAdapter", FakeSTT)
+
+    cloner = VoiceCloner(store=store, allow_downloads=False)
+    cloner._ensure_reference_text(voice_id)
+
+    assert clips[0].shape == (24000,)
+    assert np.allclose(clips[0][:16000], 0.5)
+    assert np.allclose(clips[0][16000:], -0.5)
+
+
+def test_reference_text_stt_adapter_is_reused_until_unloaded(tmp_path: Path, monkeypatch):
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((16000,), dtype=np.float32), 16000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    first = store.create_voice([ref], name="a", reference_text=None, engine="f5_tts")
+    second = store.create_voice([ref], name="b", reference_text=None, engine="f5_tts")
+
+    events: list[str] = []
+
+    class FakeSTT:
+        def __init__(self, *args, **kwargs):
+            events.append("load")
+
+        def is_available(self):
+            return True
+
+        def transcribe_candidates(self, audio_array, sample_rate, *, temperatures=(0.0,), **_kwargs):
+            return ["hello dave" for _ in temperatures]
+
+        def unload(self):
+            events.append("unload")
+
+    monkeypatch.setattr("abstractvoice.adapters.stt_faster_whisper.FasterWhisperAdapter", FakeSTT)
+
+    cloner = VoiceCloner(store=store, allow_downloads=False)
+    cloner._ensure_reference_text(first)
+    cloner._ensure_reference_text(second)
+    assert events == ["load"]
+
+    assert cloner.unload_stt() is True
+    assert cloner.unload_stt() is False
+    assert events == ["load", "unload"]
+
+
+def test_reference_text_retry_reuses_recorded_asr_candidates(tmp_path: Path, monkeypatch):
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((16000,), dtype=np.float32), 16000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice([ref], name="v", reference_text=None, engine="f5_tts")
+
+    passes: list[float] = []
+
+    class FakeSTT:
+        def __init__(self, *args, **kwargs):
+            return
+
+        def is_available(self):
+            return True
+
+        def transcribe_candidates(self, audio_array, sample_rate, *, temperatures=(0.0,), **_kwargs):
+            passes.extend(temperatures)
+            return ["hello dave" for _ in temperatures]
+
+    monkeypatch.setattr("abstractvoice.adapters.stt_faster_whisper.FasterWhisperAdapter", FakeSTT)
+
+    cloner = VoiceCloner(store=store, allow_downloads=False)
+    assert cloner._ensure_reference_text(voice_id) == "hello dave."
+    assert store.get_voice(voice_id).meta["asr_candidates"]["candidates"] == ["hello dave.", "hello dave."]
+
+    cloner.set_reference_text(voice_id, "")
+    assert cloner._ensure_reference_text(voice_id) == "hello dave."
+    assert passes == [0.0, 0.2]
+
+
+def test_reference_text_failed_or_other_model_asr_is_not_reused(tmp_path: Path, monkeypatch):
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((16000,), dtype=np.float32), 16000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice([ref], name="v", reference_text=None, engine="f5_tts")
+
+    outputs = {"text": ""}
+    passes: list[float] = []
+
+    class FakeSTT:
+        def __init__(self, *args, **kwargs):
+            return
+
+        def is_available(self):
+            return True
+
+        def transcribe_candidates(self, audio_array, sample_rate, *, temperatures=(0.0,), **_kwargs):
+            passes.extend(temperatures)
+            return [outputs["text"] for _ in temperatures]
+
+    monkeypatch.setattr("abstractvoice.adapters.stt_faster_whisper.FasterWhisperAdapter", FakeSTT)
+
+    cloner = VoiceCloner(store=store, allow_downloads=False)
+    with pytest.raises(RuntimeError, match="Failed to auto-generate"):
+        cloner._ensure_reference_text(voice_id)
+    assert "asr_candidates" not in store.get_voice(voice_id).meta
+
+    outputs["text"] = "hello dave"
+    assert cloner._ensure_reference_text(voice_id) == "hello dave."
+    assert store.get_voice(voice_id).meta["asr_candidates"]["stt_model"] == "small"
+    assert passes == [0.0, 0.2, 0.0, 0.2]
+
+    other = VoiceCloner(store=store, allow_downloads=False, reference_text_whisper_model="medium")
+    other.set_reference_text(voice_id, "")
+    outputs["text"] = "hello there"
+    assert other._ensure_reference_text(voice_id) == "hello there."
+    assert passes == [0.0, 0.2, 0.0, 0.2, 0.0, 0.2]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from abstractvoice.cloning import manager
+from abstractvoice.cloning.manager import _edit_distance, _edit_distance_py
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "expected"),
+    [
+        ("", "", 0),
+        ("", "abc", 3),
+        ("kitten", "sitting", 3),
+        ("Hello, Dave.", "Hello Dave.", 1),
+        ("same", "same", 0),
+    ],
+)
+def test_edit_distance_matches_levenshtein(a: str, b: str, expected: int) -> None:
+    assert _edit_distance_py(a, b) == expected
+    assert _edit_distance(a, b) == expected
+
+
+def test_edit_distance_falls_back_without_rapidfuzz(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(manager, "_Levenshtein", None)
+    assert _edit_distance("flaw", "lawn") == 2
+
+
+def test_resample_for_asr_falls_back_without_soxr(monkeypatch: pytest.MonkeyPatch) -> None:
+    import numpy as np
+
+    monkeypatch.setattr(manager, "_soxr", None)
+    x = np.zeros((48000,), dtype=np.float32)
+    assert manager._resample_for_asr(x, 16000, 16000) is x
+    assert manager._resample_for_asr(x, 48000, 16000).shape == (16000,)
+
+
+def test_edit_distance_threshold_only_bounds_large_distances(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _edit_distance_py("kitten", "sitting", threshold=3) == 3
+    assert _edit_distance_py("kitten", "sitting", threshold=1) > 1
+    assert _edit_distance_py("a", "abcdef", threshold=2) > 2
+    monkeypatch.setattr(manager, "_Levenshtein", None)
+    assert _edit_distance("kitten", "sitting", threshold=5) == 3
@@ -60,3 +60,32 @@ def test_set_whisper_clears_cached_faster_whisper_adapter() -> None:
     assert out == "large-v3"
     assert vm.whisper_model == "large-v3"
     assert vm.stt_adapter is None
+
+
+def test_transcribe_from_pcm16_passes_float_array_to_adapter() -> None:
+    import numpy as np
+
+    captured = {}
+
+    class _ArrayAdapter:
+        def is_available(self):
+            return True
+
+        def transcribe_from_array(self, audio_array, sample_rate, language=None):
+            captured["audio"] = audio_array
+            captured["sample_rate"] = sample_rate
+            captured["language"] = language
+            return "hello"
+
+        def transcribe_from_bytes(self, audio_bytes, language=None):  # pragma: no cover
+            raise AssertionError("PCM16 input must not be wrapped in a WAV container")
+
+    vm = _DummyVoiceManager()
+    vm.stt_adapter = _ArrayAdapter()
+    pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+
+    assert vm.transcribe_from_pcm16(pcm, 16000, language="en") == "hello"
+    assert captured["sample_rate"] == 16000
+    assert captured["language"] == "en"
+    assert captured["audio"].dtype == np.float32
+    assert captured["audio"].tolist() == [0.0, 0.5, -1.0]
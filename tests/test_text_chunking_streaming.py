@@ -45,3 +45,11 @@ def test_split_complete_text_for_streaming_keeps_fast_first_segment_but_batches_
     assert batches[0] == "CONFIRMED:"
     assert len(batches) < 20
     assert "this first phrase" in " ".join(batches)
+
+
+def test_split_text_batches_treats_ellipsis_as_sentence_end():
+    batches = split_text_batches("Well… let me think about it. Okay!", max_chars=20)
+    assert batches[0] == "Well…"
+
+    ch = TextStreamChunker(config=TextStreamChunkingConfig(max_chars=240, min_chars=1))
+    assert ch.push("Hmm… ") == ["Hmm…"]
@@ -244,3 +244,144 @@ def test_voice_cloner_preload_with_voice_warms_voice_path(tmp_path: Path):
     assert warmed["voice_warmed"] is True
     assert warmed["warmed_via"] == "engine_preload+voice_synthesis"
     assert calls == ["preload", "speak:Hello."]
+
+
+def test_voice_cloner_caches_repeated_short_phrases(tmp_path: Path):
+    import numpy as np
+    import soundfile as sf
+
+    from abstractvoice.cloning.manager import VoiceCloner
+    from abstractvoice.cloning.store import VoiceCloneStore
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((24000,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    cloner = VoiceCloner(store=store, allow_downloads=False, synth_cache_size=1)
+    voice_id = cloner.clone_voice(str(ref), name="v", reference_text="hello.", engine="omnivoice")
+
+    calls: list[str] = []
+
+    class DummyEngine:
+        def infer_to_wav_bytes(self, *, text, reference_paths, reference_text, speed=None, language=None):
+            calls.append(f"{text}:{reference_text}")
+            return b"RIFF" + text.encode("utf-8")
+
+    cloner._engines["omnivoice"] = DummyEngine()
+
+    assert cloner.speak_to_bytes("Done.", voice_id=voice_id) == b"RIFFDone."
+    assert cloner.speak_to_bytes("Done.", voice_id=voice_id) == b"RIFFDone."
+    assert calls == ["Done.:hello."]
+
+    # Size 1: a new phrase evicts the old one.
+    cloner.speak_to_bytes("On it.", voice_id=voice_id)
+    cloner.speak_to_bytes("Done.", voice_id=voice_id)
+    assert calls == ["Done.:hello.", "On it.:hello.", "Done.:hello."]
+
+    # Editing the voice drops its cached audio.
+    cloner.set_reference_text(voice_id, "bye.")
+    cloner.speak_to_bytes("Done.", voice_id=voice_id)
+    assert calls[-1] == "Done.:bye."
+
+
+def test_voice_cloner_serializes_local_engine_inference(tmp_path: Path):
+    import threading
+    import time
+
+    import numpy as np
+    import soundfile as sf
+
+    from abstractvoice.cloning.manager import VoiceCloner
+    from abstractvoice.cloning.store import VoiceCloneStore
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((24000,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    cloner = VoiceCloner(store=store, allow_downloads=False, synth_cache_size=0)
+    voice_id = cloner.clone_voice(str(ref), name="v", reference_text="hello.", engine="omnivoice")
+
+    active = 0
+    peak = 0
+    guard = threading.Lock()
+
+    class DummyEngine:
+        def infer_to_wav_bytes(self, *, text, reference_paths, reference_text, speed=None, language=None):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with guard:
+                active -= 1
+            return b"RIFF"
+
+    cloner._engines["omnivoice"] = DummyEngine()
+
+    threads = [
+        threading.Thread(target=cloner.speak_to_bytes, args=(f"t{i}",), kwargs={"voice_id": voice_id})
+        for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == 1
+
+
+def test_voice_cloner_warmup_loads_default_engine_once(tmp_path: Path, monkeypatch):
+    from abstractvoice.cloning.manager import VoiceCloner
+    from abstractvoice.cloning.store import VoiceCloneStore
+
+    calls: list[str] = []
+
+    class DummyEngine:
+        def preload(self):
+            calls.append("preload")
+
+    def fake_create_engine(self, name: str):
+        calls.append(f"create:{name}")
+        return DummyEngine()
+
+    monkeypatch.setattr(VoiceCloner, "_create_engine", fake_create_engine)
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    cloner = VoiceCloner(store=store, allow_downloads=False, warmup=True)
+    engine = cloner._get_engine("omnivoice")
+    cloner._warmup_thread.join(timeout=5)
+
+    assert cloner._get_engine("omnivoice") is engine
+    assert calls == ["create:omnivoice", "preload"]
+
+
+def test_voice_cloner_normalizes_references_once_per_voice(tmp_path: Path, monkeypatch):
+    import numpy as np
+    import soundfile as sf
+
+    from abstractvoice.cloning.manager import VoiceCloner
+    from abstractvoice.cloning.store import VoiceCloneStore
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((24000,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    cloner = VoiceCloner(store=store, allow_downloads=False, synth_cache_size=0)
+    voice_id = cloner.clone_voice(str(ref), name="v", reference_text="hello.", engine="omnivoice")
+
+    calls: list[str] = []
+    monkeypatch.setattr(store, "normalize_reference_audio", lambda vid: calls.append(vid) or 0)
+
+    class DummyEngine:
+        def infer_to_wav_bytes(self, *, text, reference_paths, reference_text, speed=None, language=None):
+            return b"RIFF"
+
+    cloner._engines["omnivoice"] = DummyEngine()
+
+    cloner.speak_to_bytes("a", voice_id=voice_id)
+    cloner.speak_to_bytes("b", voice_id=voice_id)
+    assert calls == [voice_id]
+
+    cloner.set_reference_text(voice_id, "bye.")
+    cloner.speak_to_bytes("c", voice_id=voice_id)
+    assert calls == [voice_id, voice_id]
@@ -68,3 +68,373 @@ def test_voice_clone_store_create_from_wav_bytes(tmp_path: Path):
     assert refs[0].exists()
     assert refs[0].read_bytes()[:4] == b"RIFF"
 
+
+
+def test_voice_clone_store_reuses_parsed_index_until_it_changes(tmp_path: Path, monkeypatch):
+    from abstractvoice.cloning import store as store_mod
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    other = VoiceCloneStore(base_dir=tmp_path / "store")
+
+    parses = 0
+    real_loads = store_mod._index_loads
+
+    def counting_loads(raw):
+        nonlocal parses
+        parses += 1
+        return real_loads(raw)
+
+    monkeypatch.setattr(store_mod, "_index_loads", counting_loads)
+
+    assert store.list_voices() == []
+    assert store.list_voices() == []
+    assert parses == 0
+
+    # Another store instance (e.g. another process) rewrites the index.
+    other._write_index({"abc": {"voice_id": "abc", "name": "n", "created_at": 1.0, "reference_files": []}})
+    assert [v["voice_id"] for v in store.list_voices()] == ["abc"]
+    assert parses == 1
+
+
+def test_voice_clone_store_index_json_fallback(tmp_path: Path, monkeypatch):
+    import json
+
+    from abstractvoice.cloning import store as store_mod
+
+    monkeypatch.setattr(store_mod, "_orjson", None)
+    monkeypatch.setattr(store_mod, "_ujson", None)
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    store._write_index({"b": {"name": "é"}, "a": {"name": "x"}})
+
+    raw = (tmp_path / "store" / "index.json").read_text(encoding="utf-8")
+    assert json.loads(raw) == {"a": {"name": "x"}, "b": {"name": "é"}}
+    assert raw.index('"a"') < raw.index('"b"')
+
+
+def test_voice_clone_store_index_write_is_atomic(tmp_path: Path, monkeypatch):
+    import os
+
+    import pytest
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    store._write_index({"a": {"name": "x"}})
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("abstractvoice.cloning.store.os.replace", failing_replace)
+    with pytest.raises(OSError):
+        store._write_index({"b": {"name": "y"}})
+
+    # The previous index is intact and no temp file is left behind.
+    assert sorted(os.listdir(tmp_path / "store")) == ["index.json"]
+    assert VoiceCloneStore(base_dir=tmp_path / "store")._read_index() == {"a": {"name": "x"}}
+
+
+def test_voice_clone_store_probes_wav_headers_once(tmp_path: Path, monkeypatch):
+    import numpy as np
+    import soundfile as sf
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((2400,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    probes: list[str] = []
+    real_info = sf.info
+
+    def counting_info(path, *args, **kwargs):
+        probes.append(str(path))
+        return real_info(path, *args, **kwargs)
+
+    monkeypatch.setattr(sf, "info", counting_info)
+
+    from abstractvoice.cloning import store as store_mod
+
+    sniffs: list[str] = []
+    real_sniff = store_mod._wav_format_tag
+
+    def counting_sniff(path):
+        sniffs.append(str(path))
+        return real_sniff(path)
+
+    monkeypatch.setattr(store_mod, "_wav_format_tag", counting_sniff)
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice([ref], name="v", engine="f5_tts")
+    assert store.normalize_reference_audio(voice_id) == 0
+    assert store.normalize_reference_audio(voice_id) == 0
+    # Plain RIFF/WAVE headers are classified without libsndfile, once per file content.
+    assert sniffs == [str(ref)]
+    assert probes == []
+
+
+def test_wav_format_tag_reads_fmt_chunk(tmp_path: Path):
+    import struct
+
+    import numpy as np
+    import soundfile as sf
+
+    from abstractvoice.cloning.store import _probe_wav_fmt, _wav_format_tag
+
+    pcm = tmp_path / "pcm.wav"
+    sf.write(str(pcm), np.zeros((100,), dtype=np.float32), 16000, subtype="PCM_16")
+    assert _wav_format_tag(pcm) == 0x0001
+
+    # A JUNK chunk before `fmt ` and an MPEG Layer III tag.
+    fmt_body = struct.pack("<HHIIHH", 0x0055, 1, 16000, 2000, 1, 0)
+    riff = b"WAVE" + b"JUNK" + struct.pack("<I", 3) + b"abc\x00" + b"fmt " + struct.pack("<I", len(fmt_body)) + fmt_body
+    mp3 = tmp_path / "mp3.wav"
+    mp3.write_bytes(b"RIFF" + struct.pack("<I", len(riff)) + riff)
+    assert _wav_format_tag(mp3) == 0x0055
+    assert _probe_wav_fmt(mp3) == ("WAV", "MPEG_LAYER_III")
+
+    flac = tmp_path / "x.flac"
+    sf.write(str(flac), np.zeros((100,), dtype=np.float32), 16000)
+    assert _wav_format_tag(flac) is None
+
+
+def test_transcode_to_pcm16_wav_streams_all_frames(tmp_path: Path):
+    import numpy as np
+    import soundfile as sf
+
+    from abstractvoice.cloning.store import _transcode_to_pcm16_wav
+
+    src = tmp_path / "src.wav"
+    dst = tmp_path / "dst.wav"
+    x = np.stack([np.full((1000,), 0.5), np.full((1000,), -0.25)], axis=1).astype(np.float32)
+    sf.write(str(src), x, 22050, subtype="FLOAT")
+
+    _transcode_to_pcm16_wav(src, dst, blocksize=256)
+
+    info = sf.info(str(dst))
+    assert (info.samplerate, info.channels, info.frames, info.subtype) == (22050, 2, 1000, "PCM_16")
+    y, _sr = sf.read(str(dst), dtype="float32")
+    assert np.allclose(y, x, atol=1e-3)
+
+
+def test_voice_clone_store_bulk_update_writes_index_once(tmp_path: Path, monkeypatch):
+    import numpy as np
+    import pytest
+    import soundfile as sf
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((2400,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    writes = 0
+    real_write = store._write_index
+
+    def counting_write(data):
+        nonlocal writes
+        writes += 1
+        real_write(data)
+
+    monkeypatch.setattr(store, "_write_index", counting_write)
+
+    def batch(s):
+        a = s.create_voice([ref], name="a", engine="f5_tts")
+        b = s.create_voice([ref], name="b", engine="f5_tts")
+        s.rename_voice(a, "a2")
+        assert s.get_voice(a).name == "a2"
+        return a, b
+
+    a, b = store.bulk_update(batch)
+    assert writes == 1
+    assert {v["name"] for v in store.list_voices()} == {"a2", "b"}
+
+    def failing(s):
+        s.rename_voice(a, "never")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        store.bulk_update(failing)
+    assert writes == 1
+    assert store.get_voice(a).name == "a2"
+
+
+def test_voice_clone_store_skips_index_write_for_noop_edits(tmp_path: Path, monkeypatch):
+    import numpy as np
+    import soundfile as sf
+
+    ref = tmp_path / "ref.wav"
+    sf.write(str(ref), np.zeros((2400,), dtype=np.float32), 24000, subtype="PCM_16")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    vid = store.create_voice([ref], name="a", reference_text="hi.", engine="f5_tts")
+    store.set_meta(vid, "k", [1, 2])
+    writes = 0
+    real_write = store._write_index
+
+    def counting_write(data):
+        nonlocal writes
+        writes += 1
+        real_write(data)
+
+    monkeypatch.setattr(store, "_write_index", counting_write)
+
+    store.rename_voice(vid, "a")
+    store.rename_voice(vid, "  ")
+    store.set_reference_text(vid, "hi.")
+    store.set_meta(vid, "k", [1, 2])
+    store.set_meta(vid, "missing", None)
+    assert writes == 0
+
+    store.set_meta(vid, "k", None)
+    store.rename_voice(vid, "b")
+    assert writes == 2
+    assert store.get_voice(vid).name == "b"
+    assert "k" not in store.get_voice(vid).meta
+
+
+def test_voice_clone_store_list_voices_newest_first_with_limit(tmp_path: Path):
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    store._write_index(
+        {
+            vid: {"voice_id": vid, "name": vid, "created_at": ts, "reference_files": []}
+            for vid, ts in (("old", 1.0), ("new", 3.0), ("mid", 2.0))
+        }
+    )
+
+    assert [v["voice_id"] for v in store.list_voices()] == ["new", "mid", "old"]
+    assert [v["voice_id"] for v in store.list_voices()] == ["new", "mid", "old"]
+    assert [v["voice_id"] for v in store.list_voices(limit=2)] == ["new", "mid"]
+
+    store.rename_voice("old", "renamed")
+    voices = store.list_voices()
+    assert [v["voice_id"] for v in voices] == ["new", "mid", "old"]
+    assert voices[-1]["name"] == "renamed"
+
+
+def test_voice_clone_store_import_skips_directory_entries(tmp_path: Path):
+    import json
+    import zipfile
+
+    bundle = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(bundle, "w") as z:
+        z.writestr("voice.json", json.dumps({"name": "z", "created_at": 1.0, "reference_files": []}))
+        z.writestr("refs/", "")
+        z.writestr("refs/ref_0.wav", b"RIFFdata")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.import_voice(bundle)
+
+    paths = store.resolve_reference_paths(voice_id)
+    assert [p.name for p in paths] == ["ref_0.wav"]
+    assert paths[0].read_bytes() == b"RIFFdata"
+
+
+def test_voice_clone_store_import_rejects_incomplete_bundle(tmp_path: Path):
+    import json
+    import os
+    import zipfile
+
+    import pytest
+
+    bundle = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(bundle, "w") as z:
+        z.writestr("voice.json", json.dumps({"reference_files": []}))
+        z.writestr("refs/ref_0.wav", b"RIFFdata")
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    with pytest.raises(ValueError, match="missing name, created_at"):
+        store.import_voice(bundle)
+    assert os.listdir(tmp_path / "store") == ["index.json"]
+    assert store.list_voices() == []
+
+
+def test_voice_clone_store_export_stores_compressed_audio_uncompressed(tmp_path: Path):
+    import zipfile
+
+    import numpy as np
+    import soundfile as sf
+
+    wav = tmp_path / "a.wav"
+    flac = tmp_path / "b.flac"
+    sf.write(str(wav), np.zeros((2400,), dtype=np.float32), 24000, subtype="PCM_16")
+    sf.write(str(flac), np.zeros((2400,), dtype=np.float32), 24000)
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice([wav, flac], name="v", engine="f5_tts")
+
+    with zipfile.ZipFile(store.export_voice(voice_id, tmp_path / "bundle.zip")) as z:
+        kinds = {i.filename: i.compress_type for i in z.infolist()}
+    assert kinds["refs/ref_0.wav"] == zipfile.ZIP_DEFLATED
+    assert kinds["refs/ref_1.flac"] == zipfile.ZIP_STORED
+
+
+def test_voice_clone_store_lookups_do_not_share_nested_records(tmp_path: Path):
+    from dataclasses import asdict
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    store._write_index(
+        {"abc": {"voice_id": "abc", "name": "n", "created_at": 1.0, "reference_files": ["ref_0.wav"], "meta": {"k": 1}}}
+    )
+
+    voice = store.get_voice("abc")
+    voice.meta["k"] = 2
+    voice.reference_files.append("x.wav")
+    listed = store.list_voices()[0]
+    listed["meta"]["k"] = 3
+    listed["reference_files"].append("y.wav")
+    as_dict = store.get_voice_dict("abc")
+    as_dict["meta"]["k"] = 4
+
+    fresh = store.get_voice("abc")
+    assert fresh.meta == {"k": 1}
+    assert fresh.reference_files == ["ref_0.wav"]
+    assert store.get_voice_dict("abc") == {"voice_id": "abc", **asdict(fresh)}
+
+    store.rename_voice("abc", "renamed")
+    assert store.get_voice("abc").name == "renamed"
+    assert store.get_voice("abc").meta == {"k": 1}
+
+
+def test_silence_stderr_fd_is_shared_and_restored():
+    import os
+
+    from abstractvoice.cloning import store as store_mod
+
+    before = os.fstat(2)
+    with store_mod._SilenceStderrFD():
+        silenced = os.fstat(2)
+        with store_mod._SilenceStderrFD():
+            # Nested use keeps the same redirect.
+            assert os.fstat(2).st_ino == silenced.st_ino
+        assert store_mod._STDERR_FD_DEPTH == 1
+    after = os.fstat(2)
+
+    assert store_mod._STDERR_FD_DEPTH == 0
+    assert (after.st_dev, after.st_ino) == (before.st_dev, before.st_ino)
+
+
+def test_voice_clone_store_normalizes_multiple_references_best_effort(tmp_path: Path, monkeypatch):
+    import numpy as np
+    import soundfile as sf
+
+    refs = []
+    for i in range(3):
+        ref = tmp_path / f"ref{i}.wav"
+        sf.write(str(ref), np.zeros((2400,), dtype=np.float32), 24000, subtype="PCM_16")
+        refs.append(ref)
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    voice_id = store.create_voice(refs, name="v", engine="f5_tts")
+
+    def fake_normalize(path):
+        if path.name == "ref_1.wav":
+            raise RuntimeError("bad file")
+        return True
+
+    monkeypatch.setattr(store, "_normalize_wav_mpeg_to_pcm_inplace", fake_normalize)
+    assert store.normalize_reference_audio(voice_id) == 2
+
+
+def test_voice_clone_store_rejects_missing_or_directory_references(tmp_path: Path):
+    import pytest
+
+    store = VoiceCloneStore(base_dir=tmp_path / "store")
+    with pytest.raises(FileNotFoundError, match="nope.wav"):
+        store.create_voice([tmp_path / "nope.wav"], name="v")
+    with pytest.raises(ValueError, match="directory"):
+        store.create_voice([tmp_path], name="v")
+    assert store.list_voices() == []